@@ -4,14 +4,33 @@ import aiohttp
 import rich
 from dotenv import load_dotenv
 
+import src.domain.model as domain
 from src.adapter.external.auth.telegram import TelegramOauthAdapter
+from src.adapter.external.graphql.persisted import PersistedQueries
+from src.adapter.internal.cache.codec import JsonCodec
+from src.adapter.internal.cache.layered.lookup import LayeredLookupService
+from src.adapter.internal.cache.layered.service import LayeredCacheService
+from src.adapter.internal.cache.memorydb.lookup import MemoryLookupService
+from src.adapter.internal.cache.memorydb.persisted import MemoryPersistedQueryService
+from src.adapter.internal.cache.memorydb.service import MemoryDBService
+from src.adapter.internal.cache.redisdb.invalidation import (
+    RedisInvalidation,
+    RedisLookupInvalidation,
+)
+from src.adapter.internal.cache.redisdb.lookup import RedisLookupService
+from src.adapter.internal.cache.redisdb.persisted import RedisPersistedQueryService
+from src.adapter.internal.cache.redisdb.service import RedisService
 
 # from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
 from src.app.http.server import build_server
 from src.service.allocation import AllocationService
 from src.service.answer import AnswerService
+from src.service.cache import TAGS, CacheEviction
 from src.service.form_field import FormFieldService
+from src.service.identity import EntityKind, on_write
 from src.service.participant import ParticipantService
 from src.service.preference import PreferenceService
 from src.service.room import RoomService
@@ -20,6 +39,31 @@ from src.utils.logger.logger import Logger
 
 log = Logger("main")
 
+# telegram id -> user id lookups of logins, missing users are retried sooner
+TELEGRAM_ID_TTL = 24 * 60 * 60
+TELEGRAM_ID_NEGATIVE_TTL = 30
+TELEGRAM_ID_LOCAL_SIZE = 10000
+TELEGRAM_ID_LOCAL_TTL = 60
+TELEGRAM_ID_LOCAL_NEGATIVE_TTL = 5
+
+# queries registered by clients, the allowlist is registered by deployment apart
+# so that client registrations never become allowlisted
+PERSISTED_QUERY_NAMESPACE = "randorm:persisted-query"
+PERSISTED_QUERY_ALLOWLIST_NAMESPACE = "randorm:persisted-query:allowlist"
+PERSISTED_QUERY_TTL = 30 * 24 * 60 * 60
+PERSISTED_QUERY_LOCAL_SIZE = 1000
+PERSISTED_QUERY_LOCAL_TTL = 10 * 60
+
+CACHED_TYPES = {
+    EntityKind.USER: domain.User,
+    EntityKind.ALLOCATION: domain.Allocation,
+    EntityKind.FORM_FIELD: domain.FormField,
+    EntityKind.ANSWER: domain.Answer,
+    EntityKind.PARTICIPANT: domain.Participant,
+    EntityKind.PREFERENCE: domain.Preference,
+    EntityKind.ROOM: domain.Room,
+}
+
 
 async def notify_start():
     version = os.getenv("APP_VERSION", None)
@@ -55,6 +99,76 @@ async def notify_start():
         log.info("successfully notified about start")
 
 
+async def create_repo(dsn: str) -> MongoDBAdapter | MotorDBAdapter:
+    database_adapter = os.getenv("DATABASE_ADAPTER", "beanie")
+    log.info(f"using {database_adapter} database adapter")
+
+    match database_adapter:
+        case "beanie":
+            # beanie validates every document it loads, decoding is motor only
+            if os.getenv("DATABASE_DECODE") is not None:
+                log.warning("DATABASE_DECODE is ignored by the beanie adapter")
+            return await MongoDBAdapter.create(dsn)
+        case "motor":
+            decode_mode = DecodeMode(os.getenv("DATABASE_DECODE", "verify"))
+            log.info(f"using {decode_mode} document decoding")
+            return await MotorDBAdapter.create(dsn, decode_mode)
+        case _:
+            raise RuntimeError(f"unknown DATABASE_ADAPTER {database_adapter}")
+
+
+def create_loader_cache(redis_dsn: str) -> dict[EntityKind, LayeredCacheService]:
+    kinds = os.getenv("LOADER_CACHE", "allocation,form_field,user")
+    ttl = int(os.getenv("LOADER_CACHE_TTL", "300"))
+    local_ttl = float(os.getenv("LOADER_CACHE_LOCAL_TTL", "30"))
+    local_size = int(os.getenv("LOADER_CACHE_LOCAL_SIZE", "10000"))
+    local_bytes = int(os.getenv("LOADER_CACHE_LOCAL_BYTES", str(32 * 1024 * 1024)))
+    log.info(f"caching {kinds} loaders for {local_ttl}/{ttl} seconds")
+
+    caches = {}
+    for kind in map(EntityKind, filter(None, map(str.strip, kinds.split(",")))):
+        # one codec for the wire format and the local memory budget
+        codec = JsonCodec(CACHED_TYPES[kind])
+        caches[kind] = LayeredCacheService(
+            local=MemoryDBService(local_size, local_ttl, local_bytes, codec),
+            remote=RedisService(
+                redis_dsn,
+                ttl,
+                codec,
+                namespace=f"randorm:cache:{kind}",
+                tags=TAGS.get(kind),
+            ),
+            invalidation=RedisInvalidation(
+                redis_dsn, f"randorm:cache-invalidation:{kind}"
+            ),
+        )
+
+    return caches
+
+
+def create_persisted_queries(redis_dsn: str) -> PersistedQueries:
+    allowlist = os.getenv("GRAPHQL_ALLOWLIST", "false").lower() == "true"
+    log.info(f"persisted queries allowlist mode: {allowlist}")
+
+    if allowlist:
+        # allowlisted queries are registered by deployment and never expire
+        namespace, ttl = PERSISTED_QUERY_ALLOWLIST_NAMESPACE, None
+    else:
+        namespace, ttl = PERSISTED_QUERY_NAMESPACE, PERSISTED_QUERY_TTL
+
+    return PersistedQueries(
+        RedisPersistedQueryService(
+            redis_dsn,
+            namespace,
+            ttl=ttl,
+            local=MemoryPersistedQueryService(
+                PERSISTED_QUERY_LOCAL_SIZE, ttl=PERSISTED_QUERY_LOCAL_TTL
+            ),
+        ),
+        allowlist=allowlist,
+    )
+
+
 async def app():
     load_dotenv()
 
@@ -90,8 +204,26 @@ async def app():
     if telegram_webhook_url is None:
         raise RuntimeError("TELEGRAM_WEBHOOK_URL is not set")
 
-    repo = await MongoDBAdapter.create(mongo_dsn)
-    user_service = UserService(repo)
+    repo = await create_repo(mongo_dsn)
+    user_service = UserService(
+        repo,
+        LayeredLookupService(
+            local=MemoryLookupService(
+                TELEGRAM_ID_LOCAL_SIZE,
+                ttl=TELEGRAM_ID_LOCAL_TTL,
+                negative_ttl=TELEGRAM_ID_LOCAL_NEGATIVE_TTL,
+            ),
+            remote=RedisLookupService(
+                redis_dsn,
+                "randorm:telegram-id",
+                ttl=TELEGRAM_ID_TTL,
+                negative_ttl=TELEGRAM_ID_NEGATIVE_TTL,
+            ),
+            invalidation=RedisLookupInvalidation(
+                redis_dsn, "randorm:telegram-id-invalidation"
+            ),
+        ),
+    )
 
     allocation_service = AllocationService(
         allocation_repo=repo,
@@ -125,6 +257,10 @@ async def app():
 
     oauth_adapter = TelegramOauthAdapter(telegram_token, jwt_secret, user_service)
 
+    # every service write evicts the shared loader cache, not only mutations
+    loader_cache = create_loader_cache(redis_dsn)
+    on_write(CacheEviction(loader_cache))
+
     await notify_start()
 
     return build_server(
@@ -143,6 +279,9 @@ async def app():
         preference_service=preference_service,
         room_service=room_service,
         oauth_adapter=oauth_adapter,
+        jwt_secret=jwt_secret,
+        cache_services=loader_cache,
+        persisted_queries=create_persisted_queries(redis_dsn),
     )
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import hmac
+import time
 from collections import OrderedDict
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from hashlib import sha256
 from typing import Any
 from urllib.parse import parse_qsl, urlencode
@@ -22,6 +23,8 @@ from src.utils.logger.logger import Logger
 
 log = Logger("telegram-auth-adapter")
 
+TOKEN_TTL = timedelta(days=30)
+
 
 class TgUserProfileMixin(Profile): ...
 
@@ -62,38 +65,84 @@ class TgOauthContainer(BaseModel, OAuthContainer):
 
     @classmethod
     def construct(
-        cls, data: TgOauthDTO, secret: str, *args, **kwargs
+        cls,
+        data: TgOauthDTO,
+        secret: str,
+        *args,
+        ttl: timedelta = TOKEN_TTL,
+        **kwargs,
     ) -> TgOauthContainer:
-        token = jwt.encode(data.model_dump(mode="json"), secret, algorithm="HS256")
+        issued_at = datetime.now(UTC)
+        claims = data.model_dump(mode="json") | {
+            "iat": issued_at,
+            "exp": issued_at + ttl,
+        }
+        token = jwt.encode(claims, secret, algorithm="HS256")
         self = cls(jwt=token)
         return self
 
     def to_dto(self, secret: str, *args, **kwargs) -> TgOauthDTO:
-        return TgOauthDTO.model_validate(
-            jwt.decode(self.jwt, secret, algorithms=["HS256"])
-        )
+        return TgOauthDTO.model_validate(self.claims(secret))
+
+    def claims(self, secret: str) -> dict[str, Any]:
+        return jwt.decode(self.jwt, secret, algorithms=["HS256"])
 
     def to_string(self, *args, **kwargs) -> str:
         return self.jwt
 
 
+class VerifiedTokenCache:
+    """
+    LRU of verified tokens, keyed by their digest so raw tokens are not kept.
+    Entries live until the token expires, tokens without `exp` for `max_age`.
+    """
+
+    def __init__(self, secret: str, max_size: int, max_age: timedelta):
+        self._secret = secret
+        self._max_size = max_size
+        self._max_age = max_age.total_seconds()
+        self._tokens: OrderedDict[bytes, tuple[TgOauthDTO, float]] = OrderedDict()
+
+    def verify(self, token: str) -> TgOauthDTO:
+        key = sha256(token.encode()).digest()
+        now = time.time()
+        entry = self._tokens.get(key)
+        if entry is not None:
+            dto, expires_at = entry
+            if now < expires_at:
+                self._tokens.move_to_end(key)
+                return dto
+
+            del self._tokens[key]
+
+        claims = TgOauthContainer(jwt=token).claims(self._secret)
+        dto = TgOauthDTO.model_validate(claims)
+        self._tokens[key] = (dto, claims.get("exp", now + self._max_age))
+        if len(self._tokens) > self._max_size:
+            self._tokens.popitem(last=False)
+
+        return dto
+
+
 class TelegramOauthAdapter(OauthProtocol):
-    __secret_token: str
+    __secret_key: bytes
     _jwt_secret: str
     __service: UserService
 
     def __init__(self, secret_token: str, jwt_secret: str, service: UserService):
-        self.__secret_token = secret_token
+        self.__secret_key = sha256(secret_token.encode()).digest()
         self._jwt_secret = jwt_secret
         self.__service = service
-        self.__verify_keys = [
-            "auth_date",
-            "first_name",
-            "id",
-            "last_name",
-            "photo_url",
-            "username",
-        ]
+        self.__verify_keys = frozenset(
+            [
+                "auth_date",
+                "first_name",
+                "id",
+                "last_name",
+                "photo_url",
+                "username",
+            ]
+        )
 
     def _validate_hash(self, data: Any) -> bool:
         init_data = sorted(parse_qsl(urlencode(data)))
@@ -102,13 +151,11 @@ class TelegramOauthAdapter(OauthProtocol):
         )
         hash_ = data["hash"]
 
-        secret_key = sha256(self.__secret_token.encode())
-
         calculated_hash = hmac.new(
-            key=secret_key.digest(), msg=data_check_string.encode(), digestmod=sha256
+            key=self.__secret_key, msg=data_check_string.encode(), digestmod=sha256
         ).hexdigest()
 
-        return calculated_hash == hash_
+        return hmac.compare_digest(calculated_hash, str(hash_))
 
     async def register(self, data: Any) -> TgOauthContainer:
         try:
@@ -168,8 +215,8 @@ class TelegramOauthAdapter(OauthProtocol):
             log.debug("building callback data from custom data")
             request = TgOauthLoginCallback.model_validate(webapp_data)
 
-            log.debug("searching user by telegram id")
-            user = await self.__service.find_by_telegram_id(request.id)
+            log.debug("searching user id by telegram id")
+            user_id = await self.__service.find_id_by_telegram_id(request.id)
         except auth_exception.AuthException as e:
             raise e
         except service_exception.ReadUserException as e:
@@ -188,7 +235,7 @@ class TelegramOauthAdapter(OauthProtocol):
             raise e
 
         return TgOauthContainer.construct(
-            TgOauthDTO(id=user.id, telegram_id=user.telegram_id), self._jwt_secret
+            TgOauthDTO(id=user_id, telegram_id=request.id), self._jwt_secret
         )
 
     async def retrieve_user(self, data: TgOauthContainer) -> User:
@@ -3,7 +3,10 @@ GraphQL Protocol implementations
 """
 
 from src.adapter.external.graphql import (
+    cache,
+    document,
     operation,
+    persisted,
     scalar,
     schema,
     tool,
@@ -1,43 +1,45 @@
-# import asyncio
-# from typing import TypeVar
+from collections.abc import Awaitable, Callable
 
-# from pydantic import BaseModel
-# from strawberry.dataloader import AbstractCache
-# from typing_extensions import deprecated
+from pydantic import BaseModel
+from strawberry.dataloader import DataLoader, DefaultCache
 
-# import src.domain.model as domain
-# from src.protocol.internal.cache.generic import CacheProtocol
-
-# T = TypeVar("T", bound=BaseModel)
+import src.domain.model as domain
+from src.protocol.internal.cache.generic import CacheProtocol
 
 # NOTE: Strawberry current Dataloader implementation does not support async cache resolution
 # traking issue: https://github.com/strawberry-graphql/strawberry/issues/3290
-
-
-# class CacheMap[T](AbstractCache[domain.ObjectID, T]):
-
-#     def __init__(self, cache_service: CacheProtocol[T]):
-#         self._cache_service = cache_service
-
-#     def get(self, key: domain.ObjectID) -> asyncio.Future[T] | None:
-#         future = asyncio.get_event_loop().create_future()
-#         data = self._cache_service.get(key)
-#         if data is None:
-#             return data
-
-#         async def promise():
-#             return data
-
-#         return asyncio.ensure_future(promise())
-
-#     def set(self, key: domain.ObjectID, future_value: asyncio.Future[T]) -> None:
-#         async def put_to_cache(value: T):
-#             await self._cache_service.put(key, value)
-
-#         future_value.add_done_callback(put_to_cache)
-
-#     def delete(self, key: domain.ObjectID) -> None:
-#         return self._cache_service.delete(key)
-
-#     def clear(self) -> None:
-#         return self._cache_service.flush()
+# so the shared cache is consulted inside of the batch load function instead of the cache map
+
+
+class CustomDefaultCache[K, T](DefaultCache[K, T]):
+    def delete(self, key: K) -> None:
+        if key in self.cache_map:
+            del self.cache_map[key]
+
+
+class CachedDataLoader[V: BaseModel, T](DataLoader[domain.ObjectID, T]):
+    """
+    DataLoader reading domain models through a cache shared between requests.
+    Only the keys missing in the cache reach the batch load function. Clearing
+    drops the request entries only, services evict the shared cache on writes.
+    """
+
+    def __init__(
+        self,
+        load_fn: Callable[[list[domain.ObjectID]], Awaitable[list[V]]],
+        convert: Callable[[V], T],
+        cache_service: CacheProtocol[V] | None = None,
+    ):
+        self._fetch = load_fn
+        self._convert = convert
+        self._cache_service = cache_service
+        super().__init__(
+            load_fn=self.__load, cache_key_fn=str, cache_map=CustomDefaultCache()
+        )
+
+    async def __load(self, ids: list[domain.ObjectID]) -> list[T]:
+        if self._cache_service is None:
+            return [self._convert(item) for item in await self._fetch(ids)]
+
+        values = await self._cache_service.load_many(ids, self._fetch)
+        return [self._convert(item) for item in values]
@@ -0,0 +1,127 @@
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from graphql import DocumentNode, GraphQLError
+from strawberry.extensions import SchemaExtension
+from strawberry.types import ExecutionContext
+
+from src.utils.logger.logger import Logger
+
+log = Logger("graphql-document")
+
+
+@dataclass
+class Document:
+    document: DocumentNode
+    errors: list[GraphQLError] | None = None  # None until validated
+
+
+class DocumentCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+
+
+class DocumentCache:
+    """
+    Parsed documents with their validation errors, by sha256 of the query text.
+    Clients send a handful of operations, so a small LRU holds all of them. The
+    errors are only valid for the schema the cache is installed on. The stats are
+    logged every `stats_interval` lookups, zero disables it.
+    """
+
+    def __init__(self, max_size: int, stats_interval: int = 0):
+        self._max_size = max_size
+        self._stats_interval = stats_interval
+        self._entries: OrderedDict[bytes, Document] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def extension(self, *, execution_context: ExecutionContext) -> SchemaExtension:
+        """
+        Schema extension factory, strawberry builds an extension per operation.
+        """
+        return DocumentCacheExtension(self, execution_context=execution_context)
+
+    def get(self, key: bytes) -> Document | None:
+        document = self._entries.get(key)
+        if document is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            self._entries.move_to_end(key)
+
+        if (
+            self._stats_interval
+            and (self._hits + self._misses) % self._stats_interval == 0
+        ):
+            self.__log_stats()
+
+        return document
+
+    def put(self, key: bytes, document: Document) -> None:
+        self._entries[key] = document
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def stats(self) -> DocumentCacheStats:
+        return DocumentCacheStats(
+            self._hits, self._misses, self._evictions, len(self._entries)
+        )
+
+    def __log_stats(self) -> None:
+        stats = self.stats()
+        log.info(
+            f"document cache hits {stats.hits}, misses {stats.misses}, "
+            f"evictions {stats.evictions}, size {stats.size}"
+        )
+
+    @staticmethod
+    def key(query: str) -> bytes:
+        return hashlib.sha256(query.encode()).digest()
+
+
+class DocumentCacheExtension(SchemaExtension):
+    def __init__(self, cache: DocumentCache, *, execution_context: ExecutionContext):
+        super().__init__(execution_context=execution_context)
+        self._cache = cache
+        self._key: bytes | None = None
+        self._document: Document | None = None
+
+    def on_parse(self) -> Iterator[None]:
+        context = self.execution_context
+        if context.query and context.graphql_document is None:
+            self._key = DocumentCache.key(context.query)
+            self._document = self._cache.get(self._key)
+
+        if self._document is not None:
+            context.graphql_document = self._document.document
+
+        yield
+
+        # syntax errors leave the document empty and are not cached
+        if self._key is not None and self._document is None:
+            if context.graphql_document is not None:
+                self._document = Document(context.graphql_document)
+                self._cache.put(self._key, self._document)
+                log.debug(f"cached document {self._key.hex()}")
+
+    def on_validate(self) -> Iterator[None]:
+        context = self.execution_context
+        if self._document is not None and self._document.errors is not None:
+            # a list set in advance makes strawberry skip the validation
+            context.errors = list(self._document.errors)
+
+        yield
+
+        if self._document is not None and self._document.errors is None:
+            if context.errors is not None:
+                self._document.errors = list(context.errors)
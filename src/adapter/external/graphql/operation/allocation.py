@@ -201,7 +201,6 @@ class AllocationMutation:
                 }
             )
             data = await info.context.allocation.service.update(request)
-            info.context.allocation.loader.clear(id)
             log.info(f"updated allocation {id}")
             return graphql.domain_to_allocation(data)
 
@@ -213,6 +212,5 @@ class AllocationMutation:
             data = await info.context.allocation.service.delete(
                 proto.DeleteAllocation(_id=id)
             )
-            info.context.allocation.loader.clear(id)
             log.info(f"deleted allocation {id}")
             return graphql.domain_to_allocation(data)
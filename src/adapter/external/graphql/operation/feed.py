@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import strawberry as sb
 
+import src.domain.model as domain
 import src.protocol.internal.database.participant as proto
 from src.adapter.external.graphql import scalar
 from src.adapter.external.graphql.tool.context import Info
@@ -12,47 +13,43 @@ from src.adapter.external.graphql.type.participant import (
 )
 
 
+async def _find_current_participant(
+    info: Info[FeedMutation], allocation_id: scalar.ObjectID
+) -> domain.Participant:
+    if info.context.user_id is None:
+        raise Exception("User is not participant")
+
+    participant = await info.context.participant.service.find(
+        proto.FindParticipant(user_id=info.context.user_id, allocation_id=allocation_id)
+    )
+    if participant is None:
+        raise Exception("User is not participant")
+
+    return participant
+
+
 @sb.type
 class FeedMutation:
     @sb.mutation(permission_classes=[DefaultPermissions])
     async def mark_viewed(
         root: FeedMutation, info: Info[FeedMutation], id: scalar.ObjectID
     ) -> BaseParticipantType:
-        participants = await info.context.participant.service.read_all()
-
-        current = None
-        for participant in participants:
-            if participant.user_id == info.context.user_id:
-                current = participant
-                break
-        if current is None:
-            raise Exception("User is not participant")
+        other = await info.context.participant.loader.load(id)
+        current = await _find_current_participant(info, other.allocation_id)
 
-        current = await info.context.participant.loader.load(current.id)
         data = await info.context.participant.service.update(
             proto.UpdateParticipant(
                 _id=current.id, viewed_ids=set(current.viewed_ids) | {id}
             )
         )
-        info.context.participant.loader.clear(current.id)
         return domain_to_participant(data)
 
     @sb.mutation(permission_classes=[DefaultPermissions])
     async def unsubscribe(
         root: FeedMutation, info: Info[FeedMutation], id: scalar.ObjectID
     ) -> BaseParticipantType:
-        participants = await info.context.participant.service.read_all()
-
-        current = None
-        for participant in participants:
-            if participant.user_id == info.context.user_id:
-                current = participant
-                break
-        if current is None:
-            raise Exception("User is not participant")
-
-        current = await info.context.participant.loader.load(current.id)
         other = await info.context.participant.loader.load(id)
+        current = await _find_current_participant(info, other.allocation_id)
 
         data_current = await info.context.participant.service.update(
             proto.UpdateParticipant(
@@ -67,25 +64,14 @@ class FeedMutation:
         )
         _ = data_other
 
-        info.context.participant.loader.clear_many([current.id, other.id])
         return domain_to_participant(data_current)
 
     @sb.mutation(permission_classes=[DefaultPermissions])
     async def subscribe(
         root: FeedMutation, info: Info[FeedMutation], id: scalar.ObjectID
     ) -> BaseParticipantType:
-        participants = await info.context.participant.service.read_all()
-
-        current = None
-        for participant in participants:
-            if participant.user_id == info.context.user_id:
-                current = participant
-                break
-        if current is None:
-            raise Exception("User is not participant")
-
-        current = await info.context.participant.loader.load(current.id)
         other = await info.context.participant.loader.load(id)
+        current = await _find_current_participant(info, other.allocation_id)
 
         data_current = await info.context.participant.service.update(
             proto.UpdateParticipant(
@@ -100,5 +86,4 @@ class FeedMutation:
         )
         _ = data_other
 
-        info.context.participant.loader.clear_many([current.id, other.id])
         return domain_to_participant(data_current)
@@ -231,7 +231,6 @@ class FormFieldMutation:
             )
 
             data = await info.context.form_field.service.update(request)
-            info.context.form_field.loader.clear(id)
             log.info(f"updated text form field {id}")
             return graphql.domain_to_form_field(data)
 
@@ -267,7 +266,6 @@ class FormFieldMutation:
             )
 
             data = await info.context.form_field.service.update(request)
-            info.context.form_field.loader.clear(id)
             log.info(f"updated choice form field {id}")
             return graphql.domain_to_form_field(data)
 
@@ -279,7 +277,6 @@ class FormFieldMutation:
             data = await info.context.form_field.service.delete(
                 proto.DeleteFormField(_id=id)
             )
-            info.context.form_field.loader.clear(id)
             log.info(f"deleted form field {id}")
             return graphql.domain_to_form_field(data)
 
@@ -350,7 +347,6 @@ class AnswerMutation:
             )
 
             data = await info.context.answer.service.update(request)
-            info.context.answer.loader.clear(id)
             log.info(f"updated text answer {id}")
             return graphql.domain_to_answer(data)
 
@@ -368,7 +364,6 @@ class AnswerMutation:
             )
 
             data = await info.context.answer.service.update(request)
-            info.context.answer.loader.clear(id)
             log.info(f"updated choice answer {id}")
             return graphql.domain_to_answer(data)
 
@@ -378,6 +373,5 @@ class AnswerMutation:
     ) -> graphql.BaseAnswerType:
         with log.activity(f"deleting answer {id}"):
             data = await info.context.answer.service.delete(proto.DeleteAnswer(_id=id))
-            info.context.answer.loader.clear(id)
             log.info(f"deleted answer {id}")
             return graphql.domain_to_answer(data)
@@ -135,7 +135,6 @@ class ParticipantMutation:
                 subscribers_ids=set(subscribers_ids) if subscribers_ids else set(),
             )
             data = await info.context.participant.service.update(request)
-            info.context.participant.loader.clear(id)
             log.info(f"updated participant {id}")
             return graphql.domain_to_participant(data)
 
@@ -147,6 +146,5 @@ class ParticipantMutation:
             data = await info.context.participant.service.delete(
                 proto.DeleteParticipant(_id=id)
             )
-            info.context.participant.loader.clear(id)
             log.info(f"deleted participant {id}")
             return graphql.domain_to_participant(data)
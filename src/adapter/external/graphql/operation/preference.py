@@ -62,7 +62,6 @@ class PreferenceMutation:
                 status=status,
             )
             data = await info.context.preference.service.update(request)
-            info.context.preference.loader.clear(id)
             log.info(f"updated preference {id}")
             return graphql.PreferenceType.from_pydantic(data)
 
@@ -75,6 +74,5 @@ class PreferenceMutation:
         with log.activity(f"deleting preference {id}"):
             request = proto.DeletePreference(_id=id)
             data = await info.context.preference.service.delete(request)
-            info.context.preference.loader.clear(id)
             log.info(f"deleted preference {id}")
             return graphql.PreferenceType.from_pydantic(data)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from random import shuffle
-
 import strawberry as sb
 
-import src.domain.model as domain
+import src.protocol.internal.database.participant as proto
 from src.adapter.external.graphql import scalar
 from src.adapter.external.graphql.tool.context import Info
 from src.adapter.external.graphql.tool.permission import DefaultPermissions
-from src.adapter.external.graphql.type.participant import BaseParticipantType
+from src.adapter.external.graphql.type.participant import (
+    BaseParticipantType,
+    domain_to_participant,
+)
+
+RECOMMENDATIONS_SIZE = 10
 
 
 @sb.type
@@ -22,18 +25,25 @@ class RecommendationsQuery:
         if info.context.user_id is None:
             raise Exception("User is not authenticated")
 
-        participants = await info.context.participant.service.read_all()
-
-        selected = [
-            participant.id
-            for participant in participants
-            if participant.user_id != info.context.user_id
-            and participant.allocation_id == allocation_id
-            and participant.state == domain.ParticipantState.ACTIVE
-        ]
-        if not selected:
-            return []
-
-        shuffle(selected)
-
-        return await info.context.participant.loader.load_many(selected[:10])
+        current = await info.context.participant.service.find(
+            proto.FindParticipant(
+                user_id=info.context.user_id, allocation_id=allocation_id
+            )
+        )
+
+        participants = await info.context.participant.service.sample(
+            proto.SampleParticipants(
+                allocation_id=allocation_id,
+                excluded_user_id=info.context.user_id,
+                excluded_ids=current.viewed_ids if current else set(),
+                size=RECOMMENDATIONS_SIZE,
+            )
+        )
+
+        selected = []
+        for participant in participants:
+            data = domain_to_participant(participant)
+            info.context.participant.loader.prime(participant.id, data)
+            selected.append(data)
+
+        return selected
@@ -68,7 +68,6 @@ class RoomMutation:
                 editors_ids=set(editors_ids) if editors_ids else None,
             )
             data = await info.context.room.service.update(request)
-            info.context.room.loader.clear(id)
             log.info(f"updated room {id}")
             return graphql.RoomType.from_pydantic(data)
 
@@ -81,6 +80,5 @@ class RoomMutation:
         with log.activity(f"deleting room {id}"):
             request = proto.DeleteRoom(_id=id)
             data = await info.context.room.service.delete(request)
-            info.context.room.loader.clear(id)
             log.info(f"deleted room {id}")
             return graphql.RoomType.from_pydantic(data)
@@ -97,7 +97,6 @@ class UserMutation:
 
             request = proto.UpdateUser.model_validate(payload)
             data = await info.context.user.service.update(request)
-            info.context.user.loader.clear(request.id)  # invalidate old cache
             log.info(f"updated user {id}")
             return UserType.from_pydantic(data)
 
@@ -107,6 +106,5 @@ class UserMutation:
     ) -> UserType:
         with log.activity(f"deleting user {id}"):
             data = await info.context.user.service.delete(proto.DeleteUser(_id=id))
-            info.context.user.loader.clear(id)  # invalidate cache
             log.info(f"deleted user {id}")
             return UserType.from_pydantic(data)
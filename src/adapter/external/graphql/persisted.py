@@ -0,0 +1,98 @@
+import hashlib
+from typing import Any
+
+from graphql import GraphQLError
+
+import src.protocol.internal.cache as proto
+from src.utils.logger.logger import Logger
+
+log = Logger("graphql-persisted")
+
+PERSISTED_QUERY_VERSION = 1
+
+
+class PersistedQueryError(GraphQLError):
+    """
+    Returned as the only error of the response, clients of automatic persisted
+    queries react to the message and the code.
+    """
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message, extensions={"code": code})
+
+
+def not_found() -> PersistedQueryError:
+    return PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+
+
+def not_in_list() -> PersistedQueryError:
+    return PersistedQueryError("PersistedQueryNotInList", "PERSISTED_QUERY_NOT_IN_LIST")
+
+
+class PersistedQueries:
+    """
+    Automatic persisted queries: a client sends `extensions.persistedQuery` with
+    the sha256 of its query, the text only after `PersistedQueryNotFound`.
+    In the allowlist mode clients cannot register queries, only the hashes known
+    to the store are executed.
+    """
+
+    def __init__(self, store: proto.PersistedQueryProtocol, allowlist: bool = False):
+        self._store = store
+        self._allowlist = allowlist
+
+    async def resolve(self, query: str | None, extensions: Any) -> str | None:
+        """
+        Query text of the request, `PersistedQueryError` if it cannot be executed.
+        """
+        persisted = None
+        if isinstance(extensions, dict):
+            persisted = extensions.get("persistedQuery")
+
+        if not isinstance(persisted, dict):
+            if self._allowlist and query is not None:
+                raise not_in_list()
+            return query
+
+        if persisted.get("version") != PERSISTED_QUERY_VERSION:
+            raise PersistedQueryError(
+                "Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED"
+            )
+
+        hash = persisted.get("sha256Hash")
+        if not isinstance(hash, str):
+            raise PersistedQueryError("sha256Hash is not provided", "BAD_REQUEST")
+
+        return await self.__resolve_hash(query, hash.lower())
+
+    async def __resolve_hash(self, query: str | None, hash: str) -> str:
+        if query is None:
+            query = await self.__get(hash)
+            if query is None:
+                raise not_in_list() if self._allowlist else not_found()
+            return query
+
+        if hashlib.sha256(query.encode()).hexdigest() != hash:
+            raise PersistedQueryError(
+                "provided sha does not match query", "BAD_REQUEST"
+            )
+
+        if self._allowlist:
+            if await self.__get(hash) is None:
+                raise not_in_list()
+            return query
+
+        try:
+            await self._store.put(hash, query)
+        except Exception as e:
+            log.warning(f"failed to persist query {hash}: {e}")
+
+        return query
+
+    async def __get(self, hash: str) -> str | None:
+        try:
+            return await self._store.get(hash)
+        except Exception as e:
+            # the client retries with the text
+            log.warning(f"failed to read persisted query {hash}: {e}")
+            return None
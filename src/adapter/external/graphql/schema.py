@@ -1,5 +1,6 @@
 import strawberry as sb
 
+from src.adapter.external.graphql.document import DocumentCache
 from src.adapter.external.graphql.operation.allocation import (
     AllocationMutation,
     AllocationQuery,
@@ -50,4 +51,13 @@ class Mutation(
 ): ...
 
 
-SCHEMA = sb.Schema(query=Query, mutation=Mutation)
+DOCUMENT_CACHE_SIZE = 512
+DOCUMENT_CACHE_STATS_INTERVAL = 10000
+
+DOCUMENT_CACHE = DocumentCache(DOCUMENT_CACHE_SIZE, DOCUMENT_CACHE_STATS_INTERVAL)
+
+SCHEMA = sb.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[DOCUMENT_CACHE.extension],  # type: ignore
+)
@@ -1,4 +1,6 @@
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 import aiohttp.web as web
 import strawberry as sb
@@ -11,7 +13,7 @@ from src.adapter.external.graphql.type.participant import ParticipantType
 from src.adapter.external.graphql.type.preference import PreferenceType
 from src.adapter.external.graphql.type.room import RoomType
 from src.adapter.external.graphql.type.user import UserType
-from src.service import answer
+from src.service import answer, identity
 from src.service.allocation import AllocationService
 from src.service.form_field import FormFieldService
 from src.service.participant import ParticipantService
@@ -19,11 +21,105 @@ from src.service.preference import PreferenceService
 from src.service.room import RoomService
 from src.service.user import UserService
 
+type LoaderFactory = Callable[[], DataLoader]
+
+
+class LoaderRegistry:
+    """
+    Loader factories by name, shared by all requests. A request builds only the
+    loaders it resolves through its `LoaderScope`.
+    """
+
+    def __init__(self):
+        self._factories: dict[str, LoaderFactory] = {}
+        self._services: dict[str, Any] = {}
+
+    def register(self, name: str, factory: LoaderFactory, service: Any = None) -> None:
+        if name in self._factories:
+            raise ValueError(f"loader {name} is already registered")
+
+        self._factories[name] = factory
+        self._services[name] = service
+
+    def factory(self, name: str) -> LoaderFactory:
+        return self._factories[name]
+
+    def service(self, name: str) -> Any:
+        return self._services[name]
+
+    def scope(self) -> "LoaderScope":
+        return LoaderScope(self)
+
+
+class LoaderScope:
+    __slots__ = ("_registry", "_loaders")
+
+    def __init__(self, registry: LoaderRegistry):
+        self._registry = registry
+        self._loaders: dict[str, DataLoader] = {}
+
+    def __getitem__(self, name: str) -> DataLoader:
+        loader = self._loaders.get(name)
+        if loader is None:
+            loader = self._loaders[name] = self._registry.factory(name)()
+
+        return loader
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._loaders
+
+    def service(self, name: str) -> Any:
+        return self._registry.service(name)
+
 
-@dataclass
 class DataContext[LoaderType, ServiceType]:
-    loader: DataLoader[scalar.ObjectID, LoaderType]
-    service: ServiceType
+    __slots__ = ("_name", "_loaders", "service")
+
+    def __init__(self, name: str, loaders: LoaderScope, service: ServiceType):
+        self._name = name
+        self._loaders = loaders
+        self.service = service
+
+    @property
+    def loader(self) -> DataLoader[scalar.ObjectID, LoaderType]:
+        return self._loaders[self._name]
+
+
+class LazyDataContext[LoaderType, ServiceType]:
+    """
+    Builds the `DataContext` of the registered loader with the attribute name on
+    first access and keeps it on the context.
+    """
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(
+        self, context: "Context", owner: type | None = None
+    ) -> DataContext[LoaderType, ServiceType]:
+        if context is None:
+            return self  # type: ignore
+
+        data = DataContext[LoaderType, ServiceType](
+            self._name, context.loaders, context.loaders.service(self._name)
+        )
+        context.__dict__[self._name] = data
+        return data
+
+
+class LazyLoader[LoaderType]:
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(
+        self, context: "Context", owner: type | None = None
+    ) -> DataLoader[scalar.ObjectID, LoaderType]:
+        if context is None:
+            return self  # type: ignore
+
+        loader = context.loaders[self._name]
+        context.__dict__[self._name] = loader
+        return loader
 
 
 @dataclass
@@ -31,14 +127,18 @@ class Context:
     user_id: scalar.ObjectID | None
     telegram_id: int | None
     request: web.Request
+    identity_map: identity.IdentityMap
+    loaders: LoaderScope
+
+    answer = LazyDataContext[AnswerType, answer.AnswerService]()  # type: ignore
+    allocation = LazyDataContext[AllocationType, AllocationService]()  # type: ignore
+    form_field = LazyDataContext[FormFieldType, FormFieldService]()  # type: ignore
+    participant = LazyDataContext[ParticipantType, ParticipantService]()  # type: ignore
+    preference = LazyDataContext[PreferenceType, PreferenceService]()
+    room = LazyDataContext[RoomType, RoomService]()
+    user = LazyDataContext[UserType, UserService]()
 
-    answer: DataContext[AnswerType, answer.AnswerService]  # type: ignore
-    allocation: DataContext[AllocationType, AllocationService]  # type: ignore
-    form_field: DataContext[FormFieldType, FormFieldService]  # type: ignore
-    participant: DataContext[ParticipantType, ParticipantService]  # type: ignore
-    preference: DataContext[PreferenceType, PreferenceService]
-    room: DataContext[RoomType, RoomService]
-    user: DataContext[UserType, UserService]
+    respondent_answers = LazyLoader[list[AnswerType]]()  # type: ignore
 
 
 type Info[T] = sb.Info[Context, T]
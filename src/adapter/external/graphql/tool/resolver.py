@@ -219,9 +219,7 @@ class WithID(Protocol):
 async def load_participant_answers(
     root: WithID, info: sb.Info[LazyContext, WithID]
 ) -> list[LazyAnswerType]:
-    answers = await info.context.answer.service.read_all()
-    selected = [answer.id for answer in answers if answer.respondent_id == root.id]
-    return await info.context.answer.loader.load_many(selected)
+    return await info.context.respondent_answers.load(root.id)
 
 
 class WithFormFieldId(Protocol):
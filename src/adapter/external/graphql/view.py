@@ -1,23 +1,36 @@
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+from functools import partial
+from typing import Any
+
 import strawberry as sb
 import ujson
 from strawberry.aiohttp.views import GraphQLView
-from strawberry.dataloader import DataLoader, DefaultCache
-from strawberry.http import GraphQLHTTPResponse
+from strawberry.dataloader import DataLoader
+from strawberry.http import GraphQLHTTPResponse, GraphQLRequestData
+from strawberry.http.async_base_view import AsyncHTTPRequestAdapter
+from strawberry.http.base import BaseRequestProtocol
+from strawberry.http.exceptions import HTTPException
+from strawberry.http.types import QueryParams
+from strawberry.types import ExecutionResult
 
-from src.adapter.external.auth.telegram import TgOauthContainer
-from src.adapter.external.graphql.tool.context import Context, DataContext
+import src.domain.model as domain
+from src.adapter.external.auth.telegram import VerifiedTokenCache
+from src.adapter.external.graphql.cache import CachedDataLoader, CustomDefaultCache
+from src.adapter.external.graphql.persisted import (
+    PersistedQueries,
+    PersistedQueryError,
+)
+from src.adapter.external.graphql.tool.context import Context, LoaderRegistry
 from src.adapter.external.graphql.type.allocation import (
-    BaseAllocationType,
     domain_to_allocation,
 )
 from src.adapter.external.graphql.type.form_field import (
     BaseAnswerType,
-    BaseFormFieldType,
     domain_to_answer,
     domain_to_form_field,
 )
 from src.adapter.external.graphql.type.participant import (
-    BaseParticipantType,
     domain_to_participant,
 )
 from src.adapter.external.graphql.type.preference import PreferenceType
@@ -25,12 +38,14 @@ from src.adapter.external.graphql.type.room import RoomType
 from src.adapter.external.graphql.type.user import UserType
 from src.domain.model.scalar.object_id import ObjectID
 from src.protocol.external.auth.oauth import OauthProtocol
+from src.protocol.internal.cache.generic import CacheProtocol
 from src.protocol.internal.database.allocation import ReadAllocation
 from src.protocol.internal.database.form_field import ReadAnswer, ReadFormField
 from src.protocol.internal.database.participant import ReadParticipant
 from src.protocol.internal.database.preference import ReadPreference
 from src.protocol.internal.database.room import ReadRoom
 from src.protocol.internal.database.user import ReadUser
+from src.service import identity
 from src.service.allocation import AllocationService
 from src.service.answer import AnswerService
 from src.service.form_field import FormFieldService
@@ -42,11 +57,18 @@ from src.utils.logger.logger import Logger
 
 log = Logger("graphql-view")
 
+VERIFIED_TOKENS_SIZE = 10000
+VERIFIED_TOKENS_MAX_AGE = timedelta(minutes=5)  # tokens issued without `exp`
 
-class CustomDefaultCache[K, T](DefaultCache[K, T]):
-    def delete(self, key: K) -> None:
-        if key in self.cache_map:
-            del self.cache_map[key]
+_CONVERTERS: dict[identity.EntityKind, Any] = {
+    identity.EntityKind.USER: UserType.from_pydantic,
+    identity.EntityKind.ALLOCATION: domain_to_allocation,
+    identity.EntityKind.FORM_FIELD: domain_to_form_field,
+    identity.EntityKind.ANSWER: domain_to_answer,
+    identity.EntityKind.PARTICIPANT: domain_to_participant,
+    identity.EntityKind.PREFERENCE: PreferenceType.from_pydantic,
+    identity.EntityKind.ROOM: RoomType.from_pydantic,
+}
 
 
 class RandormGraphQLView(GraphQLView):
@@ -54,6 +76,7 @@ class RandormGraphQLView(GraphQLView):
         self,
         schema: sb.Schema,
         oauth_adapter: OauthProtocol,
+        jwt_secret: str,
         user_service: UserService,
         allocation_service: AllocationService,
         form_field_service: FormFieldService,
@@ -61,6 +84,8 @@ class RandormGraphQLView(GraphQLView):
         participant_service: ParticipantService,
         preference_service: PreferenceService,
         room_service: RoomService,
+        cache_services: dict[identity.EntityKind, CacheProtocol] | None = None,
+        persisted_queries: PersistedQueries | None = None,
     ):
         self._oauth_adapter = oauth_adapter
         self._user_service = user_service
@@ -70,125 +95,192 @@ class RandormGraphQLView(GraphQLView):
         self._participant_service = participant_service
         self._preference_service = preference_service
         self._room_service = room_service
+        self._cache_services = cache_services or {}
+        self._persisted_queries = persisted_queries
+        self._tokens = VerifiedTokenCache(
+            jwt_secret,
+            max_size=VERIFIED_TOKENS_SIZE,
+            max_age=VERIFIED_TOKENS_MAX_AGE,
+        )
+        self._loaders = LoaderRegistry()
+        for kind, read, service in [
+            (identity.EntityKind.USER, self.__read_users, user_service),
+            (
+                identity.EntityKind.ALLOCATION,
+                self.__read_allocations,
+                allocation_service,
+            ),
+            (
+                identity.EntityKind.FORM_FIELD,
+                self.__read_form_fields,
+                form_field_service,
+            ),
+            (identity.EntityKind.ANSWER, self.__read_answers, answer_service),
+            (
+                identity.EntityKind.PARTICIPANT,
+                self.__read_participants,
+                participant_service,
+            ),
+            (
+                identity.EntityKind.PREFERENCE,
+                self.__read_preferences,
+                preference_service,
+            ),
+            (identity.EntityKind.ROOM, self.__read_rooms, room_service),
+        ]:
+            self._loaders.register(kind, partial(self.__loader, kind, read), service)
+        self._loaders.register(
+            "respondent_answers",
+            lambda: DataLoader(
+                load_fn=self.__load_respondent_answers,
+                cache_key_fn=str,
+                cache_map=CustomDefaultCache(),
+            ),
+        )
         super().__init__(schema, debug=False)
 
+    @property
+    def loaders(self) -> LoaderRegistry:
+        """
+        Loaders registered here are available to resolvers as
+        `info.context.loaders[name]`, built on first use within a request.
+        """
+        return self._loaders
+
     async def get_context(self, request, response):
         token = request.headers.get("Authorization")
         if not token:
             token = request.cookies.get("AccessToken")
 
         if token:
-            log.debug(f"token {token}")
-            dto = TgOauthContainer(jwt=token).to_dto(self._oauth_adapter._jwt_secret)  # type: ignore
-            log.debug(dto)
+            dto = self._tokens.verify(token)
+            log.debug(f"authenticated user {dto.id}")
         else:
             dto = None
 
-        return Context(
+        identity_map = identity.begin()
+        context = Context(
             user_id=dto.id if dto else None,
             telegram_id=dto.telegram_id if dto else None,
             request=request,
-            user=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_users,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._user_service,
-            ),
-            allocation=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_allocations,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._allocation_service,
-            ),
-            form_field=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_form_fields,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._form_field_service,
-            ),
-            answer=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_answers,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._answer_service,
-            ),
-            participant=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_participants,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._participant_service,
-            ),
-            preference=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_preferences,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._preference_service,
-            ),
-            room=DataContext(
-                loader=DataLoader(
-                    load_fn=self.__load_rooms,
-                    cache_key_fn=str,
-                    cache_map=CustomDefaultCache(),
-                ),
-                service=self._room_service,
-            ),
+            identity_map=identity_map,
+            loaders=self._loaders.scope(),
         )
 
-    async def __load_users(self, ids: list[ObjectID]) -> list[UserType]:
-        request = [ReadUser(_id=id) for id in ids]
-        response = await self._user_service.read_many(request)
+        def prime(kind: identity.EntityKind, entity: Any) -> None:
+            # mutation results replace the request entries, the services evict
+            # the shared ones
+            loader: DataLoader = context.loaders[kind]
+            loader.clear(entity.id)
+            loader.prime(entity.id, _CONVERTERS[kind](entity))
+            # the answers of the respondent are read again with the written one,
+            # a loader not built yet has nothing to clear
+            if kind == identity.EntityKind.ANSWER:
+                if "respondent_answers" in context.loaders:
+                    context.loaders["respondent_answers"].clear(entity.respondent_id)
+
+        identity_map.subscribe(prime)
+        return context
+
+    def __loader(
+        self,
+        kind: identity.EntityKind,
+        read: Callable[[list[ObjectID]], Awaitable[list[Any]]],
+    ) -> CachedDataLoader:
+        return CachedDataLoader(
+            load_fn=read,
+            convert=_CONVERTERS[kind],
+            cache_service=self._cache_services.get(kind),
+        )
 
-        return [UserType.from_pydantic(obj) for obj in response]
+    async def __read_users(self, ids: list[ObjectID]) -> list[domain.User]:
+        request = [ReadUser(_id=id) for id in ids]
+        return await self._user_service.read_many(request)
 
-    async def __load_answers(self, ids: list[ObjectID]) -> list[BaseAnswerType]:
+    async def __read_answers(self, ids: list[ObjectID]) -> list[domain.Answer]:
         request = [ReadAnswer(_id=id) for id in ids]
-        response = await self._answer_service.read_many(request)
+        return await self._answer_service.read_many(request)
 
-        return [domain_to_answer(obj) for obj in response]
+    async def __load_respondent_answers(
+        self, ids: list[ObjectID]
+    ) -> list[list[BaseAnswerType]]:
+        response = await self._answer_service.read_by_respondents(ids)
 
-    async def __load_allocations(self, ids: list[ObjectID]) -> list[BaseAllocationType]:
-        request = [ReadAllocation(_id=id) for id in ids]
-        response = await self._allocation_service.read_many(request)
+        grouped: dict[ObjectID, list[BaseAnswerType]] = {id: [] for id in ids}
+        for obj in response:
+            grouped[obj.respondent_id].append(domain_to_answer(obj))
 
-        return [domain_to_allocation(obj) for obj in response]
+        return [grouped[id] for id in ids]
 
-    async def __load_form_fields(self, ids: list[ObjectID]) -> list[BaseFormFieldType]:
-        request = [ReadFormField(_id=id) for id in ids]
-        response = await self._form_field_service.read_many(request)
+    async def __read_allocations(self, ids: list[ObjectID]) -> list[domain.Allocation]:
+        request = [ReadAllocation(_id=id) for id in ids]
+        return await self._allocation_service.read_many(request)
 
-        return [domain_to_form_field(obj) for obj in response]
+    async def __read_form_fields(self, ids: list[ObjectID]) -> list[domain.FormField]:
+        request = [ReadFormField(_id=id) for id in ids]
+        return await self._form_field_service.read_many(request)
 
-    async def __load_participants(
+    async def __read_participants(
         self, ids: list[ObjectID]
-    ) -> list[BaseParticipantType]:
+    ) -> list[domain.Participant]:
         request = [ReadParticipant(_id=id) for id in ids]
-        response = await self._participant_service.read_many(request)
+        return await self._participant_service.read_many(request)
 
-        return [domain_to_participant(obj) for obj in response]
-
-    async def __load_preferences(self, ids: list[ObjectID]) -> list[PreferenceType]:
+    async def __read_preferences(self, ids: list[ObjectID]) -> list[domain.Preference]:
         request = [ReadPreference(_id=id) for id in ids]
-        response = await self._preference_service.read_many(request)
-
-        return [PreferenceType.from_pydantic(obj) for obj in response]
+        return await self._preference_service.read_many(request)
 
-    async def __load_rooms(self, ids: list[ObjectID]) -> list[RoomType]:
+    async def __read_rooms(self, ids: list[ObjectID]) -> list[domain.Room]:
         request = [ReadRoom(_id=id) for id in ids]
-        response = await self._room_service.read_many(request)
+        return await self._room_service.read_many(request)
+
+    async def execute_operation(self, request, context, root_value) -> ExecutionResult:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as e:
+            return ExecutionResult(data=None, errors=[e])
+
+    async def parse_http_body(
+        self, request: AsyncHTTPRequestAdapter
+    ) -> GraphQLRequestData:
+        if self._persisted_queries is None:
+            return await super().parse_http_body(request)
+
+        data = await self.__parse_body(request)
+        return GraphQLRequestData(
+            query=await self._persisted_queries.resolve(
+                data.get("query"), data.get("extensions")
+            ),
+            variables=data.get("variables"),
+            operation_name=data.get("operationName"),
+        )
+
+    async def __parse_body(self, request: AsyncHTTPRequestAdapter) -> dict[str, Any]:
+        # copied from `AsyncBaseHTTPView.parse_http_body` of strawberry 0.236,
+        # which drops `extensions`; compare it when upgrading strawberry
+        content_type = request.content_type or ""
+        if request.method == "GET":
+            return self.parse_query_params(request.query_params)
+        if "application/json" in content_type:
+            return self.parse_json(await request.get_body())
+        if content_type.startswith("multipart/form-data"):
+            return await self.parse_multipart(request)
+
+        raise HTTPException(400, "Unsupported content type")
+
+    def should_render_graphql_ide(self, request: BaseRequestProtocol) -> bool:
+        # persisted queries are sent by GET without the query text
+        return (
+            super().should_render_graphql_ide(request)
+            and request.query_params.get("extensions") is None
+        )
+
+    def parse_query_params(self, params: QueryParams) -> dict[str, Any]:
+        params = super().parse_query_params(params)
+        if params.get("extensions"):
+            params["extensions"] = self.parse_json(params["extensions"])
 
-        return [RoomType.from_pydantic(obj) for obj in response]
+        return params
 
     def encode_json(self, response_data: GraphQLHTTPResponse) -> str:
         return ujson.dumps(response_data, ensure_ascii=False)
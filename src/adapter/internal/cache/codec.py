@@ -0,0 +1,61 @@
+"""
+Serialization of cached values.
+"""
+
+import hashlib
+import pickle
+from typing import Any
+
+import pydantic
+import ujson
+
+import src.protocol.internal.cache as proto
+from src.utils.logger.logger import Logger
+
+log = Logger("cache-codec")
+
+VERSION_SIZE = 8
+
+
+class PickleCodec(proto.CodecProtocol[Any]):
+    @property
+    def version(self) -> str:
+        return "pickle"
+
+    def encode(self, value: Any) -> bytes:
+        return pickle.dumps(value)
+
+    def decode(self, data: bytes) -> Any | None:
+        return pickle.loads(data)
+
+
+class JsonCodec[V](proto.CodecProtocol[V]):
+    """
+    JSON codec with the serializer and the validator of `annotation` compiled once.
+    Every value starts with a schema version, derived from the JSON schema of
+    `annotation` unless given, values of other versions are dropped.
+    """
+
+    def __init__(self, annotation: Any, version: str | None = None):
+        self._adapter = pydantic.TypeAdapter[V](annotation)
+        if version is None:
+            version = ujson.dumps(self._adapter.json_schema(), sort_keys=True)
+        self._version = hashlib.sha256(version.encode()).digest()[:VERSION_SIZE]
+
+    @property
+    def version(self) -> str:
+        return self._version.hex()
+
+    def encode(self, value: V) -> bytes:
+        return self._version + self._adapter.dump_json(value, by_alias=True)
+
+    def decode(self, data: bytes) -> V | None:
+        if data[:VERSION_SIZE] != self._version:
+            log.debug("dropping value of another schema version")
+            return None
+
+        try:
+            return self._adapter.validate_json(data[VERSION_SIZE:])
+        except pydantic.ValidationError as e:
+            log.error("failed to decode cached value with error: {}", e)
+            return None
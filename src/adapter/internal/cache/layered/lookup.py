@@ -0,0 +1,88 @@
+import asyncio
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+from src.utils.logger.logger import Logger
+
+log = Logger("layered-lookup")
+
+
+class LayeredLookupService(proto.LookupCacheProtocol):
+    """
+    Lookup cache with an in-process `local` tier in front of a shared `remote` one.
+    Writes and deletes are broadcast with `invalidation`, so the other workers drop
+    their local copies. Remote failures are logged and handled as misses.
+    """
+
+    def __init__(
+        self,
+        local: proto.LookupCacheProtocol,
+        remote: proto.LookupCacheProtocol,
+        invalidation: proto.InvalidationProtocol[int] | None = None,
+    ):
+        self._local = local
+        self._remote = remote
+        self._invalidation = invalidation
+        self._listener: asyncio.Task | None = None
+        # bumped by every local change, a remote read older than it is not cached
+        self._version = 0
+
+    async def get(self, key: int) -> proto.Lookup | None:
+        self.__listen()
+        lookup = await self._local.get(key)
+        if lookup is not None:
+            return lookup
+
+        version = self._version
+        try:
+            lookup = await self._remote.get(key)
+        except Exception as e:
+            log.error("failed to read remote lookup with error: {}", e)
+            return None
+
+        if lookup is not None and self._version == version:
+            await self._local.put(key, lookup.id)
+
+        return lookup
+
+    async def put(self, key: int, id: domain.ObjectID | None) -> None:
+        self._version += 1
+        await self._local.put(key, id)
+        try:
+            await self._remote.put(key, id)
+        except Exception as e:
+            log.error("failed to write remote lookup with error: {}", e)
+
+        await self.__publish(key)
+
+    async def delete(self, key: int) -> None:
+        self._version += 1
+        await self._local.delete(key)
+        try:
+            await self._remote.delete(key)
+        except Exception as e:
+            log.error("failed to delete remote lookup with error: {}", e)
+
+        await self.__publish(key)
+
+    async def __publish(self, key: int) -> None:
+        if self._invalidation is None:
+            return
+
+        try:
+            await self._invalidation.publish([key])
+        except Exception as e:
+            log.error("failed to publish lookup invalidation with error: {}", e)
+
+    def __listen(self) -> None:
+        # started on first use, from inside of the running event loop
+        if self._invalidation is None or self._listener is not None:
+            return
+
+        self._listener = asyncio.create_task(self._invalidation.listen(self.__evict))
+
+    async def __evict(self, keys: list[int]) -> None:
+        log.debug(f"evicting lookups {keys}")
+        self._version += 1
+        for key in keys:
+            await self._local.delete(key)
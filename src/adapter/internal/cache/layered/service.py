@@ -0,0 +1,240 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+from src.utils.logger.logger import Logger
+
+log = Logger("layered-cache")
+
+V = TypeVar("V", bound=BaseModel)
+
+
+class LayeredCacheService(proto.CacheProtocol[V]):
+    """
+    Two tier cache: an in-process `local` tier in front of a shared `remote` one.
+    Writes and deletes are broadcast with `invalidation`, so the other workers drop
+    their local copies. Remote failures are logged and handled as misses.
+    """
+
+    def __init__(
+        self,
+        local: proto.CacheProtocol[V],
+        remote: proto.CacheProtocol[V],
+        invalidation: proto.InvalidationProtocol[domain.ObjectID] | None = None,
+    ):
+        self._local = local
+        self._remote = remote
+        self._invalidation = invalidation
+        self._listener: asyncio.Task | None = None
+        self._inflight: dict[domain.ObjectID, asyncio.Future[V]] = {}
+        # bumped by every local change, a remote read older than it is not cached
+        self._version = 0
+
+    async def put(self, key: domain.ObjectID, value: V) -> None:
+        await self.put_many([(key, value)])
+
+    async def get(self, key: domain.ObjectID) -> V | None:
+        return (await self.get_many([key]))[0]
+
+    async def delete(self, key: domain.ObjectID) -> None:
+        await self.delete_many([key])
+
+    async def put_many(self, items: list[tuple[domain.ObjectID, V]]) -> None:
+        self._version += 1
+        await self.__store(items)
+        await self.__publish([key for key, _ in items])
+
+    async def get_many(self, keys: list[domain.ObjectID]) -> list[V | None]:
+        self.__listen()
+        values = await self._local.get_many(keys)
+        missing = [
+            key for key, value in zip(keys, values, strict=True) if value is None
+        ]
+        if not missing:
+            return values
+
+        version = self._version
+        try:
+            remote = await self._remote.get_many(missing)
+        except Exception as e:
+            log.error("failed to read remote cache with error: {}", e)
+            return values
+
+        found = {
+            key: value
+            for key, value in zip(missing, remote, strict=True)
+            if value is not None
+        }
+        # the keys may be invalidated while reading, the local tier would keep
+        # the old values until its ttl
+        if self._version == version:
+            await self._local.put_many(list(found.items()))
+        return [found.get(key, value) for key, value in zip(keys, values, strict=True)]
+
+    async def delete_many(self, keys: list[domain.ObjectID]) -> None:
+        self._version += 1
+        for key in keys:
+            self._inflight.pop(key, None)
+
+        await self._local.delete_many(keys)
+        try:
+            await self._remote.delete_many(keys)
+        except Exception as e:
+            log.error("failed to delete from remote cache with error: {}", e)
+
+        await self.__publish(keys)
+
+    async def delete_tags(self, tags: list[str]) -> list[domain.ObjectID]:
+        # the remote tier owns the tag sets, local copies are dropped by key
+        try:
+            keys = await self._remote.delete_tags(tags)
+        except Exception as e:
+            log.error("failed to delete remote tags with error: {}", e)
+            return []
+
+        self._version += 1
+        for key in keys:
+            self._inflight.pop(key, None)
+
+        await self._local.delete_many(keys)
+        await self.__publish(keys)
+        return keys
+
+    async def flush(self) -> None:
+        self._version += 1
+        self._inflight.clear()
+        await self._local.flush()
+        await self._remote.flush()
+
+    async def load_many(
+        self,
+        keys: list[domain.ObjectID],
+        fetch: Callable[[list[domain.ObjectID]], Awaitable[list[V]]],
+    ) -> list[V]:
+        """
+        Single-flight loading, a key missing in both tiers is fetched once per worker
+        however many callers are waiting for it.
+        """
+        futures: dict[domain.ObjectID, asyncio.Future[V]] = {}
+        owned: list[domain.ObjectID] = []
+        for key in keys:
+            if key in futures:
+                continue
+
+            if (future := self._inflight.get(key)) is None:
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                owned.append(key)
+
+            futures[key] = future
+
+        if owned:
+            await self.__load(owned, fetch, futures)
+
+        return [await self.__wait(key, futures[key], fetch) for key in keys]
+
+    async def __wait(
+        self,
+        key: domain.ObjectID,
+        future: asyncio.Future[V],
+        fetch: Callable[[list[domain.ObjectID]], Awaitable[list[V]]],
+    ) -> V:
+        # shielded, a cancelled waiter must not cancel the load of the others
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            task = asyncio.current_task()
+            if not future.cancelled() or (task is not None and task.cancelling()):
+                raise
+
+        # the owner was cancelled, the waiter loads the key on its own
+        return (await self.load_many([key], fetch))[0]
+
+    async def __load(
+        self,
+        keys: list[domain.ObjectID],
+        fetch: Callable[[list[domain.ObjectID]], Awaitable[list[V]]],
+        futures: dict[domain.ObjectID, asyncio.Future[V]],
+    ) -> None:
+        try:
+            values = await self.get_many(keys)
+            missing = [
+                key for key, value in zip(keys, values, strict=True) if value is None
+            ]
+            if missing:
+                fetched = dict(zip(missing, await fetch(missing), strict=True))
+                # keys invalidated while fetching may be stale and are not cached,
+                # fresh reads are not broadcast, no worker has them cached
+                await self.__store(
+                    [
+                        (key, value)
+                        for key, value in fetched.items()
+                        if self._inflight.get(key) is futures[key]
+                    ]
+                )
+                values = [
+                    fetched.get(key, value)
+                    for key, value in zip(keys, values, strict=True)
+                ]
+
+            for key, value in zip(keys, values, strict=True):
+                futures[key].set_result(value)  # type: ignore
+        except Exception as e:
+            for key in keys:
+                if not futures[key].done():
+                    futures[key].set_exception(e)
+                    futures[key].exception()  # retrieved by the owner
+            raise
+        except BaseException:
+            # a cancellation of the owner is not an error of the waiters
+            for key in keys:
+                futures[key].cancel()
+            raise
+        finally:
+            for key in keys:
+                if self._inflight.get(key) is futures[key]:
+                    del self._inflight[key]
+
+    async def __store(self, items: list[tuple[domain.ObjectID, V]]) -> None:
+        await self._local.put_many(items)
+        try:
+            await self._remote.put_many(items)
+        except Exception as e:
+            log.error("failed to write remote cache with error: {}", e)
+
+    async def __publish(self, keys: list[domain.ObjectID]) -> None:
+        if self._invalidation is None or not keys:
+            return
+
+        try:
+            await self._invalidation.publish(keys)
+        except Exception as e:
+            log.error("failed to publish invalidation with error: {}", e)
+
+    def __listen(self) -> None:
+        # started on first use, from inside of the running event loop
+        if self._invalidation is None or self._listener is not None:
+            return
+
+        self._listener = asyncio.create_task(
+            self._invalidation.listen(self.__evict, self.__reset)
+        )
+
+    async def __evict(self, keys: list[domain.ObjectID]) -> None:
+        log.debug(f"evicting {[str(key) for key in keys]}")
+        self._version += 1
+        for key in keys:
+            self._inflight.pop(key, None)
+
+        await self._local.delete_many(keys)
+
+    async def __reset(self) -> None:
+        # invalidations may have been missed, none of the local values is trusted
+        log.info("flushing local cache after missed invalidations")
+        self._version += 1
+        self._inflight.clear()
+        await self._local.flush()
@@ -0,0 +1,36 @@
+import time
+from collections import OrderedDict
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+
+
+class MemoryLookupService(proto.LookupCacheProtocol):
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        self._cache: OrderedDict[int, tuple[proto.Lookup, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+
+    async def get(self, key: int) -> proto.Lookup | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        lookup, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return lookup
+
+    async def put(self, key: int, id: domain.ObjectID | None) -> None:
+        ttl = self._ttl if id is not None else self._negative_ttl
+        self._cache[key] = (proto.Lookup(id), time.monotonic() + ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    async def delete(self, key: int) -> None:
+        self._cache.pop(key, None)
@@ -0,0 +1,31 @@
+import time
+from collections import OrderedDict
+
+import src.protocol.internal.cache as proto
+
+
+class MemoryPersistedQueryService(proto.PersistedQueryProtocol):
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self._queries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+
+    async def get(self, hash: str) -> str | None:
+        entry = self._queries.get(hash)
+        if entry is None:
+            return None
+
+        query, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._queries[hash]
+            return None
+
+        self._queries.move_to_end(hash)
+        return query
+
+    async def put(self, hash: str, query: str) -> None:
+        ttl = self._ttl if self._ttl is not None else float("inf")
+        self._queries[hash] = (query, time.monotonic() + ttl)
+        self._queries.move_to_end(hash)
+        while len(self._queries) > self._max_size:
+            self._queries.popitem(last=False)
@@ -1,37 +1,104 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TypeVar
 
 from pydantic import BaseModel
 
+import src.domain.model as domain
+from src.protocol.internal.cache.codec import CodecProtocol
 from src.protocol.internal.cache.generic import CacheProtocol
 
 V = TypeVar("V", bound=BaseModel)
 
 
+@dataclass(slots=True)
+class Entry[V]:
+    value: V
+    expires_at: float | None
+    size: int
+
+
 class MemoryDBService(CacheProtocol[V]):
-    def __init__(self):
-        self._cache = {}
+    """
+    In-process LRU cache, unbounded unless a size, a ttl or a memory budget is set.
+    Memory usage is estimated with the size of the values encoded by `codec`.
+    """
+
+    def __init__(
+        self,
+        max_size: int | None = None,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+        codec: CodecProtocol[V] | None = None,
+    ):
+        if max_bytes is not None and codec is None:
+            raise ValueError("memory budget requires a codec to size the values")
 
-    async def put(self, key: str, value: V) -> None:
-        self._cache[key] = value
+        self._cache: OrderedDict[domain.ObjectID, Entry[V]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._codec = codec
+        self._bytes = 0
 
-    async def get(self, key: str) -> V | None:
-        return self._cache.get(key)
+    async def put(self, key: domain.ObjectID, value: V) -> None:
+        self._put(key, value)
+        self._evict()
 
-    async def delete(self, key: str) -> None:
-        if key in self._cache:
-            del self._cache[key]
+    async def get(self, key: domain.ObjectID) -> V | None:
+        return self._get(key)
 
-    async def put_many(self, items: list[tuple[str, V]]) -> None:
+    async def delete(self, key: domain.ObjectID) -> None:
+        self._delete(key)
+
+    async def put_many(self, items: list[tuple[domain.ObjectID, V]]) -> None:
         for key, value in items:
-            self._cache[key] = value
+            self._put(key, value)
+        self._evict()
 
-    async def get_many(self, keys: list[str]) -> list[V | None]:
-        return [self._cache.get(key) for key in keys]
+    async def get_many(self, keys: list[domain.ObjectID]) -> list[V | None]:
+        return [self._get(key) for key in keys]
 
-    async def delete_many(self, keys: list[str]) -> None:
+    async def delete_many(self, keys: list[domain.ObjectID]) -> None:
         for key in keys:
-            if key in self._cache:
-                del self._cache[key]
+            self._delete(key)
 
     async def flush(self) -> None:
         self._cache.clear()
+        self._bytes = 0
+
+    def _put(self, key: domain.ObjectID, value: V) -> None:
+        self._delete(key)
+
+        size = 0
+        if self._max_bytes is not None:
+            size = len(self._codec.encode(value))  # type: ignore
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        self._cache[key] = Entry(value, expires_at, size)
+        self._bytes += size
+
+    def _get(self, key: domain.ObjectID) -> V | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._delete(key)
+            return None
+
+        self._cache.move_to_end(key)
+        return entry.value
+
+    def _delete(self, key: domain.ObjectID) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _evict(self) -> None:
+        while self._cache and (
+            (self._max_size is not None and len(self._cache) > self._max_size)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            _, entry = self._cache.popitem(last=False)
+            self._bytes -= entry.size
@@ -0,0 +1,99 @@
+import asyncio
+import os
+from abc import abstractmethod
+from collections.abc import Awaitable, Callable
+
+import redis
+import redis.asyncio
+from redis.asyncio.client import Redis as AsyncRedis
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+from src.utils.logger.logger import Logger
+
+log = Logger("redis-invalidation")
+
+SENDER_SIZE = 8
+KEY_SIZE = 12
+LOOKUP_KEY_SIZE = 8
+RECONNECT_DELAY = 1
+
+
+class BaseRedisInvalidation[K](proto.InvalidationProtocol[K]):
+    """
+    Broadcasts invalidated keys over Redis pub/sub.
+    A message is a sender id followed by the encoded keys.
+    """
+
+    def __init__(self, redis_dsn: str, channel: str):
+        self._channel = channel
+        self._sender = os.urandom(SENDER_SIZE)
+        self._client: AsyncRedis = redis.asyncio.from_url(redis_dsn)
+
+    @abstractmethod
+    def _encode(self, keys: list[K]) -> bytes: ...
+
+    @abstractmethod
+    def _decode(self, data: bytes) -> list[K]: ...
+
+    async def publish(self, keys: list[K]) -> None:
+        await self._client.publish(self._channel, self._sender + self._encode(keys))
+
+    async def listen(
+        self,
+        callback: Callable[[list[K]], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    # the messages published before subscribing, while connecting
+                    # or reconnecting, are lost
+                    if reset is not None:
+                        await reset()
+
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+
+                        data: bytes = message["data"]
+                        if data[:SENDER_SIZE] == self._sender:
+                            continue
+
+                        await callback(self._decode(data[SENDER_SIZE:]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.error("failed to listen {} with error: {}", self._channel, e)
+                await asyncio.sleep(RECONNECT_DELAY)
+
+
+class RedisInvalidation(BaseRedisInvalidation[domain.ObjectID]):
+    """
+    Keys are the binary object ids.
+    """
+
+    def _encode(self, keys: list[domain.ObjectID]) -> bytes:
+        return b"".join(key.binary for key in keys)
+
+    def _decode(self, data: bytes) -> list[domain.ObjectID]:
+        return [
+            domain.ObjectID(data[i : i + KEY_SIZE])
+            for i in range(0, len(data), KEY_SIZE)
+        ]
+
+
+class RedisLookupInvalidation(BaseRedisInvalidation[int]):
+    """
+    Keys are signed 64-bit integers, as telegram ids are.
+    """
+
+    def _encode(self, keys: list[int]) -> bytes:
+        return b"".join(key.to_bytes(LOOKUP_KEY_SIZE, signed=True) for key in keys)
+
+    def _decode(self, data: bytes) -> list[int]:
+        return [
+            int.from_bytes(data[i : i + LOOKUP_KEY_SIZE], signed=True)
+            for i in range(0, len(data), LOOKUP_KEY_SIZE)
+        ]
@@ -0,0 +1,46 @@
+import redis
+import redis.asyncio
+from redis.asyncio.client import Redis as AsyncRedis
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+
+MISSING = b""
+
+
+class RedisLookupService(proto.LookupCacheProtocol):
+    """
+    Lookups stored under `<namespace>:<key>`, found ids as their binary form and
+    missing ones as an empty value with the shorter `negative_ttl`.
+    """
+
+    def __init__(
+        self,
+        redis_dsn: str,
+        namespace: str,
+        ttl: int,
+        negative_ttl: int,
+    ):
+        self._namespace = namespace
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._client: AsyncRedis = redis.asyncio.from_url(redis_dsn)
+
+    async def get(self, key: int) -> proto.Lookup | None:
+        data = await self._client.get(self.__key(key))
+        if data is None:
+            return None
+
+        return proto.Lookup(domain.ObjectID(data) if data != MISSING else None)
+
+    async def put(self, key: int, id: domain.ObjectID | None) -> None:
+        if id is None:
+            await self._client.set(self.__key(key), MISSING, ex=self._negative_ttl)
+        else:
+            await self._client.set(self.__key(key), id.binary, ex=self._ttl)
+
+    async def delete(self, key: int) -> None:
+        await self._client.unlink(self.__key(key))
+
+    def __key(self, key: int) -> str:
+        return f"{self._namespace}:{key}"
@@ -0,0 +1,57 @@
+import redis
+import redis.asyncio
+from redis.asyncio.client import Redis as AsyncRedis
+
+import src.protocol.internal.cache as proto
+
+
+class RedisPersistedQueryService(proto.PersistedQueryProtocol):
+    """
+    Query texts stored under `<namespace>:<hash>`, the expiration is refreshed on
+    every read so the queries in use stay. Without `ttl` they are kept forever, as
+    the allowlist needs. An optional `local` store is read first and filled from
+    Redis, its own ttl must be shorter: a query served locally is read from Redis
+    again once it expires there, which refreshes the Redis expiration and drops
+    the queries removed from the allowlist.
+    """
+
+    def __init__(
+        self,
+        redis_dsn: str,
+        namespace: str,
+        ttl: int | None = None,
+        local: proto.PersistedQueryProtocol | None = None,
+    ):
+        self._namespace = namespace
+        self._ttl = ttl
+        self._local = local
+        self._client: AsyncRedis = redis.asyncio.from_url(redis_dsn)
+
+    async def get(self, hash: str) -> str | None:
+        if self._local is not None:
+            query = await self._local.get(hash)
+            if query is not None:
+                return query
+
+        if self._ttl is None:
+            data = await self._client.get(self.__key(hash))
+        else:
+            data = await self._client.getex(self.__key(hash), ex=self._ttl)
+
+        if data is None:
+            return None
+
+        query = data.decode()
+        if self._local is not None:
+            await self._local.put(hash, query)
+
+        return query
+
+    async def put(self, hash: str, query: str) -> None:
+        if self._local is not None:
+            await self._local.put(hash, query)
+
+        await self._client.set(self.__key(hash), query.encode(), ex=self._ttl)
+
+    def __key(self, hash: str) -> str:
+        return f"{self._namespace}:{hash}"
@@ -1,4 +1,4 @@
-import pickle
+from collections.abc import Callable
 from typing import TypeVar
 
 import redis
@@ -8,40 +8,108 @@ from redis.asyncio.client import Redis as AsyncRedis
 
 import src.domain.model as domain
 import src.protocol.internal.cache as proto
+from src.adapter.internal.cache.codec import PickleCodec
 
 V = TypeVar("V", bound=BaseModel)
 
+SCAN_BATCH_SIZE = 500
+KEY_SIZE = 12
+
 
 class RedisService(proto.CacheProtocol[V]):
-    def __init__(self, redis_dsn: str):
+    """
+    Values are stored under `<namespace>:<codec version>:<object id>`, so caches of
+    different types, older schemas and other users of the database never collide.
+    `tags` groups values into sets under `<namespace>:tag:<tag>`, dropped together
+    with `delete_tags`.
+    """
+
+    def __init__(
+        self,
+        redis_dsn: str,
+        ttl: int | None = None,
+        codec: proto.CodecProtocol[V] | None = None,
+        namespace: str = "cache",
+        tags: Callable[[V], list[str]] | None = None,
+    ):
         self._redis_dsn = redis_dsn
+        self._ttl = ttl
+        self._codec: proto.CodecProtocol[V] = codec or PickleCodec()
+        self._namespace = namespace
+        self._prefix = f"{namespace}:{self._codec.version}:".encode()
+        self._tags = tags
         self._client: AsyncRedis = redis.asyncio.from_url(self._redis_dsn)
 
     async def put(self, key: domain.ObjectID, value: V) -> None:
-        await self._client.set(key.binary, pickle.dumps(value))
+        await self.put_many([(key, value)])
 
     async def get(self, key: domain.ObjectID) -> V | None:
-        data = await self._client.get(key.binary)
+        data = await self._client.get(self.__key(key))
 
         if data is not None:
-            return pickle.loads(data)  # type: ignore
+            return self._codec.decode(data)
 
         return None
 
     async def delete(self, key: domain.ObjectID) -> None:
-        await self._client.delete(key.binary)
+        await self._client.unlink(self.__key(key))
 
     async def put_many(self, items: list[tuple[domain.ObjectID, V]]) -> None:
-        values = {key.binary: pickle.dumps(value) for key, value in items}
-        await self._client.mset(mapping=values)
+        if not items:
+            return
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items:
+                pipe.set(self.__key(key), self._codec.encode(value), ex=self._ttl)
+                if self._tags is None:
+                    continue
+
+                for tag in self._tags(value):
+                    pipe.sadd(self.__tag(tag), self.__key(key))
+                    if self._ttl is not None:
+                        pipe.expire(self.__tag(tag), self._ttl)
+            await pipe.execute()
 
     async def get_many(self, keys: list[domain.ObjectID]) -> list[V | None]:
-        values = await self._client.mget(*[key.binary for key in keys])
-        return [pickle.loads(v) if v is not None else None for v in values]
+        values = await self._client.mget(*[self.__key(key) for key in keys])
+        return [self._codec.decode(v) if v is not None else None for v in values]
 
     async def delete_many(self, keys: list[domain.ObjectID]) -> None:
-        values = [key.binary for key in keys]
-        await self._client.delete(*values)
+        if keys:
+            await self._client.unlink(*[self.__key(key) for key in keys])
+
+    async def delete_tags(self, tags: list[str]) -> list[domain.ObjectID]:
+        if not tags:
+            return []
+
+        async with self._client.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.smembers(self.__tag(tag))
+            members: list[set[bytes]] = await pipe.execute()
+
+        keys = set().union(*members)
+        # unlink frees the values in background, the server is not blocked
+        await self._client.unlink(*keys, *[self.__tag(tag) for tag in tags])
+        return [domain.ObjectID(key[-KEY_SIZE:]) for key in keys]
 
     async def flush(self) -> None:
-        await self._client.flushdb()
+        """
+        Drops the keys of the namespace only, the database may be shared.
+        """
+        batch: list[bytes] = []
+        async for key in self._client.scan_iter(
+            match=f"{self._namespace}:*", count=SCAN_BATCH_SIZE
+        ):
+            batch.append(key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                await self._client.unlink(*batch)
+                batch = []
+
+        if batch:
+            await self._client.unlink(*batch)
+
+    def __key(self, key: domain.ObjectID) -> bytes:
+        return self._prefix + key.binary
+
+    def __tag(self, tag: str) -> str:
+        return f"{self._namespace}:tag:{tag}"
@@ -1,4 +1,6 @@
 import json
+import random
+from collections.abc import AsyncIterator
 from datetime import datetime
 
 from pydantic import BaseModel, ValidationError
@@ -183,6 +185,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._allocation_collection[allocation.id] = document
 
             return domain.AllocationResolver.validate_python(document)
@@ -204,6 +207,13 @@ class MemoryDBAdapter(
             for allocation in allocations
         ]
 
+    async def exists_many_allocations(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {
+            id: proto.existence_state(self._allocation_collection.get(id)) for id in ids
+        }
+
     async def create_form_field(
         self,
         form_field: proto.CreateFormField,
@@ -372,6 +382,13 @@ class MemoryDBAdapter(
             for form_field in form_fields
         ]
 
+    async def exists_many_form_fields(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {
+            id: proto.existence_state(self._form_field_collection.get(id)) for id in ids
+        }
+
     async def delete_form_field(
         self,
         form_field: proto.DeleteFormField,
@@ -384,6 +401,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._form_field_collection[form_field.id] = document
             document = self._form_field_collection.get(form_field.id)
 
@@ -524,6 +542,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._answer_collection[answer.id] = document
             document = self._answer_collection.get(answer.id)
 
@@ -542,6 +561,13 @@ class MemoryDBAdapter(
     ) -> list[domain.Answer | None]:
         return [self._answer_collection.get(answer.id, None) for answer in answers]
 
+    async def exists_many_answers(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {
+            id: proto.existence_state(self._answer_collection.get(id)) for id in ids
+        }
+
     async def read_all_answers(self) -> list[domain.Answer]:
         try:
             answers = self._answer_collection.values()
@@ -555,6 +581,45 @@ class MemoryDBAdapter(
                 f"failed to read all answers with error: {e}"
             ) from e
 
+    async def read_answers_by_respondents(
+        self,
+        respondent_ids: list[ObjectID],
+    ) -> list[domain.Answer]:
+        try:
+            selected = set(respondent_ids)
+            return [
+                domain.AnswerResolver.validate_python(answer)
+                for answer in self._answer_collection.values()
+                if answer.respondent_id in selected
+            ]
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.ReadAnswerException(
+                f"failed to read answers by respondents with error: {e}"
+            ) from e
+
+    async def iter_answers(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Answer]:
+        try:
+            for answer in list(self._answer_collection.values()):
+                if self.__in_updated_window(answer, updated_since, updated_before):
+                    yield domain.AnswerResolver.validate_python(answer)
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.ReadAnswerException(
+                f"failed to iterate answers with error: {e}"
+            ) from e
+
     async def create_user(
         self,
         user: proto.CreateUser,
@@ -711,6 +776,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._user_collection[user.id] = document
             document = self._user_collection.get(user.id)
 
@@ -729,6 +795,11 @@ class MemoryDBAdapter(
     ) -> list[domain.User | None]:
         return [self._user_collection.get(user.id, None) for user in users]
 
+    async def exists_many_users(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {id: proto.existence_state(self._user_collection.get(id)) for id in ids}
+
     async def create_room(
         self,
         room: proto.CreateRoom,
@@ -844,6 +915,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._room_collection[room.id] = document
             document = self._room_collection.get(room.id)
 
@@ -862,6 +934,11 @@ class MemoryDBAdapter(
     ) -> list[domain.Room | None]:
         return [self._room_collection.get(room.id, None) for room in rooms]
 
+    async def exists_many_rooms(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {id: proto.existence_state(self._room_collection.get(id)) for id in ids}
+
     async def create_participant(
         self, participant: proto.CreateParticipant
     ) -> domain.Participant:
@@ -981,6 +1058,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._participant_collection[participant.id] = document
             document = self._participant_collection.get(participant.id)
 
@@ -1002,6 +1080,14 @@ class MemoryDBAdapter(
             for participant in participants
         ]
 
+    async def exists_many_participants(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {
+            id: proto.existence_state(self._participant_collection.get(id))
+            for id in ids
+        }
+
     async def read_all_participants(self) -> list[domain.Participant]:
         try:
             participants = self._participant_collection.values()
@@ -1018,6 +1104,112 @@ class MemoryDBAdapter(
                 f"failed to read all participants with error: {e}"
             ) from e
 
+    async def find_participant(
+        self,
+        participant: proto.FindParticipant,
+    ) -> domain.Participant | None:
+        try:
+            if not isinstance(participant, BaseModel):
+                raise AttributeError("participant must be a pydantic model")
+
+            for document in self._participant_collection.values():
+                if (
+                    document.user_id == participant.user_id
+                    and document.allocation_id == participant.allocation_id
+                    and document.deleted_at is None
+                ):
+                    return domain.ParticipantResolver.validate_python(document)
+
+            return None
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.FindParticipantException(
+                f"failed to find participant with error: {e}"
+            ) from e
+
+    async def sample_participants(
+        self,
+        participants: proto.SampleParticipants,
+    ) -> list[domain.Participant]:
+        try:
+            if not isinstance(participants, BaseModel):
+                raise AttributeError("participants must be a pydantic model")
+
+            candidates = [
+                document
+                for document in self._participant_collection.values()
+                if document.allocation_id == participants.allocation_id
+                and document.state == domain.ParticipantState.ACTIVE
+                and document.user_id != participants.excluded_user_id
+                and document.id not in participants.excluded_ids
+                and document.deleted_at is None
+            ]
+            selected = random.sample(
+                candidates, min(participants.size, len(candidates))
+            )
+
+            return [
+                domain.ParticipantResolver.validate_python(document)
+                for document in selected
+            ]
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.FindParticipantException(
+                f"failed to sample participants with error: {e}"
+            ) from e
+
+    async def iter_participants(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Participant]:
+        try:
+            for participant in list(self._participant_collection.values()):
+                if self.__in_updated_window(participant, updated_since, updated_before):
+                    yield domain.ParticipantResolver.validate_python(participant)
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
+    async def iter_participants_with_gender(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[tuple[domain.Participant, domain.Gender | None]]:
+        try:
+            for participant in list(self._participant_collection.values()):
+                if not self.__in_updated_window(
+                    participant, updated_since, updated_before
+                ):
+                    continue
+
+                user = self._user_collection.get(participant.user_id)
+                yield (
+                    domain.ParticipantResolver.validate_python(participant),
+                    user.profile.gender if user is not None else None,
+                )
+        except (ValidationError, AttributeError) as e:
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
     async def create_preference(
         self,
         preference: proto.CreatePreference,
@@ -1148,6 +1340,7 @@ class MemoryDBAdapter(
             assert document is not None, "document not found"
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             self._preference_collection[preference.id] = document
             document = self._preference_collection.get(preference.id)
 
@@ -1168,3 +1361,24 @@ class MemoryDBAdapter(
             self._preference_collection.get(preference.id, None)
             for preference in preferences
         ]
+
+    async def exists_many_preferences(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, proto.ExistenceState]:
+        return {
+            id: proto.existence_state(self._preference_collection.get(id)) for id in ids
+        }
+
+    def __in_updated_window(
+        self,
+        document: domain.Answer | domain.Participant,
+        updated_since: datetime | None,
+        updated_before: datetime | None,
+    ) -> bool:
+        if updated_since is not None and document.updated_at < updated_since:
+            return False
+
+        if updated_before is not None and document.updated_at >= updated_before:
+            return False
+
+        return True
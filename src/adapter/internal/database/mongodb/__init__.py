@@ -2,4 +2,4 @@
 MongoDB adapter
 """
 
-from src.adapter.internal.database.mongodb import models, service
+from src.adapter.internal.database.mongodb import indexes, models, queries, service
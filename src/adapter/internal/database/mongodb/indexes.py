@@ -0,0 +1,97 @@
+"""
+Secondary index maintenance shared by the MongoDB adapters.
+"""
+
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo import IndexModel
+from pymongo.errors import OperationFailure
+
+from src.adapter.internal.database.mongodb import models
+from src.utils.logger.logger import Logger
+
+log = Logger("mongodb-database")
+
+OPTIONS = ("unique", "sparse", "partialFilterExpression")
+
+
+async def sync_indexes(database: AsyncIOMotorDatabase) -> None:
+    """
+    Builds the missing declared indexes and rebuilds the ones declared with other
+    options. A failed build is logged and the startup goes on with the indexes
+    that exist, an outdated index is dropped only once its replacement can build.
+    """
+    for model in models.INDEXED_MODELS:
+        collection = database[model.Settings.name]
+        declared: dict[str, IndexModel] = {
+            index.document["name"]: index
+            for index in getattr(model.Settings, "indexes", [])
+        }
+        existing = await collection.index_information()
+        existing.pop("_id_", None)
+
+        for index_name, info in existing.items():
+            if index_name not in declared:
+                log.warning(f"index {index_name} on {collection.name} is not declared")
+                continue
+
+            document = declared[index_name].document
+            if any(info.get(option) != document.get(option) for option in OPTIONS):
+                await _rebuild(collection, declared[index_name], info)
+
+        for index_name in declared.keys() - existing.keys():
+            log.info(f"building index {index_name} on {collection.name}")
+            await _build(collection, declared[index_name])
+
+
+async def _rebuild(
+    collection: AsyncIOMotorCollection, index: IndexModel, info: dict[str, Any]
+) -> None:
+    name = index.document["name"]
+    if index.document.get("unique") and await _has_duplicates(collection, index):
+        log.error(
+            f"keeping outdated index {name} on {collection.name}, "
+            "the collection has duplicate keys"
+        )
+        return
+
+    log.warning(f"rebuilding outdated index {name} on {collection.name}")
+    await collection.drop_index(name)
+    if await _build(collection, index):
+        return
+
+    # duplicates written since the check, the reads still need the old index
+    options = {option: info[option] for option in OPTIONS if option in info}
+    await _build(collection, IndexModel(info["key"], name=name, **options))
+
+
+async def _build(collection: AsyncIOMotorCollection, index: IndexModel) -> bool:
+    try:
+        await collection.create_indexes([index])
+    except OperationFailure as e:
+        log.error(
+            f"failed to build index {index.document['name']} "
+            f"on {collection.name}: {e}"
+        )
+        return False
+
+    return True
+
+
+async def _has_duplicates(
+    collection: AsyncIOMotorCollection, index: IndexModel
+) -> bool:
+    fields = list(index.document["key"])
+    pipeline: list[dict[str, Any]] = [
+        {"$match": index.document.get("partialFilterExpression", {})},
+        {
+            "$group": {
+                "_id": {str(i): f"${field}" for i, field in enumerate(fields)},
+                "count": {"$sum": 1},
+            }
+        },
+        {"$match": {"count": {"$gt": 1}}},
+        {"$limit": 1},
+    ]
+    return bool(await collection.aggregate(pipeline).to_list(1))
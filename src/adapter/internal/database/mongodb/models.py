@@ -1,22 +1,51 @@
+import datetime
 import re
-from typing import Any
+from typing import Annotated, Any
 
 import beanie as bn
 import bson
-from pydantic import ConfigDict, TypeAdapter, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+from pymongo import ASCENDING, IndexModel
 
 import src.domain.model as domain
 
+LIVE_DOCUMENT_FILTER = {"deleted_at": {"$type": "null"}}
+
+
+def class_id(model: type[bn.Document]) -> str:
+    """
+    Inheritance class id of a document, the same one `init_beanie` assigns.
+    """
+    return ".".join(
+        base.__name__
+        for base in reversed(model.__mro__)
+        if issubclass(base, bn.Document) and base is not bn.Document
+    )
+
+
+class Existence(BaseModel):
+    """
+    Projection of the fields an existence check needs.
+    """
+
+    id: domain.ObjectID = Field(alias="_id")
+    deleted_at: datetime.datetime | None = Field(default=None)
+
 
 class User(bn.Document, domain.User):
     class Settings:
-        indexes = ["id", "telegram_id"]
+        indexes = [
+            IndexModel([("telegram_id", ASCENDING)], unique=True),
+            IndexModel(
+                [("profile.username", ASCENDING)],
+                partialFilterExpression={"profile.username": {"$type": "string"}},
+            ),
+        ]
         name = "users"
 
 
 class Room(bn.Document, domain.Room):
     class Settings:
-        indexes = ["id"]
         name = "rooms"
 
 
@@ -60,17 +89,29 @@ class TextFormField(FormFieldDocument, domain.TextFormField):
 class ChoiceFormField(FormFieldDocument, domain.ChoiceFormField): ...
 
 
-type FormField = TextFormField | ChoiceFormField
+type FormField = Annotated[
+    TextFormField | ChoiceFormField,
+    Field(discriminator="kind"),
+]
 
 FormFieldResolver = TypeAdapter(
     FormField,
     config=ConfigDict(extra="ignore", from_attributes=True),
 )
 
+FORM_FIELD_MODELS: dict[domain.FormFieldKind, type[FormFieldDocument]] = {
+    domain.FormFieldKind.TEXT: TextFormField,
+    domain.FormFieldKind.CHOICE: ChoiceFormField,
+}
+
 
 class AnswerDocument(bn.Document):
     class Settings:
-        indexes = ["id"]
+        indexes = [
+            IndexModel([("respondent_id", ASCENDING), ("form_field_id", ASCENDING)]),
+            IndexModel([("form_field_id", ASCENDING)]),
+            IndexModel([("updated_at", ASCENDING)]),
+        ]
         name = "answers"
         is_root = True
 
@@ -81,13 +122,21 @@ class TextAnswer(AnswerDocument, domain.TextAnswer): ...
 class ChoiceAnswer(AnswerDocument, domain.ChoiceAnswer): ...
 
 
-type Answer = TextAnswer | ChoiceAnswer
+type Answer = Annotated[
+    TextAnswer | ChoiceAnswer,
+    Field(discriminator="kind"),
+]
 
 AnswerResolver = TypeAdapter(
     Answer,
     config=ConfigDict(extra="ignore", from_attributes=True),
 )
 
+ANSWER_MODELS: dict[domain.FormFieldKind, type[AnswerDocument]] = {
+    domain.FormFieldKind.TEXT: TextAnswer,
+    domain.FormFieldKind.CHOICE: ChoiceAnswer,
+}
+
 
 class AllocationDocument(bn.Document):
     class Settings:
@@ -116,25 +165,53 @@ class ClosedAllocation(AllocationDocument, domain.ClosedAllocation): ...
 class FailedAllocation(AllocationDocument, domain.FailedAllocation): ...
 
 
-type Allocation = (
+type Allocation = Annotated[
     CreatingAllocation
     | CreatedAllocation
     | OpenAllocation
     | RoomingAllocation
     | RoomedAllocation
     | ClosedAllocation
-    | FailedAllocation
-)
+    | FailedAllocation,
+    Field(discriminator="state"),
+]
 
 AllocationResolver = TypeAdapter(
     Allocation,
     config=ConfigDict(extra="ignore", from_attributes=True),
 )
 
+ALLOCATION_MODELS: dict[domain.AllocationState, type[AllocationDocument]] = {
+    domain.AllocationState.CREATING: CreatingAllocation,
+    domain.AllocationState.CREATED: CreatedAllocation,
+    domain.AllocationState.OPEN: OpenAllocation,
+    domain.AllocationState.ROOMING: RoomingAllocation,
+    domain.AllocationState.ROOMED: RoomedAllocation,
+    domain.AllocationState.CLOSED: ClosedAllocation,
+    domain.AllocationState.FAILED: FailedAllocation,
+}
+
+ALLOCATION_WITH_PARTICIPANTS = frozenset(
+    {
+        domain.AllocationState.CREATED,
+        domain.AllocationState.OPEN,
+        domain.AllocationState.ROOMING,
+        domain.AllocationState.ROOMED,
+        domain.AllocationState.CLOSED,
+    }
+)
+
 
 class ParticipantDocument(bn.Document):
     class Settings:
-        indexes = ["id"]
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("allocation_id", ASCENDING)]),
+            IndexModel(
+                [("allocation_id", ASCENDING), ("state", ASCENDING)],
+                partialFilterExpression=LIVE_DOCUMENT_FILTER,
+            ),
+            IndexModel([("updated_at", ASCENDING)]),
+        ]
         name = "participants"
         is_root = True
 
@@ -151,17 +228,51 @@ class ActiveParticipant(ParticipantDocument, domain.ActiveParticipant): ...
 class AllocatedParticipant(ParticipantDocument, domain.AllocatedParticipant): ...
 
 
-type Participant = (
-    CreatingParticipant | CreatedParticipant | ActiveParticipant | AllocatedParticipant
-)
+type Participant = Annotated[
+    CreatingParticipant | CreatedParticipant | ActiveParticipant | AllocatedParticipant,
+    Field(discriminator="state"),
+]
 
 ParticipantResolver = TypeAdapter(
     Participant,
     config=ConfigDict(extra="ignore", from_attributes=True),
 )
 
+PARTICIPANT_EXPORT_FIELDS = (
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "allocation_id",
+    "user_id",
+    "state",
+    "viewed_ids",
+    "subscription_ids",
+    "subscribers_ids",
+    "room_id",
+)
+
+PARTICIPANT_MODELS: dict[domain.ParticipantState, type[ParticipantDocument]] = {
+    domain.ParticipantState.CREATING: CreatingParticipant,
+    domain.ParticipantState.CREATED: CreatedParticipant,
+    domain.ParticipantState.ACTIVE: ActiveParticipant,
+    domain.ParticipantState.ALLOCATED: AllocatedParticipant,
+}
+
 
 class Preference(bn.Document, domain.Preference):
     class Settings:
-        indexes = ["id"]
+        indexes = [
+            IndexModel([("user_id", ASCENDING), ("target_id", ASCENDING)]),
+        ]
         name = "preferences"
+
+
+INDEXED_MODELS: tuple[type[bn.Document], ...] = (
+    User,
+    Room,
+    FormFieldDocument,
+    AnswerDocument,
+    AllocationDocument,
+    ParticipantDocument,
+    Preference,
+)
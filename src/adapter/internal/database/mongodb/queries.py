@@ -0,0 +1,357 @@
+"""
+Query and update documents shared by the MongoDB adapters.
+"""
+
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+import src.domain.exception.database as exception
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.database.mongodb import models
+from src.utils.logger.logger import Logger
+
+log = Logger("mongodb-database")
+
+
+def updated_window(
+    updated_since: datetime | None, updated_before: datetime | None
+) -> dict[str, Any]:
+    window: dict[str, datetime] = {}
+    if updated_since is not None:
+        window["$gte"] = updated_since
+    if updated_before is not None:
+        window["$lt"] = updated_before
+
+    return {"updated_at": window} if window else {}
+
+
+EXISTENCE_PROJECTION = {"_id": 1, "deleted_at": 1}
+
+
+def existence(
+    ids: list[domain.ObjectID], deleted_at: Mapping[domain.ObjectID, datetime | None]
+) -> dict[domain.ObjectID, proto.ExistenceState]:
+    """
+    Existence states of `ids` given the `deleted_at` of the documents found.
+    """
+    return {
+        id: (
+            proto.ExistenceState.MISSING
+            if id not in deleted_at
+            else (
+                proto.ExistenceState.ACTIVE
+                if deleted_at[id] is None
+                else proto.ExistenceState.DELETED
+            )
+        )
+        for id in ids
+    }
+
+
+def allocation_update(
+    source: proto.UpdateAllocation,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    query: dict[str, Any] = {"_id": source.id}
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.name is not None:
+        log.debug(f"updating name of allocation {source.id} to {source.name}")
+        update["$set"]["name"] = source.name
+
+    if source.due is not None:
+        log.debug(f"updating due of allocation {source.id} to {source.due}")
+        update["$set"]["due"] = source.due
+
+    if source.state is not None:
+        log.debug(f"updating state of allocation {source.id} to {source.state}")
+        update["$set"]["state"] = source.state
+        update["$set"]["_class_id"] = models.class_id(
+            models.ALLOCATION_MODELS[source.state]
+        )
+
+        if source.state in models.ALLOCATION_WITH_PARTICIPANTS:
+            update["$set"]["participants_ids"] = set()
+        else:
+            update["$unset"] = {"participants_ids": ""}
+
+    if source.form_fields_ids is not None:
+        log.debug(
+            f"updating form fields of allocation {source.id} to {source.form_fields_ids}"
+        )
+        update["$set"]["form_fields_ids"] = source.form_fields_ids
+
+    if source.editors_ids is not None:
+        log.debug(f"updating editors of allocation {source.id} to {source.editors_ids}")
+        update["$set"]["editors_ids"] = source.editors_ids
+
+    if source.participants_ids is not None:
+        if "$unset" in update:
+            raise exception.UpdateAllocationException(
+                f"can not change participant ids for document state {source.state}"
+            )
+
+        if source.state is None:
+            # the state check happens on the server within the same update
+            query["state"] = {"$in": list(models.ALLOCATION_WITH_PARTICIPANTS)}
+
+        log.debug(
+            f"updating participants of allocation {source.id} to {source.participants_ids}"
+        )
+        update["$set"]["participants_ids"] = source.participants_ids
+
+    return query, update
+
+
+def form_field_update(source: proto.UpdateFormField) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.required is not None:
+        log.debug(f"updating required of form field {source.id} to {source.required}")
+        update["$set"]["required"] = source.required
+
+    if source.frozen is not None:
+        log.debug(f"updating frozen of form field {source.id} to {source.frozen}")
+        update["$set"]["frozen"] = source.frozen
+
+    if source.question is not None:
+        log.debug(f"updating question of form field {source.id} to {source.question}")
+        update["$set"]["question"] = source.question
+
+    if source.question_entities is not None:
+        log.debug(
+            f"updating question entities of form field {source.id} to {source.question_entities}"
+        )
+        update["$set"]["question_entities"] = source.question_entities
+
+    if source.respondent_count is not None:
+        log.debug(
+            f"updating respondent count of form field {source.id} to {source.respondent_count}"
+        )
+        update["$set"]["respondent_count"] = source.respondent_count
+
+    if source.editors_ids is not None:
+        log.debug(f"updating editors of form field {source.id} to {source.editors_ids}")
+        update["$set"]["editors_ids"] = source.editors_ids
+
+    return update
+
+
+def text_form_field_update(
+    source: proto.UpdateTextFormField,
+) -> dict[str, Any]:
+    update = form_field_update(source)
+
+    if source.re is not None:
+        log.debug(f"updating re of form field {source.id} to {source.re}")
+        update["$set"]["re"] = models.re_pattern_to_bson_regex(source.re)
+
+    if source.ex is not None:
+        log.debug(f"updating ex of form field {source.id} to {source.ex}")
+        update["$set"]["ex"] = source.ex
+
+    return update
+
+
+def choice_form_field_update(
+    query: dict[str, Any],
+    source: proto.UpdateChoiceFormField,
+) -> dict[str, Any]:
+    update = form_field_update(source)
+
+    if source.options is not None:
+        for index, option in enumerate(source.options):
+            if option is None:
+                continue
+
+            # positional `$set` would pad the array with nulls
+            query[f"options.{index}"] = {"$exists": True}
+
+            if option.text is not None:
+                log.debug(
+                    f"updating text of option {index} of form field {source.id} to {option.text}"
+                )
+                update["$set"][f"options.{index}.text"] = option.text
+
+            if option.respondent_count is not None:
+                log.debug(
+                    f"updating respondent count of option {index} of"
+                    f" form field {source.id} to {option.respondent_count}"
+                )
+                update["$set"][
+                    f"options.{index}.respondent_count"
+                ] = option.respondent_count
+
+    if source.multiple is not None:
+        log.debug(f"updating multiple of form field {source.id} to {source.multiple}")
+        update["$set"]["multiple"] = source.multiple
+
+    return update
+
+
+def text_answer_update(source: proto.UpdateTextAnswer) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.text is not None:
+        log.debug(f"updating text of answer {source.id} to {source.text}")
+        update["$set"]["text"] = source.text
+
+    if source.text_entities is not None:
+        log.debug(
+            f"updating text entities of answer {source.id} to {source.text_entities}"
+        )
+        update["$set"]["text_entities"] = source.text_entities
+
+    return update
+
+
+def choice_answer_update(source: proto.UpdateChoiceAnswer) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.option_indexes is not None:
+        log.debug(
+            f"updating option indexes of answer {source.id} to {source.option_indexes}"
+        )
+        update["$set"]["option_indexes"] = source.option_indexes
+
+    return update
+
+
+def user_update(source: proto.UpdateUser) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.views is not None:
+        log.debug(f"updating views of user {source.id} to {source.views}")
+        update["$set"]["views"] = source.views
+
+    if source.profile is None:
+        log.debug(f"updating profile of user {source.id} to {source.profile}")
+        return update
+
+    if source.profile.first_name is not None:
+        log.debug(
+            f"updating first name of user {source.id} to {source.profile.first_name}"
+        )
+        update["$set"]["profile.first_name"] = source.profile.first_name
+
+    if source.profile.last_name is not None:
+        log.debug(
+            f"updating last name of user {source.id} to {source.profile.last_name}"
+        )
+        update["$set"]["profile.last_name"] = source.profile.last_name
+
+    if source.profile.username is not None:
+        log.debug(f"updating username of user {source.id} to {source.profile.username}")
+        update["$set"]["profile.username"] = source.profile.username
+
+    if source.profile.language_code is not None:
+        log.debug(
+            f"updating language code of user {source.id} to {source.profile.language_code}"
+        )
+        update["$set"]["profile.language_code"] = source.profile.language_code
+
+    if source.profile.gender is not None:
+        log.debug(f"updating gender of user {source.id} to {source.profile.gender}")
+        update["$set"]["profile.gender"] = source.profile.gender
+
+    if source.profile.birthdate is not None:
+        log.debug(
+            f"updating birthdate of user {source.id} to {source.profile.birthdate}"
+        )
+        update["$set"]["profile.birthdate"] = source.profile.birthdate
+
+    return update
+
+
+def room_update(source: proto.UpdateRoom) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.name is not None:
+        log.debug(f"updating name of room {source.id} to {source.name}")
+        update["$set"]["name"] = source.name
+
+    if source.capacity is not None:
+        log.debug(f"updating capacity of room {source.id} to {source.capacity}")
+        update["$set"]["capacity"] = source.capacity
+
+    if source.occupied is not None:
+        log.debug(f"updating occupied of room {source.id} to {source.occupied}")
+        update["$set"]["occupied"] = source.occupied
+
+    if source.gender_restriction is not None:
+        log.debug(
+            f"updating gender restriction of room {source.id} to {source.gender_restriction}"
+        )
+        update["$set"]["gender_restriction"] = source.gender_restriction
+
+    if source.editors_ids is not None:
+        log.debug(f"updating editors of room {source.id} to {source.editors_ids}")
+        update["$set"]["editors_ids"] = source.editors_ids
+
+    return update
+
+
+def participant_update(
+    source: proto.UpdateParticipant,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    query: dict[str, Any] = {"_id": source.id}
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.viewed_ids is not None:
+        log.debug(f"updating viewed of participant {source.id} to {source.viewed_ids}")
+        update["$set"]["viewed_ids"] = source.viewed_ids
+
+    if source.subscription_ids is not None:
+        log.debug(
+            f"updating subscriptions of participant {source.id} to {source.subscription_ids}"
+        )
+        update["$set"]["subscription_ids"] = source.subscription_ids
+
+    if source.subscribers_ids is not None:
+        log.debug(
+            f"updating subscribers of participant {source.id} to {source.subscribers_ids}"
+        )
+        update["$set"]["subscribers_ids"] = source.subscribers_ids
+
+    if source.state is not None:
+        log.debug(f"updating state of participant {source.id} to {source.state}")
+        update["$set"]["state"] = source.state
+        update["$set"]["_class_id"] = models.class_id(
+            models.PARTICIPANT_MODELS[source.state]
+        )
+
+        if source.state != domain.ParticipantState.ALLOCATED:
+            update["$unset"] = {"room_id": ""}
+        elif source.room_id is None:
+            # keeps the room of an allocated participant, others have none
+            query["room_id"] = {"$exists": True}
+
+    if source.room_id is not None:
+        if source.state is None:
+            # the state check happens on the server within the same update
+            query["state"] = domain.ParticipantState.ALLOCATED
+        elif source.state != domain.ParticipantState.ALLOCATED:
+            log.error(f"can not change room id for participant state {source.state}")
+            raise exception.UpdateParticipantException(
+                f"can not change room id for participant state {source.state}"
+            )
+
+        log.debug(f"updating room of participant {source.id} to {source.room_id}")
+        update["$set"]["room_id"] = source.room_id
+
+    return query, update
+
+
+def preference_update(source: proto.UpdatePreference) -> dict[str, Any]:
+    update: dict[str, Any] = {"$set": {}}
+
+    if source.kind is not None:
+        log.debug(f"updating kind of preference {source.id} to {source.kind}")
+        update["$set"]["kind"] = source.kind
+
+    if source.status is not None:
+        log.debug(f"updating status of preference {source.id} to {source.status}")
+        update["$set"]["status"] = source.status
+
+    return update
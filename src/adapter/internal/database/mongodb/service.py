@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -8,8 +9,7 @@ from pydantic import ValidationError
 import src.domain.exception.database as exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.adapter.internal.database.mongodb import models
-from src.domain.model.allocation import AllocationState
+from src.adapter.internal.database.mongodb import indexes, models, queries
 from src.utils.logger.logger import Logger
 
 log = Logger("mongodb-database")
@@ -32,6 +32,7 @@ class MongoDBAdapter(
         self = cls()
         self._client = AsyncIOMotorClient(dsn, **client_args)
 
+        await indexes.sync_indexes(self._client.randorm)
         await bn.init_beanie(
             self._client.randorm,
             document_models=[
@@ -58,6 +59,8 @@ class MongoDBAdapter(
                 models.TextFormField,
                 models.User,
             ],
+            # built by sync_indexes, a failed build does not stop the startup
+            skip_indexes=True,
         )
 
         return self
@@ -132,24 +135,15 @@ class MongoDBAdapter(
     ) -> domain.Allocation:
         try:
             log.debug(f"updating allocation {allocation.id}")
-            document: models.Allocation | None = await models.AllocationDocument.get(
-                allocation.id,
-                with_children=True,
-            )  # type: ignore
-            assert document is not None, "document not found"
-            log.info(f"allocation {allocation.id} fetched")
+            query, update = queries.allocation_update(allocation)
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
 
-            document = self.__update_allocation(document, allocation)
-            document.updated_at = datetime.now().replace(microsecond=0)
-
-            log.debug(f"replacing allocation {allocation.id}")
-            # todo: replace with new `.replace` call
-            # todo: tracking issue https://github.com/BeanieODM/beanie/issues/955
-            await models.AllocationDocument.find_one(
-                models.AllocationDocument.id == document.id,
+            log.debug(f"applying update to allocation {allocation.id}")
+            document = await models.AllocationDocument.find_one(
+                query,
                 with_children=True,
-            ).replace_one(document)
-            await document.sync()
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
+            assert document is not None, "document not found"
 
             log.info(f"updated allocation {allocation.id}")
             return domain.AllocationResolver.validate_python(
@@ -169,74 +163,6 @@ class MongoDBAdapter(
                 f"failed to update allocation with id {allocation.id} with error: {e}"
             ) from e
 
-    def __update_allocation(
-        self, document: models.Allocation, source: proto.UpdateAllocation
-    ) -> models.Allocation:
-        data = document.model_dump(by_alias=True)
-
-        if source.name is not None:
-            log.debug(f"updating name of allocation {document.id} to {source.name}")
-            data["name"] = source.name
-
-        if source.due is not None:
-            log.debug(f"updating due of allocation {document.id} to {source.due}")
-            data["due"] = source.due
-
-        match source.state:
-            case None:
-                ...
-
-            case AllocationState.CREATING | AllocationState.FAILED:
-                log.debug(
-                    f"updating state of allocation {document.id} to {source.state}"
-                )
-                data["state"] = source.state
-                del data["participants_ids"]
-
-            case (
-                AllocationState.CREATED
-                | AllocationState.OPEN
-                | AllocationState.ROOMING
-                | AllocationState.ROOMED
-                | AllocationState.CLOSED
-            ):
-                log.debug(
-                    f"updating state of allocation {document.id} to {source.state}"
-                )
-                data["state"] = source.state
-                data["participants_ids"] = set()
-
-        if source.form_fields_ids is not None:
-            log.debug(
-                f"updating form fields of allocation {document.id} to {source.form_fields_ids}"
-            )
-            data["form_fields_ids"] = source.form_fields_ids
-
-        if source.editors_ids is not None:
-            log.debug(
-                f"updating editors of allocation {document.id} to {source.editors_ids}"
-            )
-            data["editors_ids"] = source.editors_ids
-
-        if source.participants_ids is not None:
-            if data["state"] not in [
-                AllocationState.CREATED,
-                AllocationState.OPEN,
-                AllocationState.ROOMING,
-                AllocationState.ROOMED,
-                AllocationState.CLOSED,
-            ]:
-                raise exception.UpdateAllocationException(
-                    f"can not change participant ids for document state {data['state']}"
-                )
-
-            log.debug(
-                f"updating participants of allocation {document.id} to {source.participants_ids}"
-            )
-            data["participants_ids"] = source.participants_ids
-
-        return models.AllocationResolver.validate_python(data, from_attributes=True)
-
     async def delete_allocation(
         self,
         allocation: proto.DeleteAllocation,
@@ -251,6 +177,7 @@ class MongoDBAdapter(
             log.info(f"allocation {allocation.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing allocation {allocation.id}")
             document = await document.replace()
             assert document is not None, "document replacement failed"
@@ -304,6 +231,32 @@ class MongoDBAdapter(
                 f"failed to read allocations with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_allocations(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking allocations existence {ids}")
+            documents = await models.AllocationDocument.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked allocations existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check allocations existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadAllocationException(
+                f"failed to check allocations existence with ids {ids} with error: {e}"
+            ) from e
+
     async def create_form_field(
         self,
         form_field: proto.CreateFormField,
@@ -369,34 +322,26 @@ class MongoDBAdapter(
     ) -> domain.FormField:
         try:
             log.debug(f"updating form field {form_field.id}")
-            document: models.FormField | None = await models.FormFieldDocument.get(
-                form_field.id,
-                with_children=True,
-            )  # type: ignore
-            assert document is not None, "document not found"
+            query: dict[str, Any] = {"_id": form_field.id}
 
             if isinstance(form_field, proto.UpdateTextFormField):
                 log.debug("updating text form field")
-                assert isinstance(
-                    document, models.TextFormField
-                ), "can not change form field type"
-
-                document = self.__update_text_form_field(document, form_field)
+                query["kind"] = domain.FormFieldKind.TEXT
+                update = queries.text_form_field_update(form_field)
             elif isinstance(form_field, proto.UpdateChoiceFormField):
                 log.debug("updating choice form field")
-                assert isinstance(
-                    document, models.ChoiceFormField
-                ), "can not change form field type"
-
-                document = self.__update_choice_form_field(document, form_field)
-
-            document.updated_at = datetime.now().replace(microsecond=0)
-            log.debug(f"replacing form field {form_field.id}")
-            await models.FormFieldDocument.find_one(
-                models.FormFieldDocument.id == document.id,
+                query["kind"] = domain.FormFieldKind.CHOICE
+                update = queries.choice_form_field_update(query, form_field)
+            else:
+                raise AttributeError("can not resolve form field type")
+
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
+            log.debug(f"applying update to form field {form_field.id}")
+            document = await models.FormFieldDocument.find_one(
+                query,
                 with_children=True,
-            ).replace_one(document)
-            await document.sync()
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
+            assert document is not None, "document not found or type mismatch"
 
             log.info(f"updated form field {form_field.id}")
             return domain.FormFieldResolver.validate_python(
@@ -419,95 +364,6 @@ class MongoDBAdapter(
                 f"failed to update form field with id {form_field.id} with error: {e}"
             ) from e
 
-    def __update_form_field(
-        self,
-        document: models.FormField,
-        source: proto.UpdateFormField,
-    ):
-        if source.required is not None:
-            log.debug(
-                f"updating required of form field {document.id} to {source.required}"
-            )
-            document.required = source.required
-
-        if source.frozen is not None:
-            log.debug(f"updating frozen of form field {document.id} to {source.frozen}")
-            document.frozen = source.frozen
-
-        if source.question is not None:
-            log.debug(
-                f"updating question of form field {document.id} to {source.question}"
-            )
-            document.question = source.question
-
-        if source.question_entities is not None:
-            log.debug(
-                f"updating question entities of form field {document.id} to {source.question_entities}"
-            )
-            document.question_entities = source.question_entities
-
-        if source.respondent_count is not None:
-            log.debug(
-                f"updating respondent count of form field {document.id} to {source.respondent_count}"
-            )
-            document.respondent_count = source.respondent_count
-
-        if source.editors_ids is not None:
-            log.debug(
-                f"updating editors of form field {document.id} to {source.editors_ids}"
-            )
-            document.editors_ids = source.editors_ids
-
-    def __update_text_form_field(
-        self,
-        document: models.TextFormField,
-        source: proto.UpdateTextFormField,
-    ) -> models.TextFormField:
-        self.__update_form_field(document, source)
-
-        if source.re is not None:
-            log.debug(f"updating re of form field {document.id} to {source.re}")
-            document.re = source.re
-
-        if source.ex is not None:
-            log.debug(f"updating ex of form field {document.id} to {source.ex}")
-            document.ex = source.ex
-
-        return document
-
-    def __update_choice_form_field(
-        self,
-        document: models.ChoiceFormField,
-        source: proto.UpdateChoiceFormField,
-    ) -> models.ChoiceFormField:
-        self.__update_form_field(document, source)
-
-        if source.options is not None:
-            for index, option in enumerate(source.options):
-                if option is None:
-                    continue
-
-                if option.text is not None:
-                    log.debug(
-                        f"updating text of option {index} of form field {document.id} to {option.text}"
-                    )
-                    document.options[index].text = option.text
-
-                if option.respondent_count is not None:
-                    log.debug(
-                        f"updating respondent count of option {index} of"
-                        f" form field {document.id} to {option.respondent_count}"
-                    )
-                    document.options[index].respondent_count = option.respondent_count
-
-        if source.multiple is not None:
-            log.debug(
-                f"updating multiple of form field {document.id} to {source.multiple}"
-            )
-            document.multiple = source.multiple
-
-        return document
-
     async def read_many_form_fields(
         self,
         form_fields: list[proto.ReadFormField],
@@ -542,6 +398,32 @@ class MongoDBAdapter(
                 f"failed to read form fields with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_form_fields(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking form fields existence {ids}")
+            documents = await models.FormFieldDocument.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked form fields existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check form fields existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadFormFieldException(
+                f"failed to check form fields existence with ids {ids} with error: {e}"
+            ) from e
+
     async def delete_form_field(
         self,
         form_field: proto.DeleteFormField,
@@ -556,6 +438,7 @@ class MongoDBAdapter(
             log.info(f"form field {form_field.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing form field {form_field.id}")
             document = await document.replace()
 
@@ -640,31 +523,26 @@ class MongoDBAdapter(
     ) -> domain.Answer:
         try:
             log.debug(f"updating answer {answer.id}")
-            document: models.Answer | None = await models.AnswerDocument.get(
-                answer.id,
-                with_children=True,
-            )  # type: ignore
-
-            assert document is not None, "document not found"
-            log.info(f"answer {answer.id} fetched")
+            query: dict[str, Any] = {"_id": answer.id}
 
             if isinstance(answer, proto.UpdateTextAnswer):
-                assert isinstance(
-                    document, models.TextAnswer
-                ), "can not change answer type"
-
-                document = self.__update_text_answer(document, answer)
+                query["kind"] = domain.FormFieldKind.TEXT
+                update = queries.text_answer_update(answer)
             elif isinstance(answer, proto.UpdateChoiceAnswer):
-                assert isinstance(
-                    document, models.ChoiceAnswer
-                ), "can not change answer type"
-
-                document = self.__update_choice_answer(document, answer)
-
-            document.updated_at = datetime.now().replace(microsecond=0)
-            log.debug(f"replacing answer {answer.id}")
-            document = await document.replace()
+                query["kind"] = domain.FormFieldKind.CHOICE
+                update = queries.choice_answer_update(answer)
+            else:
+                raise AttributeError("can not resolve answer type")
+
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
+            log.debug(f"applying update to answer {answer.id}")
+            document = await models.AnswerDocument.find_one(
+                query,
+                with_children=True,
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
+            assert document is not None, "document not found or type mismatch"
 
+            log.info(f"updated answer {answer.id}")
             return domain.AnswerResolver.validate_python(document)
 
         except exception.UpdateAnswerException as e:
@@ -681,36 +559,6 @@ class MongoDBAdapter(
                 f"failed to update answer with id {answer.id} with error: {e}"
             ) from e
 
-    def __update_text_answer(
-        self,
-        document: models.TextAnswer,
-        source: proto.UpdateTextAnswer,
-    ) -> models.TextAnswer:
-        if source.text is not None:
-            log.debug(f"updating text of answer {document.id} to {source.text}")
-            document.text = source.text
-
-        if source.text_entities is not None:
-            log.debug(
-                f"updating text entities of answer {document.id} to {source.text_entities}"
-            )
-            document.text_entities = source.text_entities
-
-        return document
-
-    def __update_choice_answer(
-        self,
-        document: models.ChoiceAnswer,
-        source: proto.UpdateChoiceAnswer,
-    ) -> models.ChoiceAnswer:
-        if source.option_indexes is not None:
-            log.debug(
-                f"updating option indexes of answer {document.id} to {source.option_indexes}"
-            )
-            document.option_indexes = source.option_indexes
-
-        return document
-
     async def delete_answer(
         self,
         answer: proto.DeleteAnswer,
@@ -725,6 +573,7 @@ class MongoDBAdapter(
             log.info(f"answer {answer.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing answer {answer.id}")
             document = await document.replace()
 
@@ -775,6 +624,30 @@ class MongoDBAdapter(
                 f"failed to read answers with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_answers(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking answers existence {ids}")
+            documents = await models.AnswerDocument.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked answers existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check answers existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadAnswerException(
+                f"failed to check answers existence with ids {ids} with error: {e}"
+            ) from e
+
     async def read_all_answers(self) -> list[domain.Answer]:
         try:
             log.debug("reading all answers")
@@ -797,6 +670,60 @@ class MongoDBAdapter(
                 f"failed to read all answers with error: {e}"
             ) from e
 
+    async def read_answers_by_respondents(
+        self, respondent_ids: list[domain.ObjectID]
+    ) -> list[domain.Answer]:
+        try:
+            log.debug(
+                f"reading answers of respondents {list(map(str, respondent_ids))}"
+            )
+            documents = await models.AnswerDocument.find_many(
+                {"respondent_id": {"$in": list(respondent_ids)}}, with_children=True
+            ).to_list()
+            log.info(f"read {len(documents)} answers")
+            return [
+                domain.AnswerResolver.validate_python(document)
+                for document in documents
+            ]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read answers by respondents with error: {}", e)
+            raise exception.ReadAnswerException(
+                f"failed to read answers by respondents with error: {e}"
+            ) from e
+
+    async def iter_answers(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Answer]:
+        try:
+            log.debug(
+                f"iterating answers updated in [{updated_since}, {updated_before}) in batches of {batch_size}"
+            )
+            cursor = models.AnswerDocument.find_many(
+                queries.updated_window(updated_since, updated_before),
+                with_children=True,
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield domain.AnswerResolver.validate_python(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate answers with error: {}", e)
+            raise exception.ReadAnswerException(
+                f"failed to iterate answers with error: {e}"
+            ) from e
+
     async def create_user(
         self,
         user: proto.CreateUser,
@@ -888,17 +815,16 @@ class MongoDBAdapter(
     ) -> domain.User:
         try:
             log.debug(f"updating user {user.id}")
-            document = await models.User.get(
-                user.id,
+            update = queries.user_update(user)
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
+
+            log.debug(f"applying update to user {user.id}")
+            document = await models.User.find_one(
+                {"_id": user.id},
                 with_children=True,
-            )
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
             assert document is not None, "document not found"
-            log.info(f"user {user.id} fetched")
 
-            document = self.__update_user(document, user)
-            log.debug(f"replacing user {user.id}")
-            document.updated_at = datetime.now().replace(microsecond=0)
-            document = await document.replace()
             log.info(f"updated user {user.id}")
             return domain.User.model_validate(document, from_attributes=True)
 
@@ -916,57 +842,6 @@ class MongoDBAdapter(
                 f"failed to update user with id {user.id} with error: ", e
             ) from e
 
-    def __update_user(
-        self,
-        document: models.User,
-        source: proto.UpdateUser,
-    ) -> models.User:
-        if source.views is not None:
-            log.debug(f"updating views of user {document.id} to {source.views}")
-            document.views = source.views
-
-        if source.profile is None:
-            log.debug(f"updating profile of user {document.id} to {source.profile}")
-            return document
-
-        if source.profile.first_name is not None:
-            log.debug(
-                f"updating first name of user {document.id} to {source.profile.first_name}"
-            )
-            document.profile.first_name = source.profile.first_name
-
-        if source.profile.last_name is not None:
-            log.debug(
-                f"updating last name of user {document.id} to {source.profile.last_name}"
-            )
-            document.profile.last_name = source.profile.last_name
-
-        if source.profile.username is not None:
-            log.debug(
-                f"updating username of user {document.id} to {source.profile.username}"
-            )
-            document.profile.username = source.profile.username
-
-        if source.profile.language_code is not None:
-            log.debug(
-                f"updating language code of user {document.id} to {source.profile.language_code}"
-            )
-            document.profile.language_code = source.profile.language_code
-
-        if source.profile.gender is not None:
-            log.debug(
-                f"updating gender of user {document.id} to {source.profile.gender}"
-            )
-            document.profile.gender = source.profile.gender
-
-        if source.profile.birthdate is not None:
-            log.debug(
-                f"updating birthdate of user {document.id} to {source.profile.birthdate}"
-            )
-            document.profile.birthdate = source.profile.birthdate
-
-        return document
-
     async def delete_user(
         self,
         user: proto.DeleteUser,
@@ -981,6 +856,7 @@ class MongoDBAdapter(
             log.info(f"user {user.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing user {user.id}")
             document = await document.replace()
 
@@ -1031,6 +907,30 @@ class MongoDBAdapter(
                 f"failed to read users with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_users(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking users existence {ids}")
+            documents = await models.User.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked users existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check users existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadUserException(
+                f"failed to check users existence with ids {ids} with error: {e}"
+            ) from e
+
     async def create_room(
         self,
         room: proto.CreateRoom,
@@ -1091,17 +991,15 @@ class MongoDBAdapter(
     ) -> domain.Room:
         try:
             log.debug(f"updating room {room.id}")
-            document = await models.Room.get(
-                room.id,
+            update = queries.room_update(room)
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
+
+            log.debug(f"applying update to room {room.id}")
+            document = await models.Room.find_one(
+                {"_id": room.id},
                 with_children=True,
-            )
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
             assert document is not None, "document not found"
-            log.info(f"room {room.id} fetched")
-
-            document = self.__update_room(document, room)
-            log.debug(f"replacing room {room.id}")
-            document.updated_at = datetime.now().replace(microsecond=0)
-            document = await document.replace()
             log.info(f"updated room {room.id}")
 
             return domain.Room.model_validate(document, from_attributes=True)
@@ -1119,35 +1017,6 @@ class MongoDBAdapter(
                 f"failed to update room with id {room.id} with error: {e}"
             ) from e
 
-    def __update_room(
-        self,
-        document: models.Room,
-        source: proto.UpdateRoom,
-    ) -> models.Room:
-        if source.name is not None:
-            log.debug(f"updating name of room {document.id} to {source.name}")
-            document.name = source.name
-
-        if source.capacity is not None:
-            log.debug(f"updating capacity of room {document.id} to {source.capacity}")
-            document.capacity = source.capacity
-
-        if source.occupied is not None:
-            log.debug(f"updating occupied of room {document.id} to {source.occupied}")
-            document.occupied = source.occupied
-
-        if source.gender_restriction is not None:
-            log.debug(
-                f"updating gender restriction of room {document.id} to {source.gender_restriction}"
-            )
-            document.gender_restriction = source.gender_restriction
-
-        if source.editors_ids is not None:
-            log.debug(f"updating editors of room {document.id} to {source.editors_ids}")
-            document.editors_ids = source.editors_ids
-
-        return document
-
     async def delete_room(
         self,
         room: proto.DeleteRoom,
@@ -1163,6 +1032,7 @@ class MongoDBAdapter(
 
             log.debug(f"replacing room {room.id}")
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             document = await document.replace()
             log.info(f"deleted room {room.id}")
 
@@ -1212,6 +1082,30 @@ class MongoDBAdapter(
                 f"failed to read rooms with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_rooms(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking rooms existence {ids}")
+            documents = await models.Room.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked rooms existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check rooms existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadRoomException(
+                f"failed to check rooms existence with ids {ids} with error: {e}"
+            ) from e
+
     async def create_participant(
         self, participant: proto.CreateParticipant
     ) -> domain.Participant:
@@ -1282,21 +1176,15 @@ class MongoDBAdapter(
     ) -> domain.Participant:
         try:
             log.debug(f"updating participant {participant.id}")
-            document: models.Participant | None = await models.ParticipantDocument.get(
-                participant.id,
-                with_children=True,
-            )  # type: ignore
-            assert document is not None, "document not found"
-            log.info(f"participant {participant.id} fetched")
+            query, update = queries.participant_update(participant)
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
 
-            document = self.__update_participant(document, participant)
-            log.debug(f"replacing participant {participant.id}")
-            document.updated_at = datetime.now().replace(microsecond=0)
-            await models.ParticipantDocument.find_one(
-                models.ParticipantDocument.id == document.id,
+            log.debug(f"applying update to participant {participant.id}")
+            document = await models.ParticipantDocument.find_one(
+                query,
                 with_children=True,
-            ).replace_one(document)
-            await document.sync()
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
+            assert document is not None, "document not found"
             log.info(f"updated participant {participant.id}")
 
             return domain.ParticipantResolver.validate_python(
@@ -1321,49 +1209,6 @@ class MongoDBAdapter(
                 f"failed to update participant with id {participant.id} with error: {e}"
             ) from e
 
-    def __update_participant(
-        self,
-        document: models.Participant,
-        source: proto.UpdateParticipant,
-    ) -> models.Participant:
-        if source.viewed_ids is not None:
-            log.debug(
-                f"updating viewed of participant {document.id} to {source.viewed_ids}"
-            )
-            document.viewed_ids = source.viewed_ids
-
-        if source.subscription_ids is not None:
-            log.debug(
-                f"updating subscriptions of participant {document.id} to {source.subscription_ids}"
-            )
-            document.subscription_ids = source.subscription_ids
-
-        if source.subscribers_ids is not None:
-            log.debug(
-                f"updating subscribers of participant {document.id} to {source.subscribers_ids}"
-            )
-            document.subscribers_ids = source.subscribers_ids
-
-        if source.state is not None:
-            log.debug(f"updating state of participant {document.id} to {source.state}")
-            data = document.model_dump(by_alias=True)
-            data["state"] = source.state
-            document = models.ParticipantResolver.validate_python(data)
-
-        if source.room_id is not None:
-            if document.state not in [domain.ParticipantState.ALLOCATED]:
-                log.error(
-                    f"can not change room id for participant state {document.state}"
-                )
-                raise exception.UpdateParticipantException(
-                    f"can not change room id for participant state {document.state}"
-                )
-
-            log.debug(f"updating room of participant {document.id} to {source.room_id}")
-            document.room_id = source.room_id  # type: ignore
-
-        return document
-
     async def delete_participant(
         self, participant: proto.DeleteParticipant
     ) -> domain.Participant:
@@ -1377,6 +1222,7 @@ class MongoDBAdapter(
             log.info(f"participant {participant.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing participant {participant.id}")
             document = await document.replace()
             assert document is not None, "document replacement failed"
@@ -1435,6 +1281,32 @@ class MongoDBAdapter(
                 f"failed to read participants with ids {ids} with error: {e}"
             ) from e
 
+    async def exists_many_participants(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking participants existence {ids}")
+            documents = await models.ParticipantDocument.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked participants existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check participants existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadParticipantException(
+                f"failed to check participants existence with ids {ids} with error: {e}"
+            ) from e
+
     async def read_all_participants(self) -> list[domain.Participant]:
         try:
             log.debug("reading all participants")
@@ -1458,6 +1330,156 @@ class MongoDBAdapter(
                 f"failed to read all participants with error: {e}"
             ) from e
 
+    async def find_participant(
+        self, participant: proto.FindParticipant
+    ) -> domain.Participant | None:
+        try:
+            log.debug(
+                f"finding participant for user {participant.user_id} and allocation {participant.allocation_id}"
+            )
+            document = await models.ParticipantDocument.find_one(
+                {
+                    "user_id": participant.user_id,
+                    "allocation_id": participant.allocation_id,
+                    **models.LIVE_DOCUMENT_FILTER,
+                },
+                with_children=True,
+            )
+            if document is None:
+                log.info("participant not found")
+                return None
+
+            log.info(f"found participant {document.id}")
+            return domain.ParticipantResolver.validate_python(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to find participant with error: {}", e)
+            raise exception.FindParticipantException(
+                f"failed to find participant with error: {e}"
+            ) from e
+
+    async def sample_participants(
+        self, participants: proto.SampleParticipants
+    ) -> list[domain.Participant]:
+        try:
+            log.debug(
+                f"sampling {participants.size} participants of allocation {participants.allocation_id}"
+            )
+            documents = (
+                await models.ParticipantDocument.find(
+                    {
+                        "allocation_id": participants.allocation_id,
+                        "state": domain.ParticipantState.ACTIVE,
+                        "user_id": {"$ne": participants.excluded_user_id},
+                        "_id": {"$nin": list(participants.excluded_ids)},
+                        **models.LIVE_DOCUMENT_FILTER,
+                    },
+                    with_children=True,
+                )
+                .aggregate([{"$sample": {"size": participants.size}}])
+                .to_list()
+            )
+
+            log.info(f"sampled {len(documents)} participants")
+            return [
+                domain.ParticipantResolver.validate_python(document)
+                for document in documents
+            ]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to sample participants with error: {}", e)
+            raise exception.FindParticipantException(
+                f"failed to sample participants with error: {e}"
+            ) from e
+
+    async def iter_participants(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Participant]:
+        try:
+            log.debug(
+                f"iterating participants updated in [{updated_since}, {updated_before}) in batches of {batch_size}"
+            )
+            cursor = models.ParticipantDocument.find_many(
+                queries.updated_window(updated_since, updated_before),
+                with_children=True,
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield domain.ParticipantResolver.validate_python(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
+    async def iter_participants_with_gender(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[tuple[domain.Participant, domain.Gender | None]]:
+        try:
+            log.debug(
+                f"iterating participants with gender updated in [{updated_since}, {updated_before})"
+            )
+            cursor = models.ParticipantDocument.find(
+                queries.updated_window(updated_since, updated_before),
+                with_children=True,
+            ).aggregate(
+                [
+                    {
+                        "$lookup": {
+                            "from": models.User.Settings.name,
+                            "localField": "user_id",
+                            "foreignField": "_id",
+                            "pipeline": [
+                                {"$project": {"_id": 0, "gender": "$profile.gender"}}
+                            ],
+                            "as": "user",
+                        }
+                    },
+                    {
+                        "$project": {
+                            **dict.fromkeys(models.PARTICIPANT_EXPORT_FIELDS, 1),
+                            "gender": {"$arrayElemAt": ["$user.gender", 0]},
+                        }
+                    },
+                ],
+                batchSize=batch_size,
+            )
+            async for document in cursor:
+                gender = document.pop("gender", None)
+                yield (
+                    domain.ParticipantResolver.validate_python(document),
+                    domain.Gender(gender) if gender is not None else None,
+                )
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
     async def create_preference(
         self, preference: proto.CreatePreference
     ) -> domain.Preference:
@@ -1546,20 +1568,14 @@ class MongoDBAdapter(
     ) -> domain.Preference:
         try:
             log.debug(f"updating preference {preference.id}")
-            document: models.Preference | None = await models.Preference.get(
-                preference.id
-            )
-            assert document is not None, "document not found"
-            log.info(f"preference {preference.id} fetched")
+            update = queries.preference_update(preference)
+            update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
 
-            document = self.__update_preference(document, preference)
-            log.debug(f"replacing preference {preference.id}")
-            document.updated_at = datetime.now().replace(microsecond=0)
-            await models.Preference.find_one(
-                models.Preference.id == document.id,
-                with_children=True,
-            ).replace_one(document)
-            await document.sync()
+            log.debug(f"applying update to preference {preference.id}")
+            document = await models.Preference.find_one(
+                {"_id": preference.id},
+            ).update(update, response_type=bn.UpdateResponse.NEW_DOCUMENT)
+            assert document is not None, "document not found"
             log.info(f"updated preference {preference.id}")
 
             return domain.Preference.model_validate(document)
@@ -1581,21 +1597,6 @@ class MongoDBAdapter(
                 f"failed to update preference with id {preference.id} with error: {e}"
             ) from e
 
-    def __update_preference(
-        self,
-        document: models.Preference,
-        source: proto.UpdatePreference,
-    ) -> models.Preference:
-        if source.kind is not None:
-            log.debug(f"updating kind of preference {document.id} to {source.kind}")
-            document.kind = source.kind
-
-        if source.status is not None:
-            log.debug(f"updating status of preference {document.id} to {source.status}")
-            document.status = source.status
-
-        return document
-
     async def delete_preference(
         self,
         preference: proto.DeletePreference,
@@ -1609,6 +1610,7 @@ class MongoDBAdapter(
             log.info(f"preference {preference.id} fetched")
 
             document.deleted_at = datetime.now().replace(microsecond=0)
+            document.updated_at = document.deleted_at
             log.debug(f"replacing preference {preference.id}")
             document = await document.replace()
             assert document is not None, "document replacement failed"
@@ -1663,3 +1665,29 @@ class MongoDBAdapter(
             raise exception.ReadPreferenceException(
                 f"failed to read preferences with ids {ids} with error: {e}"
             ) from e
+
+    async def exists_many_preferences(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking preferences existence {ids}")
+            documents = await models.Preference.find_many(
+                {"_id": {"$in": ids}},
+                projection_model=models.Existence,
+                with_children=True,
+            ).to_list()
+            log.info(f"checked preferences existence {ids}")
+
+            return queries.existence(
+                ids, {document.id: document.deleted_at for document in documents}
+            )
+        except Exception as e:
+            log.error(
+                "failed to check preferences existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadPreferenceException(
+                f"failed to check preferences existence with ids {ids} with error: {e}"
+            ) from e
@@ -0,0 +1,5 @@
+"""
+MotorDB adapter
+"""
+
+from src.adapter.internal.database.motordb import codec, decode, service
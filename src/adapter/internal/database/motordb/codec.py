@@ -0,0 +1,80 @@
+"""
+BSON codec of the Motor adapter.
+Documents are read as `RawBSONDocument` and validated into domain models directly.
+"""
+
+import datetime
+import re
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any
+
+import bson
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
+from bson.raw_bson import RawBSONDocument
+from pydantic import AnyUrl, BaseModel
+
+from src.adapter.internal.database.mongodb import models
+
+
+class RegexDecoder(TypeDecoder):
+    bson_type = bson.Regex
+
+    def transform_bson(self, value: bson.Regex) -> re.Pattern:
+        return value.try_compile()
+
+
+def fallback_encoder(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_document(value)
+
+    if isinstance(value, set | frozenset):
+        return list(value)
+
+    if isinstance(value, AnyUrl):
+        return str(value)
+
+    if isinstance(value, Enum):
+        return value.value
+
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time.min)
+
+    return value
+
+
+CODEC_OPTIONS = CodecOptions(
+    document_class=RawBSONDocument,
+    type_registry=TypeRegistry([RegexDecoder()], fallback_encoder=fallback_encoder),
+)
+
+# plain dicts are cheaper to read field by field than `RawBSONDocument`
+INFLATE_CODEC_OPTIONS = CODEC_OPTIONS.with_options(document_class=dict)
+
+
+def inflate(document: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Decodes the whole raw document into plain dicts at once.
+    """
+    if isinstance(document, RawBSONDocument):
+        return bson.decode(document.raw, INFLATE_CODEC_OPTIONS)
+
+    return dict(document)
+
+
+def to_document(model: BaseModel, class_id: str | None = None) -> dict[str, Any]:
+    """
+    Shallow BSON document of the model, nested values are encoded on write.
+    """
+    document: dict[str, Any] = {}
+    for name, field in type(model).model_fields.items():
+        value = getattr(model, name)
+        if isinstance(value, re.Pattern):
+            value = models.re_pattern_to_bson_regex(value)
+
+        document[field.alias or name] = value
+
+    if class_id is not None:
+        document["_class_id"] = class_id
+
+    return document
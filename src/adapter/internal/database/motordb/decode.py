@@ -0,0 +1,168 @@
+"""
+Decoding of stored documents into domain models.
+Documents were validated on write, so they can be constructed without a second validation.
+"""
+
+import datetime
+import functools
+import re
+import types
+from collections.abc import Callable, Mapping
+from enum import Enum, StrEnum
+from typing import Annotated, Any, Literal, TypeAliasType, Union, get_args, get_origin
+
+import bson
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+import src.domain.model as domain
+from src.adapter.internal.database.motordb import codec
+
+type Converter = Callable[[Any], Any]
+
+
+class DecodeMode(StrEnum):
+    VALIDATE = "validate"  # full pydantic validation
+    TRUSTED = "trusted"  # construction without validation
+    VERIFY = "verify"  # trusted construction cross-checked against validation
+
+
+class Decoder[T]:
+    def __init__(
+        self,
+        annotation: Any,
+        validate: Callable[[Any], T],
+        mode: DecodeMode = DecodeMode.VALIDATE,
+    ):
+        self._mode = mode
+        self._validate = validate
+        self._construct: Converter = converter(annotation)
+
+    def __call__(self, document: Mapping[str, Any]) -> T:
+        match self._mode:
+            case DecodeMode.VALIDATE:
+                return self._validate(document)
+            case DecodeMode.TRUSTED:
+                return self._construct(codec.inflate(document))
+
+        constructed = self._construct(codec.inflate(document))
+        validated = self._validate(document)
+        if type(constructed) is not type(validated) or constructed != validated:
+            raise ValueError(
+                f"trusted decode mismatch: {constructed!r} is not {validated!r}"
+            )
+
+        return validated
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _date(value: Any) -> datetime.date:
+    return value.date() if isinstance(value, datetime.datetime) else value
+
+
+def _pattern(value: Any) -> re.Pattern:
+    if isinstance(value, re.Pattern):
+        return value
+
+    if isinstance(value, bson.Regex):
+        return value.try_compile()
+
+    return re.compile(value)
+
+
+def _optional(convert: Converter) -> Converter:
+    def construct(value: Any) -> Any:
+        return None if value is None else convert(value)
+
+    return construct
+
+
+def _collection(factory: type, convert: Converter) -> Converter:
+    if convert is _identity:
+        return factory
+
+    def construct(value: Any) -> Any:
+        return factory(map(convert, value))
+
+    return construct
+
+
+def _tagged(union: Any, discriminator: str) -> Converter:
+    members: dict[Any, Converter] = {}
+    for member in get_args(union):
+        for tag in get_args(member.model_fields[discriminator].annotation):
+            members[tag] = members[getattr(tag, "value", tag)] = converter(member)
+
+    def construct(value: Any) -> Any:
+        return members[value[discriminator]](value)
+
+    return construct
+
+
+def _model(model: type[BaseModel]) -> Converter:
+    fields = [
+        (name, field.alias or name, converter(field.annotation))
+        for name, field in model.model_fields.items()
+    ]
+
+    def construct(value: Any) -> Any:
+        values = {
+            name: convert(value[key]) for name, key, convert in fields if key in value
+        }
+        return model.model_construct(**values)
+
+    return construct
+
+
+@functools.cache
+def converter(annotation: Any) -> Converter:  # noqa: C901
+    """
+    Builds a function constructing `annotation` from BSON decoded values without validation.
+    Types that are not known to be safe fall back to validation of the single value.
+    """
+    if isinstance(annotation, TypeAliasType):
+        return converter(annotation.__value__)
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Annotated:
+        for metadata in args[1:]:
+            if isinstance(metadata, FieldInfo) and metadata.discriminator:
+                return _tagged(args[0], metadata.discriminator)
+
+        return converter(args[0])
+
+    if origin is Literal:
+        if len(args) == 1:
+            return lambda _: args[0]
+
+    elif origin in (Union, types.UnionType):
+        members = [arg for arg in args if arg is not types.NoneType]
+        if len(members) == 1:
+            return _optional(converter(members[0]))
+
+    elif origin in (set, frozenset, list):
+        return _collection(origin, converter(args[0]))
+
+    elif origin is re.Pattern or annotation is re.Pattern:
+        return _pattern
+
+    elif isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return _model(annotation)
+
+        if issubclass(annotation, Enum):
+            return annotation
+
+        if annotation is datetime.date:
+            return _date
+
+        # decoded `bson.ObjectId` is kept, `domain.ObjectID` only adds validation to it
+        if annotation in (str, int, float, bool, datetime.datetime, domain.ObjectID):
+            return _identity
+
+    return TypeAdapter(annotation).validate_python
@@ -0,0 +1,1536 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection
+from pydantic import BaseModel, ValidationError
+from pymongo import ReturnDocument
+
+import src.domain.exception.database as exception
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.database.mongodb import indexes, models, queries
+from src.adapter.internal.database.motordb import codec, decode
+from src.utils.logger.logger import Logger
+
+log = Logger("motordb-database")
+
+
+class MotorDBAdapter(
+    proto.AllocationDatabaseProtocol,
+    proto.FormFieldDatabaseProtocol,
+    proto.ParticipantDatabaseProtocol,
+    proto.RoomDatabaseProtocol,
+    proto.UserDatabaseProtocol,
+    proto.PreferenceDatabaseProtocol,
+):
+    """
+    MongoDB adapter on plain Motor collections, storage compatible with `MongoDBAdapter`.
+    Raw BSON documents are validated into domain models in a single pass,
+    or constructed without validation in the trusted decode mode.
+    """
+
+    _client: AsyncIOMotorClient
+    _allocations: AsyncIOMotorCollection
+    _form_fields: AsyncIOMotorCollection
+    _answers: AsyncIOMotorCollection
+    _users: AsyncIOMotorCollection
+    _rooms: AsyncIOMotorCollection
+    _participants: AsyncIOMotorCollection
+    _preferences: AsyncIOMotorCollection
+
+    _decode_allocation: decode.Decoder[domain.Allocation]
+    _decode_form_field: decode.Decoder[domain.FormField]
+    _decode_answer: decode.Decoder[domain.Answer]
+    _decode_user: decode.Decoder[domain.User]
+    _decode_room: decode.Decoder[domain.Room]
+    _decode_participant: decode.Decoder[domain.Participant]
+    _decode_preference: decode.Decoder[domain.Preference]
+
+    def __init__(self): ...
+
+    @classmethod
+    async def create(
+        cls,
+        dsn: str,
+        decode_mode: decode.DecodeMode = decode.DecodeMode.VALIDATE,
+        **client_args: Any,
+    ):
+        self = cls()
+        self._client = AsyncIOMotorClient(dsn, **client_args)
+
+        await indexes.sync_indexes(self._client.randorm)
+
+        database = self._client.get_database(
+            "randorm", codec_options=codec.CODEC_OPTIONS
+        )
+        self._allocations = database[models.AllocationDocument.Settings.name]
+        self._form_fields = database[models.FormFieldDocument.Settings.name]
+        self._answers = database[models.AnswerDocument.Settings.name]
+        self._users = database[models.User.Settings.name]
+        self._rooms = database[models.Room.Settings.name]
+        self._participants = database[models.ParticipantDocument.Settings.name]
+        self._preferences = database[models.Preference.Settings.name]
+
+        self._decode_allocation = decode.Decoder(
+            domain.Allocation, domain.AllocationResolver.validate_python, decode_mode
+        )
+        self._decode_form_field = decode.Decoder(
+            domain.FormField, domain.FormFieldResolver.validate_python, decode_mode
+        )
+        self._decode_answer = decode.Decoder(
+            domain.Answer, domain.AnswerResolver.validate_python, decode_mode
+        )
+        self._decode_user = decode.Decoder(
+            domain.User, domain.User.model_validate, decode_mode
+        )
+        self._decode_room = decode.Decoder(
+            domain.Room, domain.Room.model_validate, decode_mode
+        )
+        self._decode_participant = decode.Decoder(
+            domain.Participant, domain.ParticipantResolver.validate_python, decode_mode
+        )
+        self._decode_preference = decode.Decoder(
+            domain.Preference, domain.Preference.model_validate, decode_mode
+        )
+
+        return self
+
+    def __new_document(self, source: Any) -> dict[str, Any]:
+        if not isinstance(source, BaseModel):
+            raise AttributeError("source must be a pydantic model")
+
+        timestamp = datetime.now().replace(microsecond=0)
+        data = dict(source)
+        data["_id"] = domain.ObjectID()
+        data["created_at"] = timestamp
+        data["updated_at"] = timestamp
+
+        return data
+
+    async def __update(
+        self,
+        collection: AsyncIOMotorCollection,
+        query: dict[str, Any],
+        update: dict[str, Any],
+    ) -> RawBSONDocument | None:
+        update["$set"]["updated_at"] = datetime.now().replace(microsecond=0)
+
+        return await collection.find_one_and_update(
+            query, update, return_document=ReturnDocument.AFTER
+        )
+
+    async def __delete(
+        self, collection: AsyncIOMotorCollection, id: domain.ObjectID
+    ) -> RawBSONDocument | None:
+        timestamp = datetime.now().replace(microsecond=0)
+
+        return await collection.find_one_and_update(
+            {"_id": id},
+            {"$set": {"deleted_at": timestamp, "updated_at": timestamp}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def create_allocation(
+        self,
+        allocation: proto.CreateAllocation,
+    ) -> domain.Allocation:
+        try:
+            log.debug("creating new allocation")
+            model: domain.Allocation = domain.AllocationResolver.validate_python(
+                self.__new_document(allocation)
+            )
+
+            log.debug("inserting new allocation")
+            await self._allocations.insert_one(
+                codec.to_document(
+                    model, models.class_id(models.ALLOCATION_MODELS[model.state])
+                )
+            )
+
+            log.info(f"created allocation {model.id}")
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect allocation type with error: {}", e)
+            raise exception.ReflectAlloctionException(
+                f"failed to reflect allocation type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to save allocation to database with error: {}", e)
+            raise exception.CreateAllocationException(
+                f"failed to save allocation to database with error: {e}"
+            ) from e
+
+    async def read_allocation(
+        self,
+        allocation: proto.ReadAllocation,
+    ) -> domain.Allocation:
+        try:
+            log.debug(f"reading allocation {allocation.id}")
+            document = await self._allocations.find_one({"_id": allocation.id})
+            assert document is not None, "document not found"
+            log.info(f"read allocation {allocation.id}")
+
+            return self._decode_allocation(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect allocation type with error: {}", e)
+            raise exception.ReflectAlloctionException(
+                f"failed to reflect allocation type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to fetch allocation with id {} with error: {}",
+                allocation.id,
+                e,
+            )
+            raise exception.ReadAllocationException(
+                f"failed to fetch allocation with id {allocation.id} with error: {e}"
+            ) from e
+
+    async def update_allocation(
+        self,
+        allocation: proto.UpdateAllocation,
+    ) -> domain.Allocation:
+        try:
+            log.debug(f"updating allocation {allocation.id}")
+            query, update = queries.allocation_update(allocation)
+
+            log.debug(f"applying update to allocation {allocation.id}")
+            document = await self.__update(self._allocations, query, update)
+            assert document is not None, "document not found"
+
+            log.info(f"updated allocation {allocation.id}")
+            return self._decode_allocation(document)
+
+        except exception.UpdateAllocationException as e:
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect allocation type with error: {}", e)
+            raise exception.ReflectAlloctionException(
+                f"failed to reflect allocation type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to update allocation with error: {}", e)
+            raise exception.UpdateAllocationException(
+                f"failed to update allocation with id {allocation.id} with error: {e}"
+            ) from e
+
+    async def delete_allocation(
+        self,
+        allocation: proto.DeleteAllocation,
+    ) -> domain.Allocation:
+        try:
+            log.debug(f"deleting allocation {allocation.id}")
+            document = await self.__delete(self._allocations, allocation.id)
+            assert document is not None, "document not found"
+
+            log.info(f"deleted allocation {allocation.id}")
+            return self._decode_allocation(document)
+
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect allocation type with error: {}", e)
+            raise exception.ReflectAlloctionException(
+                f"failed to reflect allocation type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to delete allocation with error: {}", e)
+            raise exception.DeleteAllocationException(
+                f"failed to delete allocation with id {allocation.id} with error: {e}"
+            ) from e
+
+    async def read_many_allocations(
+        self,
+        allocations: list[proto.ReadAllocation],
+    ) -> list[domain.Allocation | None]:
+        ids = [allocation.id for allocation in allocations]
+        try:
+            log.debug(f"reading allocations {ids}")
+            documents = await self._allocations.find({"_id": {"$in": ids}}).to_list(
+                None
+            )
+            log.info(f"read allocations {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_allocation(document)
+                for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect allocation type with error: {}", e)
+            raise exception.ReflectAlloctionException(
+                f"failed to reflect allocation type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read allocations with ids {} with error: {}", ids, e)
+            raise exception.ReadAllocationException(
+                f"failed to read allocations with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_allocations(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking allocations existence {ids}")
+            documents = await self._allocations.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked allocations existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check allocations existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadAllocationException(
+                f"failed to check allocations existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def create_form_field(
+        self,
+        form_field: proto.CreateFormField,
+    ) -> domain.FormField:
+        try:
+            log.debug("creating new form field")
+            model: domain.FormField = domain.FormFieldResolver.validate_python(
+                self.__new_document(form_field)
+            )
+
+            log.debug("inserting new form field")
+            await self._form_fields.insert_one(
+                codec.to_document(
+                    model, models.class_id(models.FORM_FIELD_MODELS[model.kind])
+                )
+            )
+
+            log.info(f"created form field {model.id}")
+            return model
+
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect form field type with error: {}", e)
+            raise exception.ReflectFormFieldException(
+                f"failed to reflect form field type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create form field with error: {}", e)
+            raise exception.CreateFormFieldException(
+                f"failed to create form field with error: {e}"
+            ) from e
+
+    async def read_form_field(
+        self,
+        form_field: proto.ReadFormField,
+    ) -> domain.FormField:
+        try:
+            log.debug(f"reading form field {form_field.id}")
+            document = await self._form_fields.find_one({"_id": form_field.id})
+            assert document is not None, "document not found"
+            log.info(f"read form field {form_field.id}")
+
+            return self._decode_form_field(document)
+
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect form field type with error: {}", e)
+            raise exception.ReflectFormFieldException(
+                f"failed to reflect form field type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to read form field with id {} with error: {}",
+                form_field.id,
+                e,
+            )
+            raise exception.ReadFormFieldException(
+                f"failed to read form field with id {form_field.id} with error: {e}"
+            ) from e
+
+    async def update_form_field(
+        self,
+        form_field: proto.UpdateFormField,
+    ) -> domain.FormField:
+        try:
+            log.debug(f"updating form field {form_field.id}")
+            query: dict[str, Any] = {"_id": form_field.id}
+
+            if isinstance(form_field, proto.UpdateTextFormField):
+                log.debug("updating text form field")
+                query["kind"] = domain.FormFieldKind.TEXT
+                update = queries.text_form_field_update(form_field)
+            elif isinstance(form_field, proto.UpdateChoiceFormField):
+                log.debug("updating choice form field")
+                query["kind"] = domain.FormFieldKind.CHOICE
+                update = queries.choice_form_field_update(query, form_field)
+            else:
+                raise AttributeError("can not resolve form field type")
+
+            log.debug(f"applying update to form field {form_field.id}")
+            document = await self.__update(self._form_fields, query, update)
+            assert document is not None, "document not found or type mismatch"
+
+            log.info(f"updated form field {form_field.id}")
+            return self._decode_form_field(document)
+
+        except exception.UpdateFormFieldException as e:
+            log.error("failed to update form field with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect form field type with error: {}", e)
+            raise exception.ReflectFormFieldException(
+                f"failed to reflect form field type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to update form field with id {} with error: {}",
+                form_field.id,
+                e,
+            )
+            raise exception.UpdateFormFieldException(
+                f"failed to update form field with id {form_field.id} with error: {e}"
+            ) from e
+
+    async def read_many_form_fields(
+        self,
+        form_fields: list[proto.ReadFormField],
+    ) -> list[domain.FormField | None]:
+        ids = [form_field.id for form_field in form_fields]
+        try:
+            log.debug(f"reading form fields {ids}")
+            documents = await self._form_fields.find({"_id": {"$in": ids}}).to_list(
+                None
+            )
+            log.info(f"read form fields {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_form_field(document)
+                for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect form field type with error: {}", e)
+            raise exception.ReflectFormFieldException(
+                f"failed to reflect form field type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read form fields with ids {} with error: {}", ids, e)
+            raise exception.ReadFormFieldException(
+                f"failed to read form fields with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_form_fields(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking form fields existence {ids}")
+            documents = await self._form_fields.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked form fields existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check form fields existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadFormFieldException(
+                f"failed to check form fields existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def delete_form_field(
+        self,
+        form_field: proto.DeleteFormField,
+    ) -> domain.FormField:
+        try:
+            log.debug(f"deleting form field {form_field.id}")
+            document = await self.__delete(self._form_fields, form_field.id)
+            assert document is not None, "document not found"
+
+            log.info(f"deleted form field {form_field.id}")
+            return self._decode_form_field(document)
+
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect form field type with error: {}", e)
+            raise exception.ReflectFormFieldException(
+                f"failed to reflect form field type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to delete form field with id {} with error: {}",
+                form_field.id,
+                e,
+            )
+            raise exception.DeleteFormFieldException(
+                f"failed to delete form field with id {form_field.id} with error: {e}"
+            ) from e
+
+    async def create_answer(
+        self,
+        answer: proto.CreateAnswer,
+    ) -> domain.Answer:
+        try:
+            log.debug("creating new answer")
+            model: domain.Answer = domain.AnswerResolver.validate_python(
+                self.__new_document(answer)
+            )
+
+            log.debug("inserting new answer")
+            await self._answers.insert_one(
+                codec.to_document(
+                    model, models.class_id(models.ANSWER_MODELS[model.kind])
+                )
+            )
+            log.info(f"created answer {model.id}")
+
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create answer with error: {}", e)
+            raise exception.CreateAnswerException(
+                f"failed to create answer with error: {e}"
+            ) from e
+
+    async def read_answer(
+        self,
+        answer: proto.ReadAnswer,
+    ) -> domain.Answer:
+        try:
+            log.debug(f"reading answer {answer.id}")
+            document = await self._answers.find_one({"_id": answer.id})
+            assert document is not None, "document not found"
+            log.info(f"read answer {answer.id}")
+
+            return self._decode_answer(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read answer with id {} with error: {}", answer.id, e)
+            raise exception.ReadAnswerException(
+                f"failed to read answer with id {answer.id} with error: {e}"
+            ) from e
+
+    async def update_answer(
+        self,
+        answer: proto.UpdateAnswer,
+    ) -> domain.Answer:
+        try:
+            log.debug(f"updating answer {answer.id}")
+            query: dict[str, Any] = {"_id": answer.id}
+
+            if isinstance(answer, proto.UpdateTextAnswer):
+                query["kind"] = domain.FormFieldKind.TEXT
+                update = queries.text_answer_update(answer)
+            elif isinstance(answer, proto.UpdateChoiceAnswer):
+                query["kind"] = domain.FormFieldKind.CHOICE
+                update = queries.choice_answer_update(answer)
+            else:
+                raise AttributeError("can not resolve answer type")
+
+            log.debug(f"applying update to answer {answer.id}")
+            document = await self.__update(self._answers, query, update)
+            assert document is not None, "document not found or type mismatch"
+
+            log.info(f"updated answer {answer.id}")
+            return self._decode_answer(document)
+
+        except exception.UpdateAnswerException as e:
+            log.error("failed to update answer with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to update answer with id {} with error: {}", answer.id, e)
+            raise exception.UpdateAnswerException(
+                f"failed to update answer with id {answer.id} with error: {e}"
+            ) from e
+
+    async def delete_answer(
+        self,
+        answer: proto.DeleteAnswer,
+    ) -> domain.Answer:
+        try:
+            log.debug(f"deleting answer {answer.id}")
+            document = await self.__delete(self._answers, answer.id)
+            assert document is not None, "document not found"
+
+            log.info(f"deleted answer {answer.id}")
+            return self._decode_answer(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to delete answer with id {} with error: {}", answer.id, e)
+            raise exception.DeleteAnswerException(
+                f"failed to delete answer with id {answer.id} with error: {e}"
+            ) from e
+
+    async def read_many_answers(
+        self,
+        answers: list[proto.ReadAnswer],
+    ) -> list[domain.Answer | None]:
+        ids = [answer.id for answer in answers]
+        try:
+            log.debug(f"reading answers {ids}")
+            documents = await self._answers.find({"_id": {"$in": ids}}).to_list(None)
+            log.info(f"read answers {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_answer(document) for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read answers with ids {} with error: {}", ids, e)
+            raise exception.ReadAnswerException(
+                f"failed to read answers with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_answers(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking answers existence {ids}")
+            documents = await self._answers.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked answers existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check answers existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadAnswerException(
+                f"failed to check answers existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def read_all_answers(self) -> list[domain.Answer]:
+        try:
+            log.debug("reading all answers")
+            documents = await self._answers.find({}).to_list(None)
+            log.info(f"read {len(documents)} answers")
+
+            return [self._decode_answer(document) for document in documents]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read all answers with error: {}", e)
+            raise exception.ReadAnswerException(
+                f"failed to read all answers with error: {e}"
+            ) from e
+
+    async def read_answers_by_respondents(
+        self, respondent_ids: list[domain.ObjectID]
+    ) -> list[domain.Answer]:
+        try:
+            log.debug(
+                f"reading answers of respondents {list(map(str, respondent_ids))}"
+            )
+            documents = await self._answers.find(
+                {"respondent_id": {"$in": list(respondent_ids)}}
+            ).to_list(None)
+            log.info(f"read {len(documents)} answers")
+
+            return [self._decode_answer(document) for document in documents]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read answers by respondents with error: {}", e)
+            raise exception.ReadAnswerException(
+                f"failed to read answers by respondents with error: {e}"
+            ) from e
+
+    async def iter_answers(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Answer]:
+        try:
+            log.debug(
+                f"iterating answers updated in [{updated_since}, {updated_before}) in batches of {batch_size}"
+            )
+            cursor = self._answers.find(
+                queries.updated_window(updated_since, updated_before),
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield self._decode_answer(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect answer type with error: {}", e)
+            raise exception.ReflectAnswerException(
+                f"failed to reflect answer type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate answers with error: {}", e)
+            raise exception.ReadAnswerException(
+                f"failed to iterate answers with error: {e}"
+            ) from e
+
+    async def create_user(
+        self,
+        user: proto.CreateUser,
+    ) -> domain.User:
+        try:
+            log.debug("creating new user")
+            model = domain.User.model_validate(self.__new_document(user))
+
+            log.debug("inserting new user")
+            await self._users.insert_one(codec.to_document(model))
+            log.info(f"created user {model.id}")
+
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create user with error: {}", e)
+            raise exception.CreateUserException(
+                f"failed to create user with error: {e}"
+            ) from e
+
+    async def find_users(self, user: proto.FindUsers) -> list[domain.User]:
+        try:
+            match user:
+                case proto.FindUsersByTid():
+                    log.debug(f"finding users by telegram id {user.telegram_id}")
+                    documents = await self._users.find(
+                        {"telegram_id": user.telegram_id}
+                    ).to_list(None)
+
+                case proto.FindUsersByProfileUsername():
+                    log.debug(f"finding users by username {user.username}")
+                    documents = await self._users.find(
+                        {"profile.username": user.username}
+                    ).to_list(None)
+
+                case _:
+                    documents = []
+
+            log.info(f"found users {[str(document['_id']) for document in documents]}")
+            return [self._decode_user(document) for document in documents]
+
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to find users with error: {}", e)
+            raise exception.FindUsersException(
+                f"failed to find users with error: {e}"
+            ) from e
+
+    async def read_user(
+        self,
+        user: proto.ReadUser,
+    ) -> domain.User:
+        try:
+            log.debug(f"reading user {user.id}")
+            document = await self._users.find_one({"_id": user.id})
+            assert document is not None, "document not found"
+            log.info(f"read user {user.id}")
+
+            return self._decode_user(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read user with id {} with error: {}", user.id, e)
+            raise exception.ReadUserException(
+                f"failed to read user with id {user.id} with error: {e}"
+            ) from e
+
+    async def update_user(
+        self,
+        user: proto.UpdateUser,
+    ) -> domain.User:
+        try:
+            log.debug(f"updating user {user.id}")
+            update = queries.user_update(user)
+
+            log.debug(f"applying update to user {user.id}")
+            document = await self.__update(self._users, {"_id": user.id}, update)
+            assert document is not None, "document not found"
+
+            log.info(f"updated user {user.id}")
+            return self._decode_user(document)
+
+        except exception.UpdateUserException as e:
+            log.error("failed to update user with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to update user with id {} with error: {}", user.id, e)
+            raise exception.UpdateUserException(
+                f"failed to update user with id {user.id} with error: {e}"
+            ) from e
+
+    async def delete_user(
+        self,
+        user: proto.DeleteUser,
+    ) -> domain.User:
+        try:
+            log.debug(f"deleting user {user.id}")
+            document = await self.__delete(self._users, user.id)
+            assert document is not None, "document not found"
+
+            log.info(f"deleted user {user.id}")
+            return self._decode_user(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to delete user with id {} with error: {}", user.id, e)
+            raise exception.DeleteUserException(
+                f"failed to delete user with id {user.id} with error: {e}"
+            ) from e
+
+    async def read_many_users(
+        self,
+        users: list[proto.ReadUser],
+    ) -> list[domain.User | None]:
+        ids = [user.id for user in users]
+        try:
+            log.debug(f"reading users {ids}")
+            documents = await self._users.find({"_id": {"$in": ids}}).to_list(None)
+            log.info(f"read users {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_user(document) for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect user type with error: {}", e)
+            raise exception.ReflectUserException(
+                f"failed to reflect user type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read users with ids {} with error: {}", ids, e)
+            raise exception.ReadUserException(
+                f"failed to read users with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_users(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking users existence {ids}")
+            documents = await self._users.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked users existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check users existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadUserException(
+                f"failed to check users existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def create_room(
+        self,
+        room: proto.CreateRoom,
+    ) -> domain.Room:
+        try:
+            log.debug("creating new room")
+            model = domain.Room.model_validate(self.__new_document(room))
+
+            log.debug("inserting new room")
+            await self._rooms.insert_one(codec.to_document(model))
+            log.info(f"created room {model.id}")
+
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect room type with error: {}", e)
+            raise exception.ReflectRoomException(
+                f"failed to reflect room type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create room with error: {}", e)
+            raise exception.CreateRoomException(
+                f"failed to create room with error: {e}"
+            ) from e
+
+    async def read_room(
+        self,
+        room: proto.ReadRoom,
+    ) -> domain.Room:
+        try:
+            log.debug(f"reading room {room.id}")
+            document = await self._rooms.find_one({"_id": room.id})
+            assert document is not None, "document not found"
+            log.info(f"read room {room.id}")
+
+            return self._decode_room(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect room type with error: {}", e)
+            raise exception.ReflectRoomException(
+                f"failed to reflect room type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read room with id {} with error: {}", room.id, e)
+            raise exception.ReadRoomException(
+                f"failed to read room with id {room.id} with error: {e}"
+            ) from e
+
+    async def update_room(
+        self,
+        room: proto.UpdateRoom,
+    ) -> domain.Room:
+        try:
+            log.debug(f"updating room {room.id}")
+            update = queries.room_update(room)
+
+            log.debug(f"applying update to room {room.id}")
+            document = await self.__update(self._rooms, {"_id": room.id}, update)
+            assert document is not None, "document not found"
+            log.info(f"updated room {room.id}")
+
+            return self._decode_room(document)
+        except exception.UpdateRoomException as e:
+            log.error("failed to update room with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect room type with error: {}", e)
+            raise exception.ReflectRoomException(
+                f"failed to reflect room type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to update room with id {} with error: {}", room.id, e)
+            raise exception.UpdateRoomException(
+                f"failed to update room with id {room.id} with error: {e}"
+            ) from e
+
+    async def delete_room(
+        self,
+        room: proto.DeleteRoom,
+    ) -> domain.Room:
+        try:
+            log.debug(f"deleting room {room.id}")
+            document = await self.__delete(self._rooms, room.id)
+            assert document is not None, "document not found"
+            log.info(f"deleted room {room.id}")
+
+            return self._decode_room(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect room type with error: {}", e)
+            raise exception.ReflectRoomException(
+                f"failed to reflect room type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to delete room with id {} with error: {}", room.id, e)
+            raise exception.DeleteRoomException(
+                f"failed to delete room with id {room.id} with error: {e}"
+            ) from e
+
+    async def read_many_rooms(
+        self,
+        rooms: list[proto.ReadRoom],
+    ) -> list[domain.Room | None]:
+        ids = [room.id for room in rooms]
+        try:
+            log.debug(f"reading rooms {ids}")
+            documents = await self._rooms.find({"_id": {"$in": ids}}).to_list(None)
+            log.info(f"read rooms {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_room(document) for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect room type with error: {}", e)
+            raise exception.ReflectRoomException(
+                f"failed to reflect room type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read rooms with ids {} with error: {}", ids, e)
+            raise exception.ReadRoomException(
+                f"failed to read rooms with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_rooms(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking rooms existence {ids}")
+            documents = await self._rooms.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked rooms existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check rooms existence with ids {} with error: {}", ids, e
+            )
+            raise exception.ReadRoomException(
+                f"failed to check rooms existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def create_participant(
+        self, participant: proto.CreateParticipant
+    ) -> domain.Participant:
+        try:
+            log.debug("creating new participant")
+            model: domain.Participant = domain.ParticipantResolver.validate_python(
+                self.__new_document(participant)
+            )
+
+            log.debug("inserting new participant")
+            await self._participants.insert_one(
+                codec.to_document(
+                    model, models.class_id(models.PARTICIPANT_MODELS[model.state])
+                )
+            )
+            log.info(f"created participant {model.id}")
+
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create participant with error: {}", e)
+            raise exception.CreateParticipantException(
+                f"failed to create participant with error: {e}"
+            ) from e
+
+    async def read_participant(
+        self, participant: proto.ReadParticipant
+    ) -> domain.Participant:
+        try:
+            log.debug(f"reading participant {participant.id}")
+            document = await self._participants.find_one({"_id": participant.id})
+            assert document is not None, "document not found"
+            log.info(f"read participant {participant.id}")
+
+            return self._decode_participant(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to read participant with id {} with error: {}",
+                participant.id,
+                e,
+            )
+            raise exception.ReadParticipantException(
+                f"failed to read participant with id {participant.id} with error: {e}"
+            ) from e
+
+    async def update_participant(
+        self, participant: proto.UpdateParticipant
+    ) -> domain.Participant:
+        try:
+            log.debug(f"updating participant {participant.id}")
+            query, update = queries.participant_update(participant)
+
+            log.debug(f"applying update to participant {participant.id}")
+            document = await self.__update(self._participants, query, update)
+            assert document is not None, "document not found"
+            log.info(f"updated participant {participant.id}")
+
+            return self._decode_participant(document)
+        except exception.UpdateParticipantException as e:
+            log.error("failed to update participant with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to update participant with id {} with error: {}",
+                participant.id,
+                e,
+            )
+            raise exception.UpdateParticipantException(
+                f"failed to update participant with id {participant.id} with error: {e}"
+            ) from e
+
+    async def delete_participant(
+        self, participant: proto.DeleteParticipant
+    ) -> domain.Participant:
+        try:
+            log.debug(f"deleting participant {participant.id}")
+            document = await self.__delete(self._participants, participant.id)
+            assert document is not None, "document not found"
+            log.info(f"deleted participant {participant.id}")
+
+            return self._decode_participant(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to delete participant with id {} with error: {}",
+                participant.id,
+                e,
+            )
+            raise exception.DeleteParticipantException(
+                f"failed to delete participant with id {participant.id} with error: {e}"
+            ) from e
+
+    async def read_many_participants(
+        self,
+        participants: list[proto.ReadParticipant],
+    ) -> list[domain.Participant | None]:
+        ids = [participant.id for participant in participants]
+        try:
+            log.debug(f"reading participants {ids}")
+            documents = await self._participants.find({"_id": {"$in": ids}}).to_list(
+                None
+            )
+            log.info(f"read participants {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_participant(document)
+                for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read participants with ids {} with error: {}", ids, e)
+            raise exception.ReadParticipantException(
+                f"failed to read participants with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_participants(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking participants existence {ids}")
+            documents = await self._participants.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked participants existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check participants existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadParticipantException(
+                f"failed to check participants existence with ids {ids} with error: {e}"
+            ) from e
+
+    async def read_all_participants(self) -> list[domain.Participant]:
+        try:
+            log.debug("reading all participants")
+            documents = await self._participants.find({}).to_list(None)
+            log.info(f"read {len(documents)} participants")
+
+            return [self._decode_participant(document) for document in documents]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read all participants with error: {}", e)
+            raise exception.ReadParticipantException(
+                f"failed to read all participants with error: {e}"
+            ) from e
+
+    async def find_participant(
+        self, participant: proto.FindParticipant
+    ) -> domain.Participant | None:
+        try:
+            log.debug(
+                f"finding participant for user {participant.user_id} and allocation {participant.allocation_id}"
+            )
+            document = await self._participants.find_one(
+                {
+                    "user_id": participant.user_id,
+                    "allocation_id": participant.allocation_id,
+                    **models.LIVE_DOCUMENT_FILTER,
+                }
+            )
+            if document is None:
+                log.info("participant not found")
+                return None
+
+            log.info(f"found participant {document['_id']}")
+            return self._decode_participant(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to find participant with error: {}", e)
+            raise exception.FindParticipantException(
+                f"failed to find participant with error: {e}"
+            ) from e
+
+    async def sample_participants(
+        self, participants: proto.SampleParticipants
+    ) -> list[domain.Participant]:
+        try:
+            log.debug(
+                f"sampling {participants.size} participants of allocation {participants.allocation_id}"
+            )
+            cursor = self._participants.aggregate(
+                [
+                    {
+                        "$match": {
+                            "allocation_id": participants.allocation_id,
+                            "state": domain.ParticipantState.ACTIVE,
+                            "user_id": {"$ne": participants.excluded_user_id},
+                            "_id": {"$nin": list(participants.excluded_ids)},
+                            **models.LIVE_DOCUMENT_FILTER,
+                        }
+                    },
+                    {"$sample": {"size": participants.size}},
+                ]
+            )
+            documents = await cursor.to_list(None)
+
+            log.info(f"sampled {len(documents)} participants")
+            return [self._decode_participant(document) for document in documents]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to sample participants with error: {}", e)
+            raise exception.FindParticipantException(
+                f"failed to sample participants with error: {e}"
+            ) from e
+
+    async def iter_participants(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Participant]:
+        try:
+            log.debug(
+                f"iterating participants updated in [{updated_since}, {updated_before}) in batches of {batch_size}"
+            )
+            cursor = self._participants.find(
+                queries.updated_window(updated_since, updated_before),
+                batch_size=batch_size,
+            )
+            async for document in cursor:
+                yield self._decode_participant(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
+    async def iter_participants_with_gender(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[tuple[domain.Participant, domain.Gender | None]]:
+        try:
+            log.debug(
+                f"iterating participants with gender updated in [{updated_since}, {updated_before})"
+            )
+            cursor = self._participants.aggregate(
+                [
+                    {"$match": queries.updated_window(updated_since, updated_before)},
+                    {
+                        "$lookup": {
+                            "from": models.User.Settings.name,
+                            "localField": "user_id",
+                            "foreignField": "_id",
+                            "pipeline": [
+                                {"$project": {"_id": 0, "gender": "$profile.gender"}}
+                            ],
+                            "as": "user",
+                        }
+                    },
+                    {
+                        "$project": {
+                            **dict.fromkeys(models.PARTICIPANT_EXPORT_FIELDS, 1),
+                            "gender": {"$arrayElemAt": ["$user.gender", 0]},
+                        }
+                    },
+                ],
+                batchSize=batch_size,
+            )
+            async for document in cursor:
+                gender = document.get("gender")
+                yield (
+                    self._decode_participant(document),
+                    domain.Gender(gender) if gender is not None else None,
+                )
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect participant type with error: {}", e)
+            raise exception.ReflectParticipantException(
+                f"failed to reflect participant type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise exception.ReadParticipantException(
+                f"failed to iterate participants with error: {e}"
+            ) from e
+
+    async def create_preference(
+        self, preference: proto.CreatePreference
+    ) -> domain.Preference:
+        try:
+            log.debug("creating new preference")
+            model = domain.Preference.model_validate(self.__new_document(preference))
+
+            log.debug("inserting new preference")
+            await self._preferences.insert_one(codec.to_document(model))
+            log.info(f"created preference {model.id}")
+
+            return model
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to create preference with error: {}", e)
+            raise exception.CreatePreferenceException(
+                f"failed to create preference with error: {e}"
+            ) from e
+
+    async def find_preferences(
+        self, preference: proto.FindPreference
+    ) -> list[domain.Preference]:
+        try:
+            log.debug(
+                f"finding preferences for user {preference.user_id} and target {preference.target_id}"
+            )
+            documents = await self._preferences.find(
+                {"user_id": preference.user_id, "target_id": preference.target_id}
+            ).to_list(None)
+            log.info(
+                f"found preferences {[str(document['_id']) for document in documents]}"
+            )
+
+            return [self._decode_preference(document) for document in documents]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to find preferences with error: {}", e)
+            raise exception.FindPreferenceException(
+                f"failed to find preferences with error: {e}"
+            ) from e
+
+    async def read_preference(
+        self, preference: proto.ReadPreference
+    ) -> domain.Preference:
+        try:
+            log.debug(f"reading preference {preference.id}")
+            document = await self._preferences.find_one({"_id": preference.id})
+            assert document is not None, "document not found"
+            log.info(f"read preference {preference.id}")
+
+            return self._decode_preference(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to read preference with id {} with error: {}",
+                preference.id,
+                e,
+            )
+            raise exception.ReadPreferenceException(
+                f"failed to read preference with id {preference.id} with error: {e}"
+            ) from e
+
+    async def update_preference(
+        self, preference: proto.UpdatePreference
+    ) -> domain.Preference:
+        try:
+            log.debug(f"updating preference {preference.id}")
+            update = queries.preference_update(preference)
+
+            log.debug(f"applying update to preference {preference.id}")
+            document = await self.__update(
+                self._preferences, {"_id": preference.id}, update
+            )
+            assert document is not None, "document not found"
+            log.info(f"updated preference {preference.id}")
+
+            return self._decode_preference(document)
+        except exception.UpdatePreferenceException as e:
+            log.error("failed to update preference with error: {}", e)
+            raise e
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to update preference with id {} with error: {}",
+                preference.id,
+                e,
+            )
+            raise exception.UpdatePreferenceException(
+                f"failed to update preference with id {preference.id} with error: {e}"
+            ) from e
+
+    async def delete_preference(
+        self,
+        preference: proto.DeletePreference,
+    ) -> domain.Preference:
+        try:
+            log.debug(f"deleting preference {preference.id}")
+            document = await self.__delete(self._preferences, preference.id)
+            assert document is not None, "document not found"
+            log.info(f"deleted preference {preference.id}")
+
+            return self._decode_preference(document)
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error(
+                "failed to delete preference with id {} with error: {}",
+                preference.id,
+                e,
+            )
+            raise exception.DeletePreferenceException(
+                f"failed to delete preference with id {preference.id} with error: {e}"
+            ) from e
+
+    async def read_many_preferences(
+        self,
+        preferences: list[proto.ReadPreference],
+    ) -> list[domain.Preference | None]:
+        ids = [preference.id for preference in preferences]
+        try:
+            log.debug(f"reading preferences {ids}")
+            documents = await self._preferences.find({"_id": {"$in": ids}}).to_list(
+                None
+            )
+            log.info(f"read preferences {ids}")
+
+            aligned = {
+                document["_id"]: self._decode_preference(document)
+                for document in documents
+            }
+            return [aligned.get(id) for id in ids]
+        except (ValidationError, AttributeError) as e:
+            log.error("failed to reflect preference type with error: {}", e)
+            raise exception.ReflectPreferenceException(
+                f"failed to reflect preference type with error: {e}"
+            ) from e
+        except Exception as e:
+            log.error("failed to read preferences with ids {} with error: {}", ids, e)
+            raise exception.ReadPreferenceException(
+                f"failed to read preferences with ids {ids} with error: {e}"
+            ) from e
+
+    async def exists_many_preferences(
+        self,
+        ids: list[domain.ObjectID],
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        try:
+            log.debug(f"checking preferences existence {ids}")
+            documents = await self._preferences.find(
+                {"_id": {"$in": ids}}, queries.EXISTENCE_PROJECTION
+            ).to_list(None)
+            log.info(f"checked preferences existence {ids}")
+
+            return queries.existence(
+                ids,
+                {document["_id"]: document.get("deleted_at") for document in documents},
+            )
+        except Exception as e:
+            log.error(
+                "failed to check preferences existence with ids {} with error: {}",
+                ids,
+                e,
+            )
+            raise exception.ReadPreferenceException(
+                f"failed to check preferences existence with ids {ids} with error: {e}"
+            ) from e
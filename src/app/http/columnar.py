@@ -0,0 +1,187 @@
+"""
+Columnar (Arrow IPC stream / Parquet) encoding of dataset exports.
+pyarrow is an optional dependency, the formats are disabled when it is missing.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+import src.domain.model as domain
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = None
+    pq = None
+
+
+def is_available() -> bool:
+    return pa is not None
+
+
+class ChunkSink:
+    """
+    Write-only file object that keeps written bytes until they are drained.
+    Tracks the absolute position, so Parquet footers stay valid.
+    """
+
+    closed = False
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None: ...
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def _object_id() -> Any:
+    return pa.binary(12)
+
+
+def _dictionary() -> Any:
+    return pa.dictionary(pa.int8(), pa.string())
+
+
+def _timestamp() -> Any:
+    return pa.timestamp("s")
+
+
+def answer_schema() -> Any:
+    return pa.schema(
+        [
+            pa.field("id", _object_id(), nullable=False),
+            pa.field("created_at", _timestamp(), nullable=False),
+            pa.field("updated_at", _timestamp(), nullable=False),
+            pa.field("deleted_at", _timestamp()),
+            pa.field("form_field_id", _object_id()),
+            pa.field("respondent_id", _object_id()),
+            pa.field("kind", _dictionary()),
+            pa.field("text", pa.string()),
+            pa.field("option_indexes", pa.list_(pa.int32())),
+        ]
+    )
+
+
+def participant_schema() -> Any:
+    return pa.schema(
+        [
+            pa.field("id", _object_id(), nullable=False),
+            pa.field("created_at", _timestamp(), nullable=False),
+            pa.field("updated_at", _timestamp(), nullable=False),
+            pa.field("deleted_at", _timestamp()),
+            pa.field("allocation_id", _object_id()),
+            pa.field("user_id", _object_id()),
+            pa.field("state", _dictionary()),
+            pa.field("room_id", _object_id()),
+            pa.field("viewed_ids", pa.list_(_object_id())),
+            pa.field("subscription_ids", pa.list_(_object_id())),
+            pa.field("subscribers_ids", pa.list_(_object_id())),
+            pa.field("gender", _dictionary()),
+        ]
+    )
+
+
+TOMBSTONE_COLUMNS = frozenset({"id", "created_at", "updated_at", "deleted_at"})
+
+
+def _append_tombstone(
+    columns: dict[str, list[Any]], document: domain.Answer | domain.Participant
+) -> None:
+    # the row of a deleted document keeps its id and timestamps only
+    for name, column in columns.items():
+        if name not in TOMBSTONE_COLUMNS:
+            column.append(None)
+
+    columns["id"].append(document.id.binary)
+    columns["created_at"].append(document.created_at)
+    columns["updated_at"].append(document.updated_at)
+    columns["deleted_at"].append(document.deleted_at)
+
+
+def answers_to_batch(
+    schema: Any, answers: Iterable[domain.Answer], tombstones: bool = False
+) -> Any:
+    """
+    With `tombstones` deleted answers are written without their payload.
+    """
+    columns: dict[str, list[Any]] = {name: [] for name in schema.names}
+    for answer in answers:
+        if tombstones and answer.deleted_at is not None:
+            _append_tombstone(columns, answer)
+            continue
+
+        columns["id"].append(answer.id.binary)
+        columns["created_at"].append(answer.created_at)
+        columns["updated_at"].append(answer.updated_at)
+        columns["deleted_at"].append(answer.deleted_at)
+        columns["form_field_id"].append(answer.form_field_id.binary)
+        columns["respondent_id"].append(answer.respondent_id.binary)
+        columns["kind"].append(answer.kind.value)
+        columns["text"].append(getattr(answer, "text", None))
+
+        option_indexes = getattr(answer, "option_indexes", None)
+        columns["option_indexes"].append(
+            sorted(option_indexes) if option_indexes is not None else None
+        )
+
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def participants_to_batch(
+    schema: Any,
+    participants: Iterable[tuple[domain.Participant, domain.Gender | None]],
+    tombstones: bool = False,
+) -> Any:
+    """
+    With `tombstones` deleted participants are written without their payload.
+    """
+    columns: dict[str, list[Any]] = {name: [] for name in schema.names}
+    for participant, gender in participants:
+        if tombstones and participant.deleted_at is not None:
+            _append_tombstone(columns, participant)
+            continue
+
+        room_id = getattr(participant, "room_id", None)
+
+        columns["id"].append(participant.id.binary)
+        columns["created_at"].append(participant.created_at)
+        columns["updated_at"].append(participant.updated_at)
+        columns["deleted_at"].append(participant.deleted_at)
+        columns["allocation_id"].append(participant.allocation_id.binary)
+        columns["user_id"].append(participant.user_id.binary)
+        columns["state"].append(participant.state.value)
+        columns["room_id"].append(room_id.binary if room_id is not None else None)
+        columns["viewed_ids"].append([id.binary for id in participant.viewed_ids])
+        columns["subscription_ids"].append(
+            [id.binary for id in participant.subscription_ids]
+        )
+        columns["subscribers_ids"].append(
+            [id.binary for id in participant.subscribers_ids]
+        )
+        columns["gender"].append(gender.value if gender is not None else None)
+
+    return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def new_writer(sink: ChunkSink, schema: Any, parquet: bool) -> Any:
+    if parquet:
+        return pq.ParquetWriter(sink, schema, compression="zstd")
+
+    return pa.ipc.new_stream(sink, schema)
@@ -1,15 +1,53 @@
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Any
+
 import ujson
 from aiohttp import web
 
+import src.domain.model as domain
+from src.app.http import columnar
 from src.app.http.common import CORS_HEADERS
-from src.protocol.internal.database.user import ReadUser
 from src.service.answer import AnswerService
 from src.service.participant import ParticipantService
-from src.service.user import UserService
 from src.utils.logger.logger import Logger
 
 log = Logger("dataset-router")
 
+EXPORT_BATCH_SIZE = 1000
+# `updated_at` is stamped before the write commits, so incremental exports
+# leave the newest documents to the next poll. Writes that take longer to
+# commit can be missed.
+EXPORT_COMMIT_LAG = timedelta(seconds=10)
+
+
+class ExportFormat(StrEnum):
+    JSON = "json"
+    NDJSON = "ndjson"
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+CONTENT_TYPES = {
+    ExportFormat.JSON: "application/json",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.ARROW: "application/vnd.apache.arrow.stream",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+COLUMNAR_FORMATS = frozenset({ExportFormat.ARROW, ExportFormat.PARQUET})
+
+NEXT_SINCE_HEADER = "X-Next-Since"
+
+
+@dataclass
+class ExportWindow:
+    since: datetime | None
+    until: datetime | None
+    next_since: datetime
+
 
 class DatasetRouter:
     _user_form_redirect_url: str
@@ -19,12 +57,12 @@ class DatasetRouter:
         secret_key: str,
         answer_service: AnswerService,
         participant_service: ParticipantService,
-        user_service: UserService,
+        commit_lag: timedelta = EXPORT_COMMIT_LAG,
     ):
         self._secret_key = secret_key
         self._answer_service = answer_service
         self._participant_service = participant_service
-        self._user_service = user_service
+        self._commit_lag = commit_lag
 
     def regiter_routers(self, app: web.Application):
         app.add_routes(
@@ -55,73 +93,264 @@ class DatasetRouter:
     async def options_handler(self, request: web.Request) -> web.Response:
         return web.Response(status=200, text="OK", headers=CORS_HEADERS)
 
-    async def answer_handler(self, request: web.Request) -> web.Response:
+    async def answer_handler(self, request: web.Request) -> web.StreamResponse:
+        return await self.__export(
+            request,
+            "answers",
+            self.__answer_records,
+            columnar.answer_schema,
+            self.__answer_record_batches,
+        )
+
+    async def participants_handler(self, request: web.Request) -> web.StreamResponse:
+        return await self.__export(
+            request,
+            "participants",
+            self.__participant_records,
+            columnar.participant_schema,
+            self.__participant_record_batches,
+        )
+
+    async def __export(
+        self,
+        request: web.Request,
+        name: str,
+        records: Callable[[ExportWindow], AsyncIterator[dict[str, Any]]],
+        schema: Callable[[], Any],
+        record_batches: Callable[[Any, ExportWindow], AsyncIterator[Any]],
+    ) -> web.StreamResponse:
         secret_key = request.headers.get("X-Secret-Key")
         if secret_key is None or secret_key != self._secret_key:
             log.error("invalid secret key")
             return web.Response(status=403)
 
         try:
-            answers = await self._answer_service.read_all()
+            export_format = self.__negotiate_format(request)
+            window = self.__parse_window(request)
+        except ValueError as e:
+            log.error("invalid export request: {}", e)
+            return web.Response(status=400, text=str(e))
 
-            response = web.StreamResponse(
-                status=200,
-                reason="OK",
-                headers={"Content-Type": "application/json"},
-            )
-            await response.prepare(request)
+        if export_format in COLUMNAR_FORMATS and not columnar.is_available():
+            log.error("columnar export requested but pyarrow is not installed")
+            return web.Response(status=501, text="columnar export is not available")
+
+        response = self.__build_response(request, export_format)
+        response.headers[NEXT_SINCE_HEADER] = window.next_since.isoformat()
+        try:
+            if export_format in COLUMNAR_FORMATS:
+                batch_schema = schema()
+                await self.__stream_columnar(
+                    request,
+                    response,
+                    export_format,
+                    batch_schema,
+                    record_batches(batch_schema, window),
+                )
+            else:
+                await self.__stream(request, response, export_format, records(window))
+
+            return response
+        except Exception as e:
+            log.error(f"failed to export {name} with error: {{}}", e)
+            if response.prepared:
+                raise e
+
+            return web.Response(status=500, text=str(e))
+
+    async def __answer_batches(
+        self, window: ExportWindow
+    ) -> AsyncIterator[list[domain.Answer]]:
+        batch: list[domain.Answer] = []
+        async for answer in self._answer_service.iter_all(
+            EXPORT_BATCH_SIZE, window.since, window.until
+        ):
+            batch.append(answer)
+            if len(batch) == EXPORT_BATCH_SIZE:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def __participant_batches(
+        self, window: ExportWindow
+    ) -> AsyncIterator[list[tuple[domain.Participant, domain.Gender | None]]]:
+        batch: list[tuple[domain.Participant, domain.Gender | None]] = []
+        async for item in self._participant_service.iter_all_with_gender(
+            EXPORT_BATCH_SIZE, window.since, window.until
+        ):
+            batch.append(item)
+            if len(batch) == EXPORT_BATCH_SIZE:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    async def __answer_records(
+        self, window: ExportWindow
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for batch in self.__answer_batches(window):
+            for answer in batch:
+                if window.since is not None and answer.deleted_at is not None:
+                    yield self.__tombstone(answer)
+                    continue
 
-            await response.write(b"[")
-            for i, answer in enumerate(answers):
                 data = answer.model_dump(mode="json")
 
                 # TODO: recommendational models do not support multiple option_indexes
-                data["option_indexes"] = data["option_indexes"][0]
+                if "option_indexes" in data:
+                    data["option_indexes"] = data["option_indexes"][0]
 
-                await response.write(ujson.dumps(data, ensure_ascii=False).encode())
+                yield data
 
-                if i != len(answers) - 1:
-                    await response.write(b",")
+    async def __participant_records(
+        self, window: ExportWindow
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for batch in self.__participant_batches(window):
+            for participant, gender in batch:
+                if window.since is not None and participant.deleted_at is not None:
+                    yield self.__tombstone(participant)
+                    continue
 
-            await response.write(b"]")
-            await response.write_eof()
-            return response  # type: ignore
-        except Exception as e:
-            return web.Response(status=500, text=str(e))
+                data = participant.model_dump(mode="json")
+                data["gender"] = gender
+                yield data
 
-    async def participants_handler(self, request: web.Request) -> web.Response:
-        secret_key = request.headers.get("X-Secret-Key")
-        if secret_key is None or secret_key != self._secret_key:
-            log.error("invalid secret key")
-            return web.Response(status=403)
+    async def __answer_record_batches(
+        self, schema: Any, window: ExportWindow
+    ) -> AsyncIterator[Any]:
+        async for batch in self.__answer_batches(window):
+            yield columnar.answers_to_batch(
+                schema, batch, tombstones=window.since is not None
+            )
+
+    async def __participant_record_batches(
+        self, schema: Any, window: ExportWindow
+    ) -> AsyncIterator[Any]:
+        async for batch in self.__participant_batches(window):
+            yield columnar.participants_to_batch(
+                schema, batch, tombstones=window.since is not None
+            )
+
+    def __tombstone(
+        self, document: domain.Answer | domain.Participant
+    ) -> dict[str, Any]:
+        assert document.deleted_at is not None, "document is not deleted"
+        return {"id": str(document.id), "deleted_at": document.deleted_at.isoformat()}
+
+    def __parse_window(self, request: web.Request) -> ExportWindow:
+        # polls continue from the commit lag, a full export has no upper bound
+        # and the next poll exports the lagged documents again
+        next_since = datetime.now().replace(microsecond=0) - self._commit_lag
+
+        value = request.query.get("since")
+        if value is None:
+            return ExportWindow(since=None, until=None, next_since=next_since)
 
         try:
-            participants = await self._participant_service.read_all()
-            user_read_request = [
-                ReadUser(_id=participant.user_id) for participant in participants
-            ]
-            users = await self._user_service.read_many(user_read_request)
+            try:
+                since = datetime.fromtimestamp(float(value))
+            except ValueError:
+                since = datetime.fromisoformat(value)
+        except (ValueError, OverflowError, OSError) as e:
+            raise ValueError(f"invalid since {value}") from e
 
-            response = web.StreamResponse(
-                status=200,
-                reason="OK",
-                headers={"Content-Type": "application/json"},
-            )
-            await response.prepare(request)
+        if since.tzinfo is not None:
+            since = since.astimezone().replace(tzinfo=None)
 
-            await response.write(b"[")
+        return ExportWindow(since=since, until=next_since, next_since=next_since)
 
-            for user_idx, participant in enumerate(participants):
-                data = participant.model_dump(mode="json")
-                data["gender"] = users[user_idx].profile.gender
+    def __negotiate_format(self, request: web.Request) -> ExportFormat:
+        value = request.query.get("format")
+        if value is not None:
+            return ExportFormat(value)
 
-                await response.write(ujson.dumps(data, ensure_ascii=False).encode())
+        accept = request.headers.get("Accept", "")
+        for export_format, content_type in CONTENT_TYPES.items():
+            if export_format != ExportFormat.JSON and content_type in accept:
+                return export_format
 
-                if user_idx != len(participants) - 1:
-                    await response.write(b",")
+        return ExportFormat.JSON
 
-            await response.write(b"]")
-            await response.write_eof()
-            return response  # type: ignore
-        except Exception as e:
-            return web.Response(status=500, text=str(e))
+    def __build_response(
+        self, request: web.Request, export_format: ExportFormat
+    ) -> web.StreamResponse:
+        response = web.StreamResponse(
+            status=200,
+            reason="OK",
+            headers={"Content-Type": CONTENT_TYPES[export_format]},
+        )
+        # parquet pages are already compressed
+        if export_format != ExportFormat.PARQUET and "gzip" in request.headers.get(
+            "Accept-Encoding", ""
+        ):
+            response.enable_compression(web.ContentCoding.gzip)
+
+        return response
+
+    async def __stream(
+        self,
+        request: web.Request,
+        response: web.StreamResponse,
+        export_format: ExportFormat,
+        records: AsyncIterator[dict[str, Any]],
+    ) -> None:
+        ndjson = export_format == ExportFormat.NDJSON
+        buffer = bytearray() if ndjson else bytearray(b"[")
+
+        count = 0
+        async for record in records:
+            if not ndjson and count > 0:
+                buffer += b","
+            buffer += ujson.dumps(record, ensure_ascii=False).encode()
+            if ndjson:
+                buffer += b"\n"
+
+            count += 1
+            if count % EXPORT_BATCH_SIZE == 0:
+                await self.__flush(request, response, bytes(buffer))
+                buffer.clear()
+
+        if not ndjson:
+            buffer += b"]"
+
+        await self.__flush(request, response, bytes(buffer))
+        await response.write_eof()
+        log.info(f"exported {count} records as {export_format}")
+
+    async def __stream_columnar(
+        self,
+        request: web.Request,
+        response: web.StreamResponse,
+        export_format: ExportFormat,
+        schema: Any,
+        record_batches: AsyncIterator[Any],
+    ) -> None:
+        sink = columnar.ChunkSink()
+        writer = columnar.new_writer(
+            sink, schema, parquet=export_format == ExportFormat.PARQUET
+        )
+
+        count = 0
+        async for record_batch in record_batches:
+            writer.write_batch(record_batch)
+            count += record_batch.num_rows
+            await self.__flush(request, response, sink.drain())
+
+        writer.close()
+        await self.__flush(request, response, sink.drain())
+        await response.write_eof()
+        log.info(f"exported {count} records as {export_format}")
+
+    async def __flush(
+        self,
+        request: web.Request,
+        response: web.StreamResponse,
+        data: bytes,
+    ) -> None:
+        if not response.prepared:
+            await response.prepare(request)
+
+        await response.write(data)
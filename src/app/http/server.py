@@ -1,11 +1,14 @@
 from aiohttp import web
 
+from src.adapter.external.graphql.persisted import PersistedQueries
 from src.adapter.external.graphql.schema import SCHEMA
 from src.adapter.external.graphql.view import RandormGraphQLView
 from src.app.http.routes import dataset, oauth
 from src.app.http.routes.telegram import TelegramRouter
 from src.app.http.telegram.bot import Telegram
 from src.protocol.external.auth.oauth import OauthProtocol
+from src.protocol.internal.cache.generic import CacheProtocol
+from src.service import identity
 from src.service.allocation import AllocationService
 from src.service.answer import AnswerService
 from src.service.form_field import FormFieldService
@@ -31,6 +34,9 @@ def build_server(
     preference_service: PreferenceService,
     room_service: RoomService,
     oauth_adapter: OauthProtocol,
+    jwt_secret: str,
+    cache_services: dict[identity.EntityKind, CacheProtocol] | None = None,
+    persisted_queries: PersistedQueries | None = None,
 ):
     app = web.Application()
 
@@ -44,7 +50,6 @@ def build_server(
     dataset.DatasetRouter(
         secret_key=service_secret_key,
         answer_service=answer_service,
-        user_service=user_service,
         participant_service=participant_service,
     ).regiter_routers(app)
 
@@ -54,6 +59,7 @@ def build_server(
         handler=RandormGraphQLView(
             schema=SCHEMA,
             oauth_adapter=oauth_adapter,
+            jwt_secret=jwt_secret,
             user_service=user_service,
             allocation_service=allocation_service,
             form_field_service=form_field_service,
@@ -61,6 +67,8 @@ def build_server(
             participant_service=participant_service,
             preference_service=preference_service,
             room_service=room_service,
+            cache_services=cache_services,
+            persisted_queries=persisted_queries,
         ),
     )
 
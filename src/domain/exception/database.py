@@ -115,6 +115,9 @@ class UpdateParticipantException(ParticipantException): ...
 class DeleteParticipantException(ParticipantException): ...
 
 
+class FindParticipantException(ParticipantException): ...
+
+
 class PreferenceException(DatabaseException): ...
 
 
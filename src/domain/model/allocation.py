@@ -1,6 +1,6 @@
 import datetime
 from enum import Enum
-from typing import Literal
+from typing import Annotated, Literal
 
 import pydantic
 
@@ -66,15 +66,16 @@ class FailedAllocation(BaseAllocation):
     state: Literal[AllocationState.FAILED] = AllocationState.FAILED
 
 
-type Allocation = (
+type Allocation = Annotated[
     CreatingAllocation
     | CreatedAllocation
     | OpenAllocation
     | RoomingAllocation
     | RoomedAllocation
     | ClosedAllocation
-    | FailedAllocation
-)
+    | FailedAllocation,
+    pydantic.Field(discriminator="state"),
+]
 
 AllocationResolver = pydantic.TypeAdapter(
     type=Allocation,
@@ -1,7 +1,7 @@
 import datetime
 import re
 from enum import StrEnum
-from typing import Literal
+from typing import Annotated, Literal
 
 import pydantic
 
@@ -51,7 +51,10 @@ class ChoiceFormField(BaseFormField):
     multiple: bool
 
 
-type FormField = TextFormField | ChoiceFormField
+type FormField = Annotated[
+    TextFormField | ChoiceFormField,
+    pydantic.Field(discriminator="kind"),
+]
 
 FormFieldResolver = pydantic.TypeAdapter(
     type=FormField,
@@ -82,7 +85,10 @@ class ChoiceAnswer(BaseAnswer):
     option_indexes: set[int]
 
 
-type Answer = TextAnswer | ChoiceAnswer
+type Answer = Annotated[
+    TextAnswer | ChoiceAnswer,
+    pydantic.Field(discriminator="kind"),
+]
 
 AnswerResolver = pydantic.TypeAdapter(
     type=Answer,
@@ -1,5 +1,5 @@
 from enum import StrEnum
-from typing import Literal
+from typing import Annotated, Literal
 
 import pydantic
 
@@ -55,7 +55,7 @@ class CodeEntity(BaseFormatEntity, frozen=True):
     language: str
 
 
-type FormatEntity = (
+type FormatEntity = Annotated[
     SpoilerEntity
     | BoldEntity
     | ItalicEntity
@@ -63,8 +63,9 @@ type FormatEntity = (
     | LinkEntity
     | StrikethroughEntity
     | UnderlineEntity
-    | CodeEntity
-)
+    | CodeEntity,
+    pydantic.Field(discriminator="option"),
+]
 
 FormatEntityResolver = pydantic.TypeAdapter(
     type=FormatEntity,
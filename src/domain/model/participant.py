@@ -1,6 +1,6 @@
 import datetime
 from enum import StrEnum
-from typing import Literal
+from typing import Annotated, Literal
 
 import pydantic
 
@@ -47,9 +47,10 @@ class AllocatedParticipant(BaseParticipant):
     room_id: ObjectID
 
 
-type Participant = (
-    CreatingParticipant | CreatedParticipant | ActiveParticipant | AllocatedParticipant
-)
+type Participant = Annotated[
+    CreatingParticipant | CreatedParticipant | ActiveParticipant | AllocatedParticipant,
+    pydantic.Field(discriminator="state"),
+]
 
 
 ParticipantResolver = pydantic.TypeAdapter(
@@ -2,4 +2,8 @@
 Cache Protocols module.
 """
 
+from src.protocol.internal.cache.codec import CodecProtocol
 from src.protocol.internal.cache.generic import CacheProtocol
+from src.protocol.internal.cache.invalidation import InvalidationProtocol
+from src.protocol.internal.cache.lookup import Lookup, LookupCacheProtocol
+from src.protocol.internal.cache.persisted import PersistedQueryProtocol
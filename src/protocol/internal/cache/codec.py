@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+
+class CodecProtocol[V](ABC):
+    @property
+    @abstractmethod
+    def version(self) -> str:
+        """
+        Identifies the encoding, values of other versions are not readable.
+        """
+
+    @abstractmethod
+    def encode(self, value: V) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> V | None:
+        """
+        Returns None for data written with another schema, callers handle it as a miss.
+        """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from typing import TypeVar
 
 from pydantic import BaseModel
@@ -29,3 +30,29 @@ class CacheProtocol[V](ABC):
 
     @abstractmethod
     async def flush(self) -> None: ...
+
+    async def delete_tags(self, tags: list[str]) -> list[domain.ObjectID]:
+        """
+        Deletes the values tagged with any of `tags` and returns their keys.
+        Caches without tags have nothing to delete.
+        """
+        return []
+
+    async def load_many(
+        self,
+        keys: list[domain.ObjectID],
+        fetch: Callable[[list[domain.ObjectID]], Awaitable[list[V]]],
+    ) -> list[V]:
+        """
+        Reads the keys, the missing ones are fetched with `fetch` and cached.
+        """
+        cached = await self.get_many(keys)
+        missing = [
+            key for key, value in zip(keys, cached, strict=True) if value is None
+        ]
+        if not missing:
+            return cached  # type: ignore
+
+        fetched = dict(zip(missing, await fetch(missing), strict=True))
+        await self.put_many(list(fetched.items()))
+        return [fetched.get(key, value) for key, value in zip(keys, cached, strict=True)]  # type: ignore
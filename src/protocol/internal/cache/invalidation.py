@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+class InvalidationProtocol[K](ABC):
+    @abstractmethod
+    async def publish(self, keys: list[K]) -> None: ...
+
+    @abstractmethod
+    async def listen(
+        self,
+        callback: Callable[[list[K]], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """
+        Calls `callback` with the keys published by the other subscribers, runs forever.
+        `reset` is called when published keys may have been missed, on (re)connects.
+        """
@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+import src.domain.model as domain
+
+
+class Lookup(NamedTuple):
+    id: domain.ObjectID | None  # None for keys known to be missing
+
+
+class LookupCacheProtocol(ABC):
+    """
+    Caches lookups of object ids by integer keys, including the failed ones.
+    """
+
+    @abstractmethod
+    async def get(self, key: int) -> Lookup | None: ...
+
+    @abstractmethod
+    async def put(self, key: int, id: domain.ObjectID | None) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: int) -> None: ...
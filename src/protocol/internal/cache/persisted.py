@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+
+class PersistedQueryProtocol(ABC):
+    """
+    Stores GraphQL query texts by the hex sha256 of the text. A hash always names
+    the same text, so entries are never updated in place.
+    """
+
+    @abstractmethod
+    async def get(self, hash: str) -> str | None: ...
+
+    @abstractmethod
+    async def put(self, hash: str, query: str) -> None: ...
@@ -5,6 +5,7 @@ All protocols related to CRUD operations with databases should be defined here.
 
 from src.protocol.internal.database import (
     allocation,
+    existence,
     form_field,
     mixin,
     participant,
@@ -25,6 +26,7 @@ from src.protocol.internal.database.allocation import (
     ReadAllocation,
     UpdateAllocation,
 )
+from src.protocol.internal.database.existence import ExistenceState, existence_state
 from src.protocol.internal.database.form_field import (
     CreateAnswer,
     CreateChoiceAnswer,
@@ -53,8 +55,10 @@ from src.protocol.internal.database.participant import (
     CreateCreatingParticipant,
     CreateParticipant,
     DeleteParticipant,
+    FindParticipant,
     ParticipantDatabaseProtocol,
     ReadParticipant,
+    SampleParticipants,
     UpdateParticipant,
 )
 from src.protocol.internal.database.preference import (
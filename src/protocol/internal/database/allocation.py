@@ -1,6 +1,6 @@
 import datetime
 from abc import ABC, abstractmethod
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
@@ -17,6 +17,7 @@ from src.domain.model.allocation import (
     RoomingAllocation,
 )
 from src.domain.model.scalar.object_id import ObjectID
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 
@@ -41,15 +42,16 @@ class CreateClosedAllocation(ExcludeFieldMixin, ClosedAllocation): ...
 class CreateFailedAllocation(ExcludeFieldMixin, FailedAllocation): ...
 
 
-type CreateAllocation = (
+type CreateAllocation = Annotated[
     CreateCreatingAllocation
     | CreateCreatedAllocation
     | CreateOpenAllocation
     | CreateRoomingAllocation
     | CreateRoomedAllocation
     | CreateClosedAllocation
-    | CreateFailedAllocation
-)
+    | CreateFailedAllocation,
+    Field(discriminator="state"),
+]
 
 CreateAllocationResolver = TypeAdapter(
     type=CreateAllocation,
@@ -95,3 +97,8 @@ class AllocationDatabaseProtocol(ABC):
     async def read_many_allocations(
         self, allocations: list[ReadAllocation]
     ) -> list[Allocation | None]: ...
+
+    @abstractmethod
+    async def exists_many_allocations(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
@@ -0,0 +1,23 @@
+from datetime import datetime
+from enum import StrEnum
+from typing import Protocol
+
+
+class ExistenceState(StrEnum):
+    MISSING = "missing"
+    ACTIVE = "active"
+    DELETED = "deleted"
+
+
+class WithDeleted(Protocol):
+    deleted_at: datetime | None
+
+
+def existence_state(document: WithDeleted | None) -> ExistenceState:
+    if document is None:
+        return ExistenceState.MISSING
+
+    if document.deleted_at is not None:
+        return ExistenceState.DELETED
+
+    return ExistenceState.ACTIVE
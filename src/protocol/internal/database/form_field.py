@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from re import Pattern
-from typing import Literal
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
@@ -15,6 +17,7 @@ from src.domain.model.form_field import (
 )
 from src.domain.model.format_entity import FormatEntity
 from src.domain.model.scalar.object_id import ObjectID
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 
@@ -24,7 +27,10 @@ class CreateTextFormField(ExcludeFieldMixin, TextFormField): ...
 class CreateChoiceFormField(ExcludeFieldMixin, ChoiceFormField): ...
 
 
-type CreateFormField = CreateTextFormField | CreateChoiceFormField
+type CreateFormField = Annotated[
+    CreateTextFormField | CreateChoiceFormField,
+    Field(discriminator="kind"),
+]
 
 CreateFormFieldResolver = TypeAdapter(
     type=CreateFormField,
@@ -71,7 +77,10 @@ class UpdateChoiceFormField(ExcludeFieldMixin, ChoiceFormField):
     creator_id: Literal[None] = None
 
 
-type UpdateFormField = UpdateTextFormField | UpdateChoiceFormField
+type UpdateFormField = Annotated[
+    UpdateTextFormField | UpdateChoiceFormField,
+    Field(discriminator="kind"),
+]
 
 UpdateFormFieldResolver = TypeAdapter(
     type=UpdateFormField,
@@ -89,7 +98,10 @@ class CreateTextAnswer(ExcludeFieldMixin, TextAnswer): ...
 class CreateChoiceAnswer(ExcludeFieldMixin, ChoiceAnswer): ...
 
 
-type CreateAnswer = CreateTextAnswer | CreateChoiceAnswer
+type CreateAnswer = Annotated[
+    CreateTextAnswer | CreateChoiceAnswer,
+    Field(discriminator="kind"),
+]
 
 
 CreateAnswerResolver = TypeAdapter(
@@ -119,7 +131,10 @@ class UpdateChoiceAnswer(ExcludeFieldMixin, ChoiceAnswer):
     respondent_id: Literal[None] = None
 
 
-type UpdateAnswer = UpdateTextAnswer | UpdateChoiceAnswer
+type UpdateAnswer = Annotated[
+    UpdateTextAnswer | UpdateChoiceAnswer,
+    Field(discriminator="kind"),
+]
 
 UpdateAnswerResolver = TypeAdapter(
     type=UpdateAnswer,
@@ -149,6 +164,11 @@ class FormFieldDatabaseProtocol(ABC):
         self, form_fields: list[ReadFormField]
     ) -> list[FormField | None]: ...
 
+    @abstractmethod
+    async def exists_many_form_fields(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
+
     @abstractmethod
     async def create_answer(self, answer: CreateAnswer) -> Answer: ...
 
@@ -166,5 +186,23 @@ class FormFieldDatabaseProtocol(ABC):
         self, answers: list[ReadAnswer]
     ) -> list[Answer | None]: ...
 
+    @abstractmethod
+    async def exists_many_answers(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
+
     @abstractmethod
     async def read_all_answers(self) -> list[Answer]: ...
+
+    @abstractmethod
+    async def read_answers_by_respondents(
+        self, respondent_ids: list[ObjectID]
+    ) -> list[Answer]: ...
+
+    @abstractmethod
+    def iter_answers(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[Answer]: ...
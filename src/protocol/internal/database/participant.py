@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Literal
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 import src.domain.model.participant as domain
 from src.domain.model.scalar.object_id import ObjectID
+from src.domain.model.user import Gender
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 
@@ -20,12 +24,13 @@ class CreateActiveParticipant(ExcludeFieldMixin, domain.ActiveParticipant): ...
 class CreateAllocatedParticipant(ExcludeFieldMixin, domain.AllocatedParticipant): ...
 
 
-type CreateParticipant = (
+type CreateParticipant = Annotated[
     CreateCreatingParticipant
     | CreateCreatedParticipant
     | CreateActiveParticipant
-    | CreateAllocatedParticipant
-)
+    | CreateAllocatedParticipant,
+    Field(discriminator="state"),
+]
 
 CreateParticipantResolver = TypeAdapter(
     type=CreateParticipant,
@@ -54,6 +59,18 @@ class DeleteParticipant(BaseModel):
     id: ObjectID = Field(alias="_id")
 
 
+class FindParticipant(BaseModel):
+    user_id: ObjectID
+    allocation_id: ObjectID
+
+
+class SampleParticipants(BaseModel):
+    allocation_id: ObjectID
+    excluded_user_id: ObjectID
+    excluded_ids: set[ObjectID] = Field(default_factory=set)
+    size: int = Field(gt=0)
+
+
 class ParticipantDatabaseProtocol(ABC):
     @abstractmethod
     async def create_participant(
@@ -80,5 +97,36 @@ class ParticipantDatabaseProtocol(ABC):
         self, participants: list[ReadParticipant]
     ) -> list[domain.Participant | None]: ...
 
+    @abstractmethod
+    async def exists_many_participants(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
+
     @abstractmethod
     async def read_all_participants(self) -> list[domain.Participant]: ...
+
+    @abstractmethod
+    async def find_participant(
+        self, participant: FindParticipant
+    ) -> domain.Participant | None: ...
+
+    @abstractmethod
+    async def sample_participants(
+        self, participants: SampleParticipants
+    ) -> list[domain.Participant]: ...
+
+    @abstractmethod
+    def iter_participants(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Participant]: ...
+
+    @abstractmethod
+    def iter_participants_with_gender(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[tuple[domain.Participant, Gender | None]]: ...
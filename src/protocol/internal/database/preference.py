@@ -4,6 +4,7 @@ from typing import Literal
 from pydantic import BaseModel, Field
 
 import src.domain.model as domain
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 
@@ -59,6 +60,11 @@ class PreferenceDatabaseProtocol(ABC):
         self, preferences: list[ReadPreference]
     ) -> list[domain.Preference | None]: ...
 
+    @abstractmethod
+    async def exists_many_preferences(
+        self, ids: list[domain.ObjectID]
+    ) -> dict[domain.ObjectID, ExistenceState]: ...
+
     @abstractmethod
     async def find_preferences(
         self, preference: FindPreference
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 from src.domain.model.room import Room
 from src.domain.model.scalar.object_id import ObjectID
 from src.domain.model.user import Gender
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 
@@ -47,3 +48,8 @@ class RoomDatabaseProtocol(ABC):
 
     @abstractmethod
     async def read_many_rooms(self, rooms: list[ReadRoom]) -> list[Room | None]: ...
+
+    @abstractmethod
+    async def exists_many_rooms(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 
 from src.domain.model.scalar.object_id import ObjectID
 from src.domain.model.user import Gender, LanguageCode, Profile, User
+from src.protocol.internal.database.existence import ExistenceState
 from src.protocol.internal.database.mixin import ExcludeFieldMixin
 
 # todo: pydantic v2 has no ability to generate DTO types
@@ -71,3 +72,8 @@ class UserDatabaseProtocol(ABC):
 
     @abstractmethod
     async def read_many_users(self, users: list[ReadUser]) -> list[User | None]: ...
+
+    @abstractmethod
+    async def exists_many_users(
+        self, ids: list[ObjectID]
+    ) -> dict[ObjectID, ExistenceState]: ...
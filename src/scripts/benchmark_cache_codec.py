@@ -0,0 +1,114 @@
+"""
+Size and encode/decode cost of the cache codecs, pickle against the pydantic-core JSON one.
+Runs without Redis, values are serialized in process.
+"""
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import src.domain.model as domain
+from src.adapter.internal.cache.codec import JsonCodec, PickleCodec
+from src.protocol.internal.cache import CodecProtocol
+
+N_VALUES = 2000
+N_VIEWED = 50
+N_ROUNDS = 5
+
+_timestamp = datetime.now().replace(microsecond=0)
+
+
+def _user() -> domain.User:
+    return domain.User.model_validate(
+        {
+            "_id": domain.ObjectID(),
+            "telegram_id": 1,
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "profile": {
+                "username": "test",
+                "first_name": "test",
+                "last_name": "test",
+                "language_code": "en",
+                "gender": "male",
+                "birthdate": _timestamp.date(),
+            },
+        }
+    )
+
+
+def _participant() -> domain.Participant:
+    return domain.ParticipantResolver.validate_python(
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "allocation_id": domain.ObjectID(),
+            "user_id": domain.ObjectID(),
+            "state": "active",
+            "viewed_ids": {domain.ObjectID() for _ in range(N_VIEWED)},
+        }
+    )
+
+
+def _form_field() -> domain.FormField:
+    return domain.FormFieldResolver.validate_python(
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "kind": "choice",
+            "required": True,
+            "frozen": False,
+            "question": "test",
+            "creator_id": domain.ObjectID(),
+            "options": [{"text": f"option {i}"} for i in range(10)],
+            "multiple": False,
+        }
+    )
+
+
+def _best(run: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(N_ROUNDS):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    return best / N_VALUES * 1e6
+
+
+def _measure(
+    codec: CodecProtocol[Any], values: list[Any]
+) -> tuple[float, float, float]:
+    encoded = [codec.encode(value) for value in values]
+    assert [codec.decode(data) for data in encoded] == values
+
+    size = sum(map(len, encoded)) / len(encoded)
+    encode = _best(lambda: [codec.encode(value) for value in values])
+    decode = _best(lambda: [codec.decode(data) for data in encoded])
+    return size, encode, decode
+
+
+def main():
+    for name, annotation, factory in [
+        ("user", domain.User, _user),
+        ("participant", domain.Participant, _participant),
+        ("form field", domain.FormField, _form_field),
+    ]:
+        values = [factory() for _ in range(N_VALUES)]
+        print(f"{name}, {N_VALUES} values")
+        for codec_name, codec in [
+            ("pickle", PickleCodec()),
+            ("json", JsonCodec(annotation)),
+        ]:
+            size, encode, decode = _measure(codec, values)
+            print(
+                f"  {codec_name:6}  {size:8.0f} bytes"
+                f"  encode {encode:6.2f} us  decode {decode:6.2f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Per-request cost of the GraphQL context, without token verification. Loaders are
+built on first use, the eager row resolves every registered loader up front as
+`get_context` did before. Runs on the in-memory repository.
+"""
+
+import asyncio
+import secrets
+import time
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from src.adapter.external.auth.telegram import TelegramOauthAdapter
+from src.adapter.external.graphql.schema import SCHEMA
+from src.adapter.external.graphql.tool.context import Context
+from src.adapter.external.graphql.view import RandormGraphQLView
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service.allocation import AllocationService
+from src.service.answer import AnswerService
+from src.service.form_field import FormFieldService
+from src.service.identity import EntityKind
+from src.service.participant import ParticipantService
+from src.service.preference import PreferenceService
+from src.service.room import RoomService
+from src.service.user import UserService
+
+N_REQUESTS = 20000
+N_ROUNDS = 5
+
+LOADERS = [*EntityKind, "respondent_answers"]
+
+
+def _view() -> RandormGraphQLView:
+    repo = MemoryDBAdapter()
+    user_service = UserService(repo)
+    jwt_secret = secrets.token_hex(32)
+    return RandormGraphQLView(
+        SCHEMA,
+        TelegramOauthAdapter("secret", jwt_secret, user_service),
+        jwt_secret,
+        user_service,
+        AllocationService(repo, repo, repo, repo),
+        FormFieldService(repo, repo, repo),
+        AnswerService(repo, repo),
+        ParticipantService(repo, repo, repo, repo),
+        PreferenceService(repo, repo),
+        RoomService(repo, repo),
+    )
+
+
+async def _best(view: RandormGraphQLView, touch: Callable[[Context], None]) -> float:
+    request = SimpleNamespace(headers={}, cookies={})
+
+    best = float("inf")
+    for _ in range(N_ROUNDS):
+        start = time.perf_counter()
+        for _ in range(N_REQUESTS):
+            touch(await view.get_context(request, None))
+        best = min(best, time.perf_counter() - start)
+
+    return best / N_REQUESTS * 1e6
+
+
+def _none(context: Context) -> None:
+    pass
+
+
+def _me(context: Context) -> None:
+    assert context.user.loader is not None
+
+
+def _all(context: Context) -> None:
+    for name in LOADERS:
+        assert context.loaders[name] is not None
+
+
+async def main():
+    view = _view()
+
+    print(f"{N_REQUESTS} contexts")
+    for name, touch in [
+        ("no loaders", _none),
+        ("me query", _me),
+        ("eager", _all),
+    ]:
+        cost = await _best(view, touch)
+        print(f"  {name:10}  {cost:6.2f} us  {1e6 / cost:10.0f} contexts/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,132 @@
+"""
+Per-document decode cost of the Beanie and the raw Motor adapters,
+the latter with validated and trusted decoding.
+Requires a MongoDB instance on localhost, seeded documents are removed afterwards.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import bson
+from beanie.odm.utils.parsing import parse_obj
+from bson.raw_bson import RawBSONDocument
+from motor.motor_asyncio import AsyncIOMotorClient
+
+import src.domain.model as domain
+from src.adapter.internal.database.mongodb import models
+from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb import codec, decode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
+
+DSN = "mongodb://localhost:27017"
+N_PARTICIPANTS = 5000
+N_VIEWED = 50
+N_ROUNDS = 5
+
+
+def _participant(allocation_id: domain.ObjectID) -> domain.Participant:
+    timestamp = datetime.now().replace(microsecond=0)
+    return domain.ParticipantResolver.validate_python(
+        {
+            "_id": domain.ObjectID(),
+            "created_at": timestamp,
+            "updated_at": timestamp,
+            "allocation_id": allocation_id,
+            "user_id": domain.ObjectID(),
+            "state": domain.ParticipantState.ACTIVE,
+            "viewed_ids": {domain.ObjectID() for _ in range(N_VIEWED)},
+        }
+    )
+
+
+def _beanie_decode(raw: RawBSONDocument) -> domain.Participant:
+    # what `MongoDBAdapter` does: motor dict -> beanie document -> domain model
+    document: Any = parse_obj(models.ParticipantDocument, bson.decode(raw.raw))
+    return domain.ParticipantResolver.validate_python(
+        document.model_dump(by_alias=True)
+    )
+
+
+def _motor_decode(raw: RawBSONDocument) -> domain.Participant:
+    return domain.ParticipantResolver.validate_python(
+        RawBSONDocument(raw.raw, codec.CODEC_OPTIONS)
+    )
+
+
+_trusted = decode.Decoder(
+    domain.Participant,
+    domain.ParticipantResolver.validate_python,
+    decode.DecodeMode.TRUSTED,
+)
+
+
+def _trusted_decode(raw: RawBSONDocument) -> domain.Participant:
+    return _trusted(RawBSONDocument(raw.raw, codec.CODEC_OPTIONS))
+
+
+def _per_document(decode: Callable[[RawBSONDocument], Any], raws: list) -> float:
+    best = float("inf")
+    for _ in range(N_ROUNDS):
+        start = time.perf_counter()
+        for raw in raws:
+            decode(raw)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(raws) * 1e6
+
+
+async def _iterate(adapter: MongoDBAdapter | MotorDBAdapter) -> float:
+    start = time.perf_counter()
+    count = 0
+    async for _ in adapter.iter_participants():
+        count += 1
+
+    return (time.perf_counter() - start) / max(count, 1) * 1e6
+
+
+async def main():
+    beanie_adapter = await MongoDBAdapter.create(DSN)
+    motor_adapter = await MotorDBAdapter.create(DSN)
+    trusted_adapter = await MotorDBAdapter.create(DSN, decode.DecodeMode.TRUSTED)
+
+    client = AsyncIOMotorClient(DSN)
+    collection = client.get_database("randorm", codec_options=codec.CODEC_OPTIONS)[
+        models.ParticipantDocument.Settings.name
+    ]
+
+    allocation_id = domain.ObjectID()
+    class_id = models.class_id(models.ActiveParticipant)
+    await collection.insert_many(
+        [
+            codec.to_document(_participant(allocation_id), class_id)
+            for _ in range(N_PARTICIPANTS)
+        ]
+    )
+
+    try:
+        raws = await collection.find({"allocation_id": allocation_id}).to_list(None)
+
+        beanie = _per_document(_beanie_decode, raws)
+        motor = _per_document(_motor_decode, raws)
+        trusted = _per_document(_trusted_decode, raws)
+        print(f"decode, {len(raws)} participants with {N_VIEWED} viewed ids each")
+        print(f"  beanie:  {beanie:8.2f} us/document")
+        print(f"  motor:   {motor:8.2f} us/document ({beanie / motor:.1f}x)")
+        print(f"  trusted: {trusted:8.2f} us/document ({beanie / trusted:.1f}x)")
+
+        beanie = await _iterate(beanie_adapter)
+        motor = await _iterate(motor_adapter)
+        trusted = await _iterate(trusted_adapter)
+        print("iter_participants, including network")
+        print(f"  beanie:  {beanie:8.2f} us/document")
+        print(f"  motor:   {motor:8.2f} us/document ({beanie / motor:.1f}x)")
+        print(f"  trusted: {trusted:8.2f} us/document ({beanie / trusted:.1f}x)")
+    finally:
+        await collection.delete_many({"allocation_id": allocation_id})
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+"""
+Registers the queries of the clients for the GraphQL allowlist mode. Takes `.graphql`
+files, each sent by the client as is, and Apollo persisted query manifests (`.json`).
+
+    python -m src.scripts.register_persisted_queries queries/*.graphql manifest.json
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from main import PERSISTED_QUERY_ALLOWLIST_NAMESPACE
+from src.adapter.internal.cache.redisdb.persisted import RedisPersistedQueryService
+
+
+def _queries(path: Path) -> list[str]:
+    if path.suffix == ".json":
+        manifest = json.loads(path.read_text())
+        return [operation["body"] for operation in manifest["operations"]]
+
+    return [path.read_text()]
+
+
+async def main():
+    load_dotenv()
+
+    redis_dsn = os.getenv("REDIS_DSN")
+    if redis_dsn is None:
+        raise RuntimeError("REDIS_DSN is not set")
+
+    store = RedisPersistedQueryService(redis_dsn, PERSISTED_QUERY_ALLOWLIST_NAMESPACE)
+    for path in map(Path, sys.argv[1:]):
+        for query in _queries(path):
+            hash = hashlib.sha256(query.encode()).hexdigest()
+            await store.put(hash, query)
+            print(f"{hash}  {path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
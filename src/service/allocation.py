@@ -1,7 +1,7 @@
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -20,29 +20,62 @@ class AllocationService(BaseService):
         self._form_field_repo = form_field_repo
         self._participant_repo = participant_repo
         self._user_repo = user_repo
+        self._references = common.ReferenceChecker(
+            user_repo=user_repo,
+            form_field_repo=form_field_repo,
+            participant_repo=participant_repo,
+        )
 
     async def create(self, allocation: proto.CreateAllocation) -> domain.Allocation:
         try:
             log.debug("creating new allocation")
 
-            log.debug("checking allocation creator existence")
-            if not await common.check_creator_exist(allocation, self._user_repo):
+            references = [
+                common.Reference(
+                    "creator", common.ReferenceKind.USER, {allocation.creator_id}
+                ),
+                common.Reference(
+                    "editors", common.ReferenceKind.USER, allocation.editors_ids
+                ),
+                common.Reference(
+                    "form fields",
+                    common.ReferenceKind.FORM_FIELD,
+                    allocation.form_fields_ids,
+                ),
+            ]
+            if isinstance(
+                allocation,
+                proto.CreateCreatedAllocation
+                | proto.CreateOpenAllocation
+                | proto.CreateRoomingAllocation
+                | proto.CreateRoomedAllocation
+                | proto.CreateClosedAllocation,
+            ):
+                references.append(
+                    common.Reference(
+                        "participants",
+                        common.ReferenceKind.PARTICIPANT,
+                        allocation.participants_ids,
+                        allow_deleted=True,
+                    )
+                )
+
+            log.debug("checking allocation references existence")
+            report = await self._references.check(*references)
+
+            if not report.exist("creator"):
                 log.error("creator does not exist")
                 raise service_exception.CreateAllocationException(
                     "creator does not exist"
                 )
 
-            log.debug("checking allocation editors existence")
-            if not await common.check_editors_exist(allocation, self._user_repo):
+            if not report.exist("editors"):
                 log.error("one or more editors do not exist")
                 raise service_exception.CreateAllocationException(
                     "one or more editors do not exist"
                 )
 
-            log.debug("checking allocation form fields existence")
-            if not await common.check_form_fields_exist(
-                allocation, self._form_field_repo
-            ):
+            if not report.exist("form fields"):
                 log.error("one or more form fields does not exist")
                 raise service_exception.CreateAllocationException(
                     "one or more form fields does not exist"
@@ -53,25 +86,17 @@ class AllocationService(BaseService):
             #         raise service_exception.CreateAllocationException(
             #             "due date is in the past"
             #         )
-            log.debug("checking allocation participants existence")
-            if isinstance(
-                allocation,
-                proto.CreateCreatedAllocation
-                | proto.CreateOpenAllocation
-                | proto.CreateRoomingAllocation
-                | proto.CreateRoomedAllocation
-                | proto.CreateClosedAllocation,
-            ):
-                if not await common.check_participants_exist(
-                    allocation, self._participant_repo
-                ):
-                    log.error("one or more participants does not exist")
-                    raise service_exception.CreateAllocationException(
-                        "one or more participants does not exist"
-                    )
+            if not report.exist("participants"):
+                log.error("one or more participants does not exist")
+                raise service_exception.CreateAllocationException(
+                    "one or more participants does not exist"
+                )
 
             log.debug("creating new allocation")
-            return await self._allocation_repo.create_allocation(allocation)
+            return await identity.current().write(
+                identity.EntityKind.ALLOCATION,
+                await self._allocation_repo.create_allocation(allocation),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to create allocation with error: {}", e)
             raise e
@@ -84,7 +109,11 @@ class AllocationService(BaseService):
     async def read(self, allocation: proto.ReadAllocation) -> domain.Allocation:
         try:
             log.debug(f"reading allocation {allocation.id}")
-            return await self._allocation_repo.read_allocation(allocation)
+            return await identity.current().read(
+                identity.EntityKind.ALLOCATION,
+                allocation.id,
+                lambda: self._allocation_repo.read_allocation(allocation),
+            )
         except Exception as e:
             log.error("failed to read allocation with error: {}", e)
             raise service_exception.ReadAllocationException(
@@ -96,8 +125,12 @@ class AllocationService(BaseService):
             log.debug(f"updating allocation {allocation.id}")
             try:
                 log.debug(f"reading allocation {allocation.id}")
-                current = await self._allocation_repo.read_allocation(
-                    proto.ReadAllocation(_id=allocation.id)
+                current = await identity.current().read(
+                    identity.EntityKind.ALLOCATION,
+                    allocation.id,
+                    lambda: self._allocation_repo.read_allocation(
+                        proto.ReadAllocation(_id=allocation.id)
+                    ),
                 )
             except Exception as e:
                 log.error("failed to read allocation with error: {}", e)
@@ -120,10 +153,14 @@ class AllocationService(BaseService):
 
             log.debug("checking allocation form fields existence")
             if allocation.form_fields_ids is not None:
-                if not await common.check_form_fields_exist(
-                    allocation,  # type: ignore
-                    self._form_field_repo,
-                ):
+                report = await self._references.check(
+                    common.Reference(
+                        "form fields",
+                        common.ReferenceKind.FORM_FIELD,
+                        allocation.form_fields_ids,
+                    )
+                )
+                if not report.valid:
                     log.error("one or more form fields does not exist")
                     raise service_exception.UpdateAllocationException(
                         "one or more form fields does not exist"
@@ -136,7 +173,10 @@ class AllocationService(BaseService):
                 )
 
             log.debug("updating allocation")
-            return await self._allocation_repo.update_allocation(allocation)
+            return await identity.current().write(
+                identity.EntityKind.ALLOCATION,
+                await self._allocation_repo.update_allocation(allocation),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update allocation with error: {}", e)
             raise e
@@ -149,7 +189,10 @@ class AllocationService(BaseService):
     async def delete(self, allocation: proto.DeleteAllocation) -> domain.Allocation:
         try:
             log.debug(f"deleting allocation {allocation.id}")
-            return await self._allocation_repo.delete_allocation(allocation)
+            return await identity.current().write(
+                identity.EntityKind.ALLOCATION,
+                await self._allocation_repo.delete_allocation(allocation),
+            )
         except Exception as e:
             log.error("failed to delete allocation with error: {}", e)
             raise service_exception.DeleteAllocationException(
@@ -163,7 +206,13 @@ class AllocationService(BaseService):
             log.debug(
                 f"reading allocations {[str(allocation.id) for  allocation in allocations]}"
             )
-            documents = await self._allocation_repo.read_many_allocations(allocations)
+            documents = await identity.current().read_many(
+                identity.EntityKind.ALLOCATION,
+                [item.id for item in allocations],
+                lambda ids: self._allocation_repo.read_many_allocations(
+                    [proto.ReadAllocation(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(allocations, documents, strict=True):
                 if response is None:
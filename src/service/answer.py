@@ -1,7 +1,10 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.utils.logger.logger import Logger
 
 log = Logger("answer-service")
@@ -15,29 +18,47 @@ class AnswerService:
     ):
         self._form_field_repo = form_field_repo
         self._participant_repo = participant_repo
+        self._references = common.ReferenceChecker(
+            form_field_repo=form_field_repo,
+            participant_repo=participant_repo,
+        )
 
     async def create(self, answer: proto.CreateAnswer) -> domain.Answer:
         try:
             # todo: check dublicates
-            log.debug("checking answer respondent existence")
+            log.debug("checking answer references existence")
+            report = await self._references.check(
+                common.Reference(
+                    "form field",
+                    common.ReferenceKind.FORM_FIELD,
+                    {answer.form_field_id},
+                ),
+                common.Reference(
+                    "respondent",
+                    common.ReferenceKind.PARTICIPANT,
+                    {answer.respondent_id},
+                ),
+            )
 
-            log.debug("checking answer form field existence")
-            if not await common.check_form_field_exist(answer, self._form_field_repo):
+            if not report.exist("form field"):
                 log.error("form field does not exist")
                 raise service_exception.CreateAnswerException(
                     "form field does not exist"
                 )
 
-            log.debug("checking answer respondent existence")
-            if not await common.check_respondent_exist(answer, self._participant_repo):
+            if not report.exist("respondent"):
                 log.error("participant does not exist")
                 raise service_exception.CreateAnswerException(
                     "participant does not exist"
                 )
 
             log.debug("reading form field")
-            question = await self._form_field_repo.read_form_field(
-                proto.ReadFormField(_id=answer.form_field_id)
+            question = await identity.current().read(
+                identity.EntityKind.FORM_FIELD,
+                answer.form_field_id,
+                lambda: self._form_field_repo.read_form_field(
+                    proto.ReadFormField(_id=answer.form_field_id)
+                ),
             )
 
             if isinstance(answer, proto.CreateChoiceAnswer):
@@ -49,7 +70,10 @@ class AnswerService:
                 self.__check_text_answer(answer, question)
 
             log.debug("creating new answer")
-            return await self._form_field_repo.create_answer(answer)
+            return await identity.current().write(
+                identity.EntityKind.ANSWER,
+                await self._form_field_repo.create_answer(answer),
+            )
 
         except service_exception.ServiceException as e:
             log.error("failed to create answer with error: {}", e)
@@ -63,7 +87,11 @@ class AnswerService:
     async def read(self, answer: proto.ReadAnswer) -> domain.Answer:
         try:
             log.debug(f"reading answer {answer.id}")
-            return await self._form_field_repo.read_answer(answer)
+            return await identity.current().read(
+                identity.EntityKind.ANSWER,
+                answer.id,
+                lambda: self._form_field_repo.read_answer(answer),
+            )
         except Exception as e:
             log.error("failed to read answer with error: {}", e)
             raise service_exception.ReadAnswerException(
@@ -75,8 +103,12 @@ class AnswerService:
             log.debug(f"updating answer {answer.id}")
             try:
                 log.debug(f"reading answer {answer.id}")
-                current = await self._form_field_repo.read_answer(
-                    proto.ReadAnswer(_id=answer.id)
+                current = await identity.current().read(
+                    identity.EntityKind.ANSWER,
+                    answer.id,
+                    lambda: self._form_field_repo.read_answer(
+                        proto.ReadAnswer(_id=answer.id)
+                    ),
                 )
             except Exception as e:
                 log.error("failed to read answer with error: {}", e)
@@ -106,8 +138,12 @@ class AnswerService:
                 )
 
             log.debug("reading form field")
-            question = await self._form_field_repo.read_form_field(
-                proto.ReadFormField(_id=current.form_field_id)
+            question = await identity.current().read(
+                identity.EntityKind.FORM_FIELD,
+                current.form_field_id,
+                lambda: self._form_field_repo.read_form_field(
+                    proto.ReadFormField(_id=current.form_field_id)
+                ),
             )
 
             if isinstance(answer, proto.UpdateChoiceAnswer):
@@ -119,7 +155,10 @@ class AnswerService:
                 self.__check_text_answer(answer, question)
 
             log.debug("updating answer")
-            return await self._form_field_repo.update_answer(answer)
+            return await identity.current().write(
+                identity.EntityKind.ANSWER,
+                await self._form_field_repo.update_answer(answer),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update answer with error: {}", e)
             raise e
@@ -132,7 +171,10 @@ class AnswerService:
     async def delete(self, answer: proto.DeleteAnswer) -> domain.Answer:
         try:
             log.debug(f"deleting answer {answer.id}")
-            return await self._form_field_repo.delete_answer(answer)
+            return await identity.current().write(
+                identity.EntityKind.ANSWER,
+                await self._form_field_repo.delete_answer(answer),
+            )
         except Exception as e:
             log.error("failed to delete answer with error: {}", e)
             raise service_exception.DeleteAnswerException(
@@ -142,7 +184,13 @@ class AnswerService:
     async def read_many(self, answers: list[proto.ReadAnswer]) -> list[domain.Answer]:
         try:
             log.debug(f"reading answers {[str(answer.id) for  answer in answers]}")
-            documents = await self._form_field_repo.read_many_answers(answers)
+            documents = await identity.current().read_many(
+                identity.EntityKind.ANSWER,
+                [item.id for item in answers],
+                lambda ids: self._form_field_repo.read_many_answers(
+                    [proto.ReadAnswer(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(answers, documents, strict=True):
                 if response is None:
@@ -174,6 +222,40 @@ class AnswerService:
                 "service failed to read all answers"
             ) from e
 
+    async def iter_all(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Answer]:
+        try:
+            log.debug("iterating all answers")
+            async for answer in self._form_field_repo.iter_answers(
+                batch_size, updated_since, updated_before
+            ):
+                yield answer
+        except Exception as e:
+            log.error("failed to iterate answers with error: {}", e)
+            raise service_exception.ReadAnswerException(
+                "service failed to iterate answers"
+            ) from e
+
+    async def read_by_respondents(
+        self, respondent_ids: list[domain.ObjectID]
+    ) -> list[domain.Answer]:
+        try:
+            log.debug(
+                f"reading answers of respondents {[str(id) for id in respondent_ids]}"
+            )
+            return await self._form_field_repo.read_answers_by_respondents(
+                respondent_ids
+            )
+        except Exception as e:
+            log.error("failed to read answers by respondents with error: {}", e)
+            raise service_exception.ReadAnswerException(
+                "service failed to read answers by respondents"
+            ) from e
+
     def __check_choice_answer(
         self,
         answer: proto.CreateChoiceAnswer | proto.UpdateChoiceAnswer,
@@ -0,0 +1,41 @@
+from collections.abc import Callable
+from typing import Any
+
+import src.domain.model as domain
+from src.protocol.internal.cache.generic import CacheProtocol
+from src.service import identity
+from src.utils.logger.logger import Logger
+
+log = Logger("cache-service")
+
+
+def allocation_tag(id: domain.ObjectID) -> str:
+    return f"allocation:{id}"
+
+
+# tags of the cached entities, evicted on writes of the tagged entity
+TAGS: dict[identity.EntityKind, Callable[[Any], list[str]]] = {
+    identity.EntityKind.PARTICIPANT: lambda item: [allocation_tag(item.allocation_id)],
+}
+
+
+class CacheEviction:
+    """
+    Write hook evicting the shared caches of the written entities, so that every
+    write path, not only GraphQL mutations, drops the stale values.
+    """
+
+    def __init__(self, caches: dict[identity.EntityKind, CacheProtocol]):
+        self._caches = caches
+
+    async def __call__(self, kind: identity.EntityKind, entity: Any) -> None:
+        try:
+            if (cache := self._caches.get(kind)) is not None:
+                await cache.delete(entity.id)
+
+            participants = self._caches.get(identity.EntityKind.PARTICIPANT)
+            if kind == identity.EntityKind.ALLOCATION and participants is not None:
+                await participants.delete_tags([allocation_tag(entity.id)])
+        except Exception as e:
+            # the write is done, the stale value expires with its ttl
+            log.error("failed to evict cached {} with error: {}", kind, e)
@@ -1,243 +1,117 @@
-from collections.abc import Sequence
-from datetime import datetime
-from typing import Any, Protocol
+import asyncio
+from collections.abc import Collection
+from dataclasses import dataclass, field
+from enum import StrEnum
 
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-
-
-def _any_none(data: list[Any | None]) -> bool:
-    return any(item is None for item in data)
-
-
-class WithDeleted(Protocol):
-    deleted_at: datetime | None
-
-
-def _any_deleted(data: Sequence[WithDeleted | None]) -> bool:
-    return any(item.deleted_at is not None for item in data if item is not None)
-
-
-class WithCreator(Protocol):
-    creator_id: domain.ObjectID
-
-
-async def check_creator_exist(obj: WithCreator, db: proto.UserDatabaseProtocol) -> bool:
-    try:
-        data = await db.read_many_users([proto.ReadUser(_id=obj.creator_id)])
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithEditors(Protocol):
-    editors_ids: set[domain.ObjectID]
-
-
-async def check_editors_exist(obj: WithEditors, db: proto.UserDatabaseProtocol) -> bool:
-    try:
-        data = await db.read_many_users(
-            [proto.ReadUser(_id=item) for item in obj.editors_ids]
-        )
-
-        if _any_none(data):
-            return False
-
-        # allow deleted users
-        # if _any_deleted(data):
-        #     return False
-
-        if any(item.deleted_at is not None for item in data if item is not None):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithFormFields(Protocol):
-    form_fields_ids: set[domain.ObjectID]
-
-
-async def check_form_fields_exist(
-    obj: WithFormFields, db: proto.FormFieldDatabaseProtocol
-) -> bool:
-    try:
-        data = await db.read_many_form_fields(
-            [proto.ReadFormField(_id=item) for item in obj.form_fields_ids]
-        )
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithParticipants(Protocol):
-    participants_ids: set[domain.ObjectID]
-
-
-async def check_participants_exist(
-    obj: WithParticipants, db: proto.ParticipantDatabaseProtocol
-) -> bool:
-    try:
-        data = await db.read_many_participants(
-            [proto.ReadParticipant(_id=item) for item in obj.participants_ids]
-        )
-
-        if any(item is None for item in data):
-            return False
-
-        # if _any_deleted(data):
-        #     return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithAllocation(Protocol):
-    allocation_id: domain.ObjectID
-
-
-async def check_allocation_exist(
-    obj: WithAllocation, db: proto.AllocationDatabaseProtocol
-) -> bool:
-    try:
-        data = await db.read_many_allocations(
-            [proto.ReadAllocation(_id=obj.allocation_id)]
-        )
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithUser(Protocol):
-    user_id: domain.ObjectID
-
-
-async def check_user_exist(obj: WithUser, db: proto.UserDatabaseProtocol) -> bool:
-    try:
-        data = await db.read_many_users([proto.ReadUser(_id=obj.user_id)])
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithRoom(Protocol):
-    room_id: domain.ObjectID
-
-
-async def check_room_exist(obj: WithRoom, db: proto.RoomDatabaseProtocol) -> bool:
-    try:
-        data = await db.read_many_rooms([proto.ReadRoom(_id=obj.room_id)])
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithTarget(Protocol):
-    target_id: domain.ObjectID
-
-
-async def check_target_exist(obj: WithTarget, db: proto.UserDatabaseProtocol) -> bool:
-    try:
-        data = await db.read_many_users([proto.ReadUser(_id=obj.target_id)])
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithFormField(Protocol):
-    form_field_id: domain.ObjectID
-
-
-async def check_form_field_exist(
-    obj: WithFormField, db: proto.FormFieldDatabaseProtocol
-) -> bool:
-    try:
-        data = await db.read_many_form_fields(
-            [proto.ReadFormField(_id=obj.form_field_id)]
+from src.utils.logger.logger import Logger
+
+log = Logger("common-service")
+
+
+class ReferenceKind(StrEnum):
+    USER = "user"
+    ALLOCATION = "allocation"
+    FORM_FIELD = "form_field"
+    PARTICIPANT = "participant"
+    ROOM = "room"
+
+
+@dataclass
+class Reference:
+    name: str
+    kind: ReferenceKind
+    ids: Collection[domain.ObjectID]
+    allow_deleted: bool = False
+
+
+@dataclass
+class ReferenceReport:
+    missing: dict[str, set[domain.ObjectID]] = field(default_factory=dict)
+    deleted: dict[str, set[domain.ObjectID]] = field(default_factory=dict)
+
+    def exist(self, name: str) -> bool:
+        return name not in self.missing and name not in self.deleted
+
+    @property
+    def valid(self) -> bool:
+        return not self.missing and not self.deleted
+
+
+class ReferenceChecker:
+    """
+    Resolves every reference of a request with one lookup per kind, lookups run concurrently.
+    """
+
+    def __init__(
+        self,
+        *,
+        user_repo: proto.UserDatabaseProtocol | None = None,
+        allocation_repo: proto.AllocationDatabaseProtocol | None = None,
+        form_field_repo: proto.FormFieldDatabaseProtocol | None = None,
+        participant_repo: proto.ParticipantDatabaseProtocol | None = None,
+        room_repo: proto.RoomDatabaseProtocol | None = None,
+    ):
+        self._user_repo = user_repo
+        self._allocation_repo = allocation_repo
+        self._form_field_repo = form_field_repo
+        self._participant_repo = participant_repo
+        self._room_repo = room_repo
+
+    async def check(self, *references: Reference) -> ReferenceReport:
+        grouped: dict[ReferenceKind, set[domain.ObjectID]] = {}
+        for reference in references:
+            grouped.setdefault(reference.kind, set()).update(reference.ids)
+
+        lookups = {kind: list(ids) for kind, ids in grouped.items() if ids}
+        results = await asyncio.gather(
+            *(self.__exists_many(kind, ids) for kind, ids in lookups.items()),
+            return_exceptions=True,
         )
 
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
-
-
-class WithRespondent(Protocol):
-    respondent_id: domain.ObjectID
-
-
-async def check_respondent_exist(
-    obj: WithRespondent, db: proto.ParticipantDatabaseProtocol
-) -> bool:
-    try:
-        data = await db.read_many_participants(
-            [proto.ReadParticipant(_id=obj.respondent_id)]
-        )
-
-        if _any_none(data):
-            return False
-
-        if _any_deleted(data):
-            return False
-
-    except Exception:
-        return False
-    else:
-        return True
+        # ids of failed lookups stay unresolved and are reported as missing
+        states: dict[ReferenceKind, dict[domain.ObjectID, proto.ExistenceState]] = {}
+        for kind, result in zip(lookups, results, strict=True):
+            if isinstance(result, BaseException):
+                log.error("failed to check {} references with error: {}", kind, result)
+                continue
+
+            states[kind] = result
+
+        report = ReferenceReport()
+        for reference in references:
+            found = states.get(reference.kind, {})
+            missing: set[domain.ObjectID] = set()
+            deleted: set[domain.ObjectID] = set()
+            for id in reference.ids:
+                match found.get(id, proto.ExistenceState.MISSING):
+                    case proto.ExistenceState.MISSING:
+                        missing.add(id)
+                    case proto.ExistenceState.DELETED if not reference.allow_deleted:
+                        deleted.add(id)
+
+            if missing:
+                report.missing[reference.name] = missing
+
+            if deleted:
+                report.deleted[reference.name] = deleted
+
+        return report
+
+    async def __exists_many(
+        self, kind: ReferenceKind, ids: list[domain.ObjectID]
+    ) -> dict[domain.ObjectID, proto.ExistenceState]:
+        match kind:
+            case ReferenceKind.USER if self._user_repo is not None:
+                return await self._user_repo.exists_many_users(ids)
+            case ReferenceKind.ALLOCATION if self._allocation_repo is not None:
+                return await self._allocation_repo.exists_many_allocations(ids)
+            case ReferenceKind.FORM_FIELD if self._form_field_repo is not None:
+                return await self._form_field_repo.exists_many_form_fields(ids)
+            case ReferenceKind.PARTICIPANT if self._participant_repo is not None:
+                return await self._participant_repo.exists_many_participants(ids)
+            case ReferenceKind.ROOM if self._room_repo is not None:
+                return await self._room_repo.exists_many_rooms(ids)
+
+        raise ValueError(f"no repository to check {kind} references")
@@ -1,7 +1,7 @@
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -18,27 +18,39 @@ class FormFieldService(BaseService):
         self._allocation_repo = allocation_repo
         self._form_field_repo = form_field_repo
         self._user_repo = user_repo
+        self._references = common.ReferenceChecker(user_repo=user_repo)
 
     async def create(self, form_field: proto.CreateFormField) -> domain.FormField:
         try:
             log.debug("creating new form field")
 
-            log.debug("checking form field creator existence")
-            if not await common.check_creator_exist(form_field, self._user_repo):
+            log.debug("checking form field references existence")
+            report = await self._references.check(
+                common.Reference(
+                    "creator", common.ReferenceKind.USER, {form_field.creator_id}
+                ),
+                common.Reference(
+                    "editors", common.ReferenceKind.USER, form_field.editors_ids
+                ),
+            )
+
+            if not report.exist("creator"):
                 log.error("creator does not exist")
                 raise service_exception.CreateFormFieldException(
                     "creator does not exist"
                 )
 
-            log.debug("checking form field editors existence")
-            if not await common.check_editors_exist(form_field, self._user_repo):
+            if not report.exist("editors"):
                 log.error("one or more editors do not exist")
                 raise service_exception.CreateFormFieldException(
                     "one or more editors do not exist"
                 )
 
             log.debug("creating new form field")
-            return await self._form_field_repo.create_form_field(form_field)
+            return await identity.current().write(
+                identity.EntityKind.FORM_FIELD,
+                await self._form_field_repo.create_form_field(form_field),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to create form field with error: {}", e)
             raise e
@@ -51,7 +63,11 @@ class FormFieldService(BaseService):
     async def read(self, form_field: proto.ReadFormField) -> domain.FormField:
         try:
             log.debug(f"reading form field {form_field.id}")
-            return await self._form_field_repo.read_form_field(form_field)
+            return await identity.current().read(
+                identity.EntityKind.FORM_FIELD,
+                form_field.id,
+                lambda: self._form_field_repo.read_form_field(form_field),
+            )
         except Exception as e:
             log.error("failed to read form field with error: {}", e)
             raise service_exception.ReadFormFieldException(
@@ -63,8 +79,12 @@ class FormFieldService(BaseService):
             log.debug(f"updating form field {form_field.id}")
             try:
                 log.debug(f"reading form field {form_field.id}")
-                current = await self._form_field_repo.read_form_field(
-                    proto.ReadFormField(_id=form_field.id)
+                current = await identity.current().read(
+                    identity.EntityKind.FORM_FIELD,
+                    form_field.id,
+                    lambda: self._form_field_repo.read_form_field(
+                        proto.ReadFormField(_id=form_field.id)
+                    ),
                 )
             except Exception as e:
                 log.error("failed to read form field with error: {}", e)
@@ -86,7 +106,10 @@ class FormFieldService(BaseService):
                     "creator can not be changed"
                 )
 
-            return await self._form_field_repo.update_form_field(form_field)
+            return await identity.current().write(
+                identity.EntityKind.FORM_FIELD,
+                await self._form_field_repo.update_form_field(form_field),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update form field with error: {}", e)
             raise e
@@ -99,7 +122,10 @@ class FormFieldService(BaseService):
     async def delete(self, form_field: proto.DeleteFormField) -> domain.FormField:
         try:
             log.debug(f"deleting form field {form_field.id}")
-            return await self._form_field_repo.delete_form_field(form_field)
+            return await identity.current().write(
+                identity.EntityKind.FORM_FIELD,
+                await self._form_field_repo.delete_form_field(form_field),
+            )
         except Exception as e:
             log.error("failed to delete form field with error: {}", e)
             raise service_exception.DeleteFormFieldException(
@@ -113,7 +139,13 @@ class FormFieldService(BaseService):
             log.debug(
                 f"reading form fields {[str(form_field.id) for  form_field in form_fields]}"
             )
-            documents = await self._form_field_repo.read_many_form_fields(form_fields)
+            documents = await identity.current().read_many(
+                identity.EntityKind.FORM_FIELD,
+                [item.id for item in form_fields],
+                lambda ids: self._form_field_repo.read_many_form_fields(
+                    [proto.ReadFormField(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(form_fields, documents, strict=True):
                 if response is None:
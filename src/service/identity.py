@@ -0,0 +1,134 @@
+"""
+Request-scoped identity map shared by services and GraphQL loaders.
+Every entity is fetched at most once per request, mutation results replace the cached ones.
+Every service write, within a request or not, is awaited by the process-wide write hooks.
+"""
+
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from enum import StrEnum
+from typing import Any, Protocol, TypeVar
+
+import src.domain.model as domain
+
+
+class EntityKind(StrEnum):
+    USER = "user"
+    ALLOCATION = "allocation"
+    FORM_FIELD = "form_field"
+    ANSWER = "answer"
+    PARTICIPANT = "participant"
+    PREFERENCE = "preference"
+    ROOM = "room"
+
+
+class WithId(Protocol):
+    id: domain.ObjectID
+
+
+T = TypeVar("T", bound=WithId)
+
+type Fetch[V] = Callable[[], Awaitable[V]]
+type FetchMany[V] = Callable[[list[domain.ObjectID]], Awaitable[list[V | None]]]
+type Listener = Callable[[EntityKind, Any], None]
+type WriteHook = Callable[[EntityKind, Any], Awaitable[None]]
+
+
+class IdentityMap:
+    _entities: dict[EntityKind, dict[domain.ObjectID, Any]]
+    _listeners: list[Listener]
+
+    def __init__(self):
+        self._entities = {kind: {} for kind in EntityKind}
+        self._listeners = []
+
+    def subscribe(self, listener: Listener) -> None:
+        self._listeners.append(listener)
+
+    def get(self, kind: EntityKind, id: domain.ObjectID) -> Any | None:
+        return self._entities[kind].get(id)
+
+    async def read(self, kind: EntityKind, id: domain.ObjectID, fetch: Fetch[T]) -> T:
+        entities = self._entities[kind]
+        if (entity := entities.get(id)) is not None:
+            return entity
+
+        entity = await fetch()
+        entities[id] = entity
+        return entity
+
+    async def read_many(
+        self,
+        kind: EntityKind,
+        ids: list[domain.ObjectID],
+        fetch: FetchMany[T],
+    ) -> list[T | None]:
+        entities = self._entities[kind]
+        missing = list(dict.fromkeys(id for id in ids if id not in entities))
+        if missing:
+            for entity in await fetch(missing):
+                if entity is not None:
+                    entities[entity.id] = entity
+
+        return [entities.get(id) for id in ids]
+
+    async def write(self, kind: EntityKind, entity: T) -> T:
+        """
+        Replaces the entity with a mutation result and notifies the listeners.
+        """
+        self._entities[kind][entity.id] = entity
+        for listener in self._listeners:
+            listener(kind, entity)
+
+        return await _written(kind, entity)
+
+
+class DetachedIdentityMap(IdentityMap):
+    """
+    Identity map used outside of a request, every read goes to the repository.
+    """
+
+    async def read(self, kind: EntityKind, id: domain.ObjectID, fetch: Fetch[T]) -> T:
+        return await fetch()
+
+    async def read_many(
+        self,
+        kind: EntityKind,
+        ids: list[domain.ObjectID],
+        fetch: FetchMany[T],
+    ) -> list[T | None]:
+        return await fetch(ids)
+
+    async def write(self, kind: EntityKind, entity: T) -> T:
+        return await _written(kind, entity)
+
+
+IDENTITY_MAP: ContextVar[IdentityMap | None] = ContextVar("IDENTITY_MAP", default=None)
+WRITE_HOOKS: list[WriteHook] = []
+
+
+def on_write(hook: WriteHook) -> None:
+    """
+    Registers `hook` to be awaited after every service write.
+    """
+    WRITE_HOOKS.append(hook)
+
+
+async def _written[E](kind: EntityKind, entity: E) -> E:
+    for hook in WRITE_HOOKS:
+        await hook(kind, entity)
+
+    return entity
+
+
+def begin() -> IdentityMap:
+    """
+    Starts a new identity map for the current request.
+    """
+    identity_map = IdentityMap()
+    IDENTITY_MAP.set(identity_map)
+    return identity_map
+
+
+def current() -> IdentityMap:
+    return IDENTITY_MAP.get() or DetachedIdentityMap()
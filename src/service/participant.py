@@ -1,7 +1,10 @@
+from collections.abc import AsyncIterator
+from datetime import datetime
+
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -20,37 +23,59 @@ class ParticipantService(BaseService):
         self._participant_repo = participant_repo
         self._room_repo = room_repo
         self._user_repo = user_repo
+        self._references = common.ReferenceChecker(
+            user_repo=user_repo,
+            allocation_repo=allocatin_repo,
+            room_repo=room_repo,
+        )
 
     async def create(self, participant: proto.CreateParticipant) -> domain.Participant:
         try:
             log.debug("creating new participant")
 
-            log.debug("checking participant user existence")
-            if not await common.check_user_exist(participant, self._user_repo):
+            references = [
+                common.Reference(
+                    "user", common.ReferenceKind.USER, {participant.user_id}
+                ),
+                common.Reference(
+                    "allocation",
+                    common.ReferenceKind.ALLOCATION,
+                    {participant.allocation_id},
+                ),
+            ]
+            if isinstance(participant, proto.CreateAllocatedParticipant):
+                references.append(
+                    common.Reference(
+                        "room", common.ReferenceKind.ROOM, {participant.room_id}
+                    )
+                )
+
+            log.debug("checking participant references existence")
+            report = await self._references.check(*references)
+
+            if not report.exist("user"):
                 log.error("user does not exist")
                 raise service_exception.CreateParticipantException(
                     "user does not exist"
                 )
 
-            log.debug("checking participant allocation existence")
-            if not await common.check_allocation_exist(
-                participant, self._allocation_repo
-            ):
+            if not report.exist("allocation"):
                 log.error("allocation does not exist")
                 raise service_exception.CreateParticipantException(
                     "allocation does not exist"
                 )
 
-            if isinstance(participant, proto.CreateAllocatedParticipant):
-                log.debug("checking participant room existence")
-                if not await common.check_room_exist(participant, self._room_repo):
-                    log.error("room does not exist")
-                    raise service_exception.CreateParticipantException(
-                        "room does not exist"
-                    )
+            if not report.exist("room"):
+                log.error("room does not exist")
+                raise service_exception.CreateParticipantException(
+                    "room does not exist"
+                )
 
             log.debug("creating new participant")
-            return await self._participant_repo.create_participant(participant)
+            return await identity.current().write(
+                identity.EntityKind.PARTICIPANT,
+                await self._participant_repo.create_participant(participant),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to create participant with error: {}", e)
             raise e
@@ -63,7 +88,11 @@ class ParticipantService(BaseService):
     async def read(self, participant: proto.ReadParticipant) -> domain.Participant:
         try:
             log.debug(f"reading participant {participant.id}")
-            return await self._participant_repo.read_participant(participant)
+            return await identity.current().read(
+                identity.EntityKind.PARTICIPANT,
+                participant.id,
+                lambda: self._participant_repo.read_participant(participant),
+            )
         except Exception as e:
             log.error("failed to read participant with error: {}", e)
             raise service_exception.ReadParticipantException(
@@ -75,8 +104,12 @@ class ParticipantService(BaseService):
             log.debug(f"updating participant {participant.id}")
             try:
                 log.debug(f"reading participant {participant.id}")
-                current = await self._participant_repo.read_participant(
-                    proto.ReadParticipant(_id=participant.id)
+                current = await identity.current().read(
+                    identity.EntityKind.PARTICIPANT,
+                    participant.id,
+                    lambda: self._participant_repo.read_participant(
+                        proto.ReadParticipant(_id=participant.id)
+                    ),
                 )
             except Exception as e:
                 log.error("failed to read participant with error: {}", e)
@@ -87,7 +120,12 @@ class ParticipantService(BaseService):
             log.debug("checking participant room existence")
             if participant.room_id is not None:
                 log.debug("checking participant room existence")
-                if not await common.check_room_exist(participant, self._room_repo):  # type: ignore
+                report = await self._references.check(
+                    common.Reference(
+                        "room", common.ReferenceKind.ROOM, {participant.room_id}
+                    )
+                )
+                if not report.valid:
                     log.error("room does not exist")
                     raise service_exception.UpdateParticipantException(
                         "room does not exist"
@@ -114,7 +152,10 @@ class ParticipantService(BaseService):
                 )
 
             log.debug(f"updating participant {participant.id}")
-            return await self._participant_repo.update_participant(participant)
+            return await identity.current().write(
+                identity.EntityKind.PARTICIPANT,
+                await self._participant_repo.update_participant(participant),
+            )
         except Exception as e:
             log.error("failed to update participant with error: {}", e)
             raise service_exception.UpdateParticipantException(
@@ -124,7 +165,10 @@ class ParticipantService(BaseService):
     async def delete(self, participant: proto.DeleteParticipant) -> domain.Participant:
         try:
             log.debug(f"deleting participant {participant.id}")
-            return await self._participant_repo.delete_participant(participant)
+            return await identity.current().write(
+                identity.EntityKind.PARTICIPANT,
+                await self._participant_repo.delete_participant(participant),
+            )
         except Exception as e:
             log.error("failed to delete participant with error: {}", e)
             raise service_exception.DeleteParticipantException(
@@ -138,8 +182,12 @@ class ParticipantService(BaseService):
             log.debug(
                 f"reading participants {[str(participant.id) for  participant in participants]}"
             )
-            documents = await self._participant_repo.read_many_participants(
-                participants
+            documents = await identity.current().read_many(
+                identity.EntityKind.PARTICIPANT,
+                [item.id for item in participants],
+                lambda ids: self._participant_repo.read_many_participants(
+                    [proto.ReadParticipant(_id=id) for id in ids]
+                ),
             )
             results = []
             for request, response in zip(participants, documents, strict=True):
@@ -179,6 +227,70 @@ class ParticipantService(BaseService):
                 "service failed to read all participants"
             ) from e
 
+    async def find(
+        self, participant: proto.FindParticipant
+    ) -> domain.Participant | None:
+        try:
+            log.debug(
+                f"finding participant for user {participant.user_id} and allocation {participant.allocation_id}"
+            )
+            return await self._participant_repo.find_participant(participant)
+        except Exception as e:
+            log.error("failed to find participant with error: {}", e)
+            raise service_exception.ReadParticipantException(
+                "service failed to find participant"
+            ) from e
+
+    async def iter_all(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[domain.Participant]:
+        try:
+            log.debug("iterating all participants")
+            async for participant in self._participant_repo.iter_participants(
+                batch_size, updated_since, updated_before
+            ):
+                yield participant
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise service_exception.ReadParticipantException(
+                "service failed to iterate participants"
+            ) from e
+
+    async def iter_all_with_gender(
+        self,
+        batch_size: int = 1000,
+        updated_since: datetime | None = None,
+        updated_before: datetime | None = None,
+    ) -> AsyncIterator[tuple[domain.Participant, domain.Gender | None]]:
+        try:
+            log.debug("iterating all participants with gender")
+            async for item in self._participant_repo.iter_participants_with_gender(
+                batch_size, updated_since, updated_before
+            ):
+                yield item
+        except Exception as e:
+            log.error("failed to iterate participants with error: {}", e)
+            raise service_exception.ReadParticipantException(
+                "service failed to iterate participants"
+            ) from e
+
+    async def sample(
+        self, participants: proto.SampleParticipants
+    ) -> list[domain.Participant]:
+        try:
+            log.debug(
+                f"sampling {participants.size} participants of allocation {participants.allocation_id}"
+            )
+            return await self._participant_repo.sample_participants(participants)
+        except Exception as e:
+            log.error("failed to sample participants with error: {}", e)
+            raise service_exception.ReadParticipantException(
+                "service failed to sample participants"
+            ) from e
+
     def __check_participant_state_change(
         self, current: domain.Participant, participant: proto.UpdateParticipant
     ) -> bool:
@@ -1,7 +1,7 @@
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -16,17 +16,26 @@ class PreferenceService(BaseService):
     ):
         self._preference_repo = preference_repo
         self._user_repo = user_repo
+        self._references = common.ReferenceChecker(user_repo=user_repo)
 
     async def create(self, preference: proto.CreatePreference) -> domain.Preference:
         try:
             log.debug("creating new preference")
 
-            log.debug("checking preference user existence")
-            if not await common.check_user_exist(preference, self._user_repo):
+            log.debug("checking preference references existence")
+            report = await self._references.check(
+                common.Reference(
+                    "user", common.ReferenceKind.USER, {preference.user_id}
+                ),
+                common.Reference(
+                    "target", common.ReferenceKind.USER, {preference.target_id}
+                ),
+            )
+
+            if not report.exist("user"):
                 raise service_exception.CreatePreferenceException("user does not exist")
 
-            log.debug("checking preference target existence")
-            if not await common.check_target_exist(preference, self._user_repo):
+            if not report.exist("target"):
                 raise service_exception.CreatePreferenceException(
                     "target does not exist"
                 )
@@ -57,7 +66,10 @@ class PreferenceService(BaseService):
                         "user already has pending preference"
                     )
             log.debug("creating new preference")
-            return await self._preference_repo.create_preference(preference)
+            return await identity.current().write(
+                identity.EntityKind.PREFERENCE,
+                await self._preference_repo.create_preference(preference),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to create preference with error: {}", e)
             raise e
@@ -70,7 +82,11 @@ class PreferenceService(BaseService):
     async def read(self, preference: proto.ReadPreference) -> domain.Preference:
         try:
             log.debug(f"reading preference {preference.id}")
-            return await self._preference_repo.read_preference(preference)
+            return await identity.current().read(
+                identity.EntityKind.PREFERENCE,
+                preference.id,
+                lambda: self._preference_repo.read_preference(preference),
+            )
         except Exception as e:
             log.error("failed to read preference with error: {}", e)
             raise service_exception.ReadPreferenceException(
@@ -82,8 +98,12 @@ class PreferenceService(BaseService):
             log.debug(f"updating preference {preference.id}")
             try:
                 log.debug(f"reading preference {preference.id}")
-                current = await self._preference_repo.read_preference(
-                    proto.ReadPreference(_id=preference.id)
+                current = await identity.current().read(
+                    identity.EntityKind.PREFERENCE,
+                    preference.id,
+                    lambda: self._preference_repo.read_preference(
+                        proto.ReadPreference(_id=preference.id)
+                    ),
                 )
             except Exception as e:
                 log.error("failed to read preference with error: {}", e)
@@ -111,7 +131,10 @@ class PreferenceService(BaseService):
                 )
 
             log.debug(f"updating preference {preference.id}")
-            return await self._preference_repo.update_preference(preference)
+            return await identity.current().write(
+                identity.EntityKind.PREFERENCE,
+                await self._preference_repo.update_preference(preference),
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update preference with error: {}", e)
             raise e
@@ -124,7 +147,10 @@ class PreferenceService(BaseService):
     async def delete(self, preference: proto.DeletePreference) -> domain.Preference:
         try:
             log.debug(f"deleting preference {preference.id}")
-            return await self._preference_repo.delete_preference(preference)
+            return await identity.current().write(
+                identity.EntityKind.PREFERENCE,
+                await self._preference_repo.delete_preference(preference),
+            )
         except Exception as e:
             log.error("failed to delete preference with error: {}", e)
             raise service_exception.DeletePreferenceException(
@@ -138,7 +164,13 @@ class PreferenceService(BaseService):
             log.debug(
                 f"reading preferences {[str(preference.id) for  preference in preferences]}"
             )
-            documents = await self._preference_repo.read_many_preferences(preferences)
+            documents = await identity.current().read_many(
+                identity.EntityKind.PREFERENCE,
+                [item.id for item in preferences],
+                lambda ids: self._preference_repo.read_many_preferences(
+                    [proto.ReadPreference(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(preferences, documents, strict=True):
                 if response is None:
@@ -1,7 +1,7 @@
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
 import src.protocol.internal.database as proto
-from src.service import common
+from src.service import common, identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -16,25 +16,36 @@ class RoomService(BaseService):
     ):
         self._room_repo = room_repo
         self._user_repo = user_repo
+        self._references = common.ReferenceChecker(user_repo=user_repo)
 
     async def create(self, room: proto.CreateRoom) -> domain.Room:
         try:
             log.debug("creating new room")
 
-            log.debug("checking room creator existence")
-            if not await common.check_creator_exist(room, self._user_repo):
+            log.debug("checking room references existence")
+            report = await self._references.check(
+                common.Reference(
+                    "creator", common.ReferenceKind.USER, {room.creator_id}
+                ),
+                common.Reference(
+                    "editors", common.ReferenceKind.USER, room.editors_ids
+                ),
+            )
+
+            if not report.exist("creator"):
                 log.error("creator does not exist")
                 raise service_exception.CreateRoomException("creator does not exist")
 
-            log.debug("checking room editors existence")
-            if not await common.check_editors_exist(room, self._user_repo):
+            if not report.exist("editors"):
                 log.error("one or more editors do not exist")
                 raise service_exception.CreateRoomException(
                     "one or more editors do not exist"
                 )
 
             log.debug("creating new room")
-            return await self._room_repo.create_room(room)
+            return await identity.current().write(
+                identity.EntityKind.ROOM, await self._room_repo.create_room(room)
+            )
         except service_exception.ServiceException as e:
             log.error("failed to create room with error: {}", e)
             raise e
@@ -47,7 +58,11 @@ class RoomService(BaseService):
     async def read(self, room: proto.ReadRoom) -> domain.Room:
         try:
             log.debug(f"reading room {room.id}")
-            return await self._room_repo.read_room(room)
+            return await identity.current().read(
+                identity.EntityKind.ROOM,
+                room.id,
+                lambda: self._room_repo.read_room(room),
+            )
         except Exception as e:
             log.error("failed to read room with error: {}", e)
             raise service_exception.ReadRoomException(
@@ -66,7 +81,9 @@ class RoomService(BaseService):
                 )
 
             log.debug(f"updating room {room.id}")
-            return await self._room_repo.update_room(room)
+            return await identity.current().write(
+                identity.EntityKind.ROOM, await self._room_repo.update_room(room)
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update room with error: {}", e)
             raise e
@@ -79,7 +96,9 @@ class RoomService(BaseService):
     async def delete(self, room: proto.DeleteRoom) -> domain.Room:
         try:
             log.debug(f"deleting room {room.id}")
-            return await self._room_repo.delete_room(room)
+            return await identity.current().write(
+                identity.EntityKind.ROOM, await self._room_repo.delete_room(room)
+            )
         except Exception as e:
             log.error("failed to delete room with error: {}", e)
             raise service_exception.DeleteRoomException(
@@ -89,7 +108,13 @@ class RoomService(BaseService):
     async def read_many(self, rooms: list[proto.ReadRoom]) -> list[domain.Room]:
         try:
             log.debug(f"reading rooms {[str(room.id) for  room in rooms]}")
-            documents = await self._room_repo.read_many_rooms(rooms)
+            documents = await identity.current().read_many(
+                identity.EntityKind.ROOM,
+                [item.id for item in rooms],
+                lambda ids: self._room_repo.read_many_rooms(
+                    [proto.ReadRoom(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(rooms, documents, strict=True):
                 if response is None:
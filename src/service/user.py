@@ -1,7 +1,9 @@
 import src.domain.exception.service as service_exception
 import src.domain.model as domain
+import src.protocol.internal.cache as cache_proto
 import src.protocol.internal.database.user as proto
 from src.domain.exception.database import DeleteUserException
+from src.service import identity
 from src.service.base import BaseService
 from src.utils.logger.logger import Logger
 
@@ -9,8 +11,13 @@ log = Logger("user-service")
 
 
 class UserService(BaseService):
-    def __init__(self, repo: proto.UserDatabaseProtocol):
+    def __init__(
+        self,
+        repo: proto.UserDatabaseProtocol,
+        telegram_ids: cache_proto.LookupCacheProtocol | None = None,
+    ):
         self.__repo = repo
+        self.__telegram_ids = telegram_ids
 
     async def create(self, user: proto.CreateUser) -> domain.User:
         try:
@@ -26,7 +33,9 @@ class UserService(BaseService):
                 raise service_exception.CreateUserException("user already exists")
 
                 log.debug("creating new user")
-            return await self.__repo.create_user(user)
+            created = await self.__repo.create_user(user)
+            await self.__remember(created.telegram_id, created.id)
+            return await identity.current().write(identity.EntityKind.USER, created)
         except Exception as e:
             log.error("failed to create user with error: {}", e)
             raise service_exception.CreateUserException(
@@ -68,10 +77,41 @@ class UserService(BaseService):
                 "service failed to find user"
             ) from e
 
+    async def find_id_by_telegram_id(self, user_tid: int) -> domain.ObjectID:
+        """
+        Fast path of `find_by_telegram_id` for callers needing the id only,
+        found and missing telegram ids are both cached.
+        """
+        try:
+            log.debug(f"finding user id with telegram id {user_tid}")
+            lookup = await self.__lookup(user_tid)
+            if lookup is None:
+                users = await self.__repo.find_users(
+                    proto.FindUsersByTid(telegram_id=user_tid)
+                )
+                lookup = cache_proto.Lookup(users[0].id if users else None)
+                await self.__remember(user_tid, lookup.id)
+
+            if lookup.id is None:
+                log.error("neither or too many users found")
+                raise service_exception.ReadUserException("service failed to find user")
+
+            return lookup.id
+        except service_exception.ServiceException as e:
+            log.error("failed to find user id with error: {}", e)
+            raise e
+        except Exception as e:
+            log.error("failed to find user id with error: {}", e)
+            raise service_exception.ReadUserException(
+                "service failed to find user"
+            ) from e
+
     async def read(self, user: proto.ReadUser) -> domain.User:
         try:
             log.debug(f"reading user {user.id}")
-            return await self.__repo.read_user(user)
+            return await identity.current().read(
+                identity.EntityKind.USER, user.id, lambda: self.__repo.read_user(user)
+            )
         except Exception as e:
             log.error("failed to read user with error: {}", e)
             raise service_exception.ReadUserException(
@@ -90,7 +130,9 @@ class UserService(BaseService):
                 )
 
             log.debug(f"updating user {user.id}")
-            return await self.__repo.update_user(user)
+            return await identity.current().write(
+                identity.EntityKind.USER, await self.__repo.update_user(user)
+            )
         except service_exception.ServiceException as e:
             log.error("failed to update user with error: {}", e)
             raise e
@@ -103,7 +145,9 @@ class UserService(BaseService):
     async def delete(self, user: proto.DeleteUser) -> domain.User:
         try:
             log.debug(f"deleting user {user.id}")
-            return await self.__repo.delete_user(user)
+            deleted = await self.__repo.delete_user(user)
+            await self.__forget(deleted.telegram_id)
+            return await identity.current().write(identity.EntityKind.USER, deleted)
         except Exception as e:
             log.error("failed to delete user with error: {}", e)
             raise DeleteUserException("service failed to delete user") from e
@@ -111,7 +155,13 @@ class UserService(BaseService):
     async def read_many(self, users: list[proto.ReadUser]) -> list[domain.User]:
         try:
             log.debug(f"reading users {[str(user.id) for  user in users]}")
-            documents = await self.__repo.read_many_users(users)
+            documents = await identity.current().read_many(
+                identity.EntityKind.USER,
+                [item.id for item in users],
+                lambda ids: self.__repo.read_many_users(
+                    [proto.ReadUser(_id=id) for id in ids]
+                ),
+            )
             results = []
             for request, response in zip(users, documents, strict=True):
                 if response is None:
@@ -132,3 +182,31 @@ class UserService(BaseService):
         except Exception as e:
             log.error("failed to read users with error: {}", e)
             raise service_exception.ReadUserException("failed to read users") from e
+
+    async def __lookup(self, user_tid: int) -> cache_proto.Lookup | None:
+        if self.__telegram_ids is None:
+            return None
+
+        try:
+            return await self.__telegram_ids.get(user_tid)
+        except Exception as e:
+            log.error("failed to read cached telegram id with error: {}", e)
+            return None
+
+    async def __remember(self, user_tid: int, id: domain.ObjectID | None) -> None:
+        if self.__telegram_ids is None:
+            return
+
+        try:
+            await self.__telegram_ids.put(user_tid, id)
+        except Exception as e:
+            log.error("failed to cache telegram id with error: {}", e)
+
+    async def __forget(self, user_tid: int) -> None:
+        if self.__telegram_ids is None:
+            return
+
+        try:
+            await self.__telegram_ids.delete(user_tid)
+        except Exception as e:
+            log.error("failed to evict cached telegram id with error: {}", e)
@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import Any
+
+import pytest
+
+import src.domain.model as domain
+from src.adapter.internal.cache.codec import VERSION_SIZE, JsonCodec, PickleCodec
+from src.tests.test_adapters.test_database.test_decode import param_attrs, param_string
+
+
+def _room() -> domain.Room:
+    return domain.Room(
+        _id=domain.ObjectID(),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        name="test",
+        capacity=2,
+        occupied=0,
+        gender_restriction=None,
+        creator_id=domain.ObjectID(),
+    )
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_json_codec_roundtrip(annotation: Any, validate: Any, payload: dict[str, Any]):
+    value = validate(payload)
+    codec = JsonCodec(annotation)
+
+    decoded = codec.decode(codec.encode(value))
+
+    assert type(decoded) is type(value)
+    assert decoded == value
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_pickle_codec_roundtrip(
+    annotation: Any, validate: Any, payload: dict[str, Any]
+):
+    value = validate(payload)
+    codec = PickleCodec()
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_json_codec_version_mismatch_drop():
+    room = _room()
+    data = JsonCodec(domain.Room, version="1").encode(room)
+
+    assert JsonCodec(domain.Room, version="1").decode(data) == room
+    assert JsonCodec(domain.Room, version="2").decode(data) is None
+    assert JsonCodec(domain.User).decode(data) is None
+
+
+def test_json_codec_invalid_drop():
+    codec = JsonCodec(domain.Room)
+    data = codec.encode(_room())
+
+    assert codec.decode(data[:VERSION_SIZE] + b'{"name": 1}') is None
+
+
+def test_codec_version_by_schema():
+    assert JsonCodec(domain.Room).version == JsonCodec(domain.Room).version
+    assert JsonCodec(domain.Room).version != JsonCodec(domain.User).version
+    assert JsonCodec(domain.Room).version != PickleCodec().version
@@ -0,0 +1,300 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+import pytest
+
+import src.domain.model as domain
+import src.protocol.internal.cache as proto
+from src.adapter.internal.cache.codec import JsonCodec
+from src.adapter.internal.cache.layered.service import LayeredCacheService
+from src.adapter.internal.cache.memorydb.service import MemoryDBService
+
+FETCH_DELAY = 0.05
+
+
+def _room(name: str = "test") -> domain.Room:
+    return domain.Room(
+        _id=domain.ObjectID(),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        name=name,
+        capacity=2,
+        occupied=0,
+        gender_restriction=None,
+        creator_id=domain.ObjectID(),
+    )
+
+
+class Rooms:
+    def __init__(self, *rooms: domain.Room):
+        self.rooms = {room.id: room for room in rooms}
+        self.reads: list[list[domain.ObjectID]] = []
+
+    async def read_many(self, ids: list[domain.ObjectID]) -> list[domain.Room]:
+        self.reads.append(ids)
+        await asyncio.sleep(FETCH_DELAY)
+        return [self.rooms[id] for id in ids]
+
+
+class Channel:
+    def __init__(self):
+        self.subscribers: list[MemoryInvalidation] = []
+
+
+class MemoryInvalidation(proto.InvalidationProtocol):
+    def __init__(self, channel: Channel):
+        self._channel = channel
+        self._queue: asyncio.Queue[list[domain.ObjectID]] = asyncio.Queue()
+        self._reset: Callable[[], Awaitable[None]] | None = None
+        channel.subscribers.append(self)
+
+    async def publish(self, keys: list[domain.ObjectID]) -> None:
+        for subscriber in self._channel.subscribers:
+            if subscriber is not self:
+                subscriber._queue.put_nowait(keys)
+
+    async def listen(
+        self,
+        callback: Callable[[list[domain.ObjectID]], Awaitable[None]],
+        reset: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        self._reset = reset
+        while True:
+            await callback(await self._queue.get())
+
+    async def reconnect(self) -> None:
+        if self._reset is not None:
+            await self._reset()
+
+
+async def test_memory_lru_bound():
+    cache = MemoryDBService[domain.Room](max_size=2)
+    first, second, third = _room(), _room(), _room()
+
+    await cache.put_many([(first.id, first), (second.id, second)])  # type: ignore
+    await cache.get(first.id)  # type: ignore
+    await cache.put(third.id, third)  # type: ignore
+
+    assert await cache.get_many([first.id, second.id, third.id]) == [  # type: ignore
+        first,
+        None,
+        third,
+    ]
+
+
+async def test_memory_ttl_expire():
+    cache = MemoryDBService[domain.Room](ttl=FETCH_DELAY)
+    room = _room()
+
+    await cache.put(room.id, room)  # type: ignore
+    assert await cache.get(room.id) == room  # type: ignore
+
+    await asyncio.sleep(FETCH_DELAY)
+    assert await cache.get(room.id) is None  # type: ignore
+
+
+async def test_memory_bytes_budget():
+    first, second, third = _room(), _room(), _room()
+    codec = JsonCodec[domain.Room](domain.Room)
+    budget = len(codec.encode(first)) + len(codec.encode(second))
+    cache = MemoryDBService[domain.Room](max_bytes=budget, codec=codec)
+
+    await cache.put_many([(first.id, first), (second.id, second)])
+    assert await cache.get_many([first.id, second.id]) == [first, second]
+
+    await cache.put(third.id, third)
+    assert await cache.get_many([first.id, second.id, third.id]) == [
+        None,
+        second,
+        third,
+    ]
+
+
+def test_memory_bytes_budget_without_codec_fail():
+    with pytest.raises(ValueError):
+        MemoryDBService[domain.Room](max_bytes=1)
+
+
+async def test_layered_remote_fill_local():
+    room = _room()
+    local, remote = MemoryDBService[domain.Room](), MemoryDBService[domain.Room]()
+    await remote.put(room.id, room)  # type: ignore
+    cache = LayeredCacheService(local, remote)
+
+    assert await cache.get(room.id) == room
+    assert await local.get(room.id) == room  # type: ignore
+
+
+class SlowMemoryDBService(MemoryDBService[domain.Room]):
+    async def get_many(self, keys: list[domain.ObjectID]) -> list[domain.Room | None]:  # type: ignore
+        values = await super().get_many(keys)  # type: ignore
+        await asyncio.sleep(FETCH_DELAY)
+        return values
+
+
+async def test_layered_delete_during_get_skip_local():
+    room = _room()
+    local, remote = MemoryDBService[domain.Room](), SlowMemoryDBService()
+    await remote.put(room.id, room)  # type: ignore
+    cache = LayeredCacheService(local, remote)
+
+    get = asyncio.create_task(cache.get(room.id))
+    await asyncio.sleep(0)
+    await cache.delete(room.id)
+
+    assert await get == room
+    assert await local.get(room.id) is None  # type: ignore
+
+
+async def test_layered_single_flight():
+    room, other = _room(), _room()
+    rooms = Rooms(room, other)
+    cache = LayeredCacheService(MemoryDBService(), MemoryDBService())
+
+    results = await asyncio.gather(
+        cache.load_many([room.id], rooms.read_many),
+        cache.load_many([room.id, other.id], rooms.read_many),
+        cache.load_many([other.id, room.id], rooms.read_many),
+    )
+
+    assert results == [[room], [room, other], [other, room]]
+    assert rooms.reads == [[room.id], [other.id]]
+
+    assert await cache.load_many([room.id, other.id], rooms.read_many) == [
+        room,
+        other,
+    ]
+    assert len(rooms.reads) == 2
+
+
+async def test_layered_single_flight_error():
+    rooms = Rooms()
+    cache = LayeredCacheService(MemoryDBService(), MemoryDBService())
+    id = domain.ObjectID()
+
+    results = await asyncio.gather(
+        cache.load_many([id], rooms.read_many),
+        cache.load_many([id], rooms.read_many),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, KeyError) for result in results)
+    assert len(rooms.reads) == 1
+
+
+async def test_layered_single_flight_owner_cancel():
+    room = _room()
+    rooms = Rooms(room)
+    cache = LayeredCacheService(MemoryDBService(), MemoryDBService())
+
+    owner = asyncio.create_task(cache.load_many([room.id], rooms.read_many))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.load_many([room.id], rooms.read_many))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == [room]
+    assert owner.cancelled()
+    assert rooms.reads == [[room.id], [room.id]]
+
+
+async def test_layered_single_flight_waiter_cancel():
+    room = _room()
+    rooms = Rooms(room)
+    cache = LayeredCacheService(MemoryDBService(), MemoryDBService())
+
+    owner = asyncio.create_task(cache.load_many([room.id], rooms.read_many))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.load_many([room.id], rooms.read_many))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    assert await owner == [room]
+    assert waiter.cancelled()
+    assert rooms.reads == [[room.id]]
+
+
+async def test_layered_delete_during_load_skip_store():
+    room = _room()
+    rooms = Rooms(room)
+    local, remote = MemoryDBService[domain.Room](), MemoryDBService[domain.Room]()
+    cache = LayeredCacheService(local, remote)
+
+    load = asyncio.create_task(cache.load_many([room.id], rooms.read_many))
+    await asyncio.sleep(0)
+    await cache.delete(room.id)
+
+    assert await load == [room]
+    assert await local.get(room.id) is None  # type: ignore
+    assert await remote.get(room.id) is None  # type: ignore
+
+
+async def test_layered_invalidation():
+    room = _room()
+    updated = room.model_copy(update={"name": "updated"})
+    channel = Channel()
+    remote = MemoryDBService[domain.Room]()
+    first_local, second_local = MemoryDBService(), MemoryDBService()
+    first = LayeredCacheService(first_local, remote, MemoryInvalidation(channel))
+    second = LayeredCacheService(second_local, remote, MemoryInvalidation(channel))
+
+    await first.put(room.id, room)
+    assert await second.get(room.id) == room
+
+    await first.put(room.id, updated)
+    await asyncio.sleep(0)
+
+    assert await second_local.get(room.id) is None  # type: ignore
+    assert await second.get(room.id) == updated
+
+
+async def test_layered_reconnect_flush_local():
+    room = _room()
+    invalidation = MemoryInvalidation(Channel())
+    local, remote = MemoryDBService[domain.Room](), MemoryDBService[domain.Room]()
+    cache = LayeredCacheService(local, remote, invalidation)
+
+    await cache.put(room.id, room)
+    assert await cache.get(room.id) == room
+    await asyncio.sleep(0)
+
+    # the invalidations published while reconnecting are lost
+    await invalidation.reconnect()
+
+    assert await local.get(room.id) is None  # type: ignore
+    assert await cache.get(room.id) == room
+
+
+class TaggedMemoryDBService(MemoryDBService[domain.Room]):
+    def __init__(self):
+        super().__init__()
+        self.tagged: dict[str, set[domain.ObjectID]] = {}
+
+    async def put_many(self, items: list[tuple[domain.ObjectID, domain.Room]]):  # type: ignore
+        await super().put_many(items)  # type: ignore
+        for key, value in items:
+            self.tagged.setdefault(f"creator:{value.creator_id}", set()).add(key)
+
+    async def delete_tags(self, tags: list[str]) -> list[domain.ObjectID]:
+        keys = list(set().union(*(self.tagged.pop(tag, set()) for tag in tags)))
+        await self.delete_many(keys)  # type: ignore
+        return keys
+
+
+async def test_layered_delete_tags():
+    room, other = _room(), _room()
+    channel = Channel()
+    remote = TaggedMemoryDBService()
+    first_local, second_local = MemoryDBService(), MemoryDBService()
+    first = LayeredCacheService(first_local, remote, MemoryInvalidation(channel))
+    second = LayeredCacheService(second_local, remote, MemoryInvalidation(channel))
+
+    await first.put_many([(room.id, room), (other.id, other)])
+    assert await second.get_many([room.id, other.id]) == [room, other]
+
+    assert await first.delete_tags([f"creator:{room.creator_id}"]) == [room.id]
+    await asyncio.sleep(0)
+
+    assert await first.get_many([room.id, other.id]) == [None, other]
+    assert await second.get_many([room.id, other.id]) == [None, other]
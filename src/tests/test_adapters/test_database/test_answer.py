@@ -8,12 +8,18 @@ import src.domain.model as domain
 import src.protocol.internal.database.form_field as proto
 from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
 
 
 async def _get_mongo():
     return await MongoDBAdapter.create("mongodb://localhost:27017")
 
 
+async def _get_motor():
+    return await MotorDBAdapter.create("mongodb://localhost:27017", DecodeMode.VERIFY)
+
+
 async def _get_memory():
     return MemoryDBAdapter()
 
@@ -21,7 +27,7 @@ async def _get_memory():
 type ActorFn = Callable[[], Awaitable[proto.FormFieldDatabaseProtocol]]
 
 param_string = "actor_fn"
-param_attrs = [_get_mongo, _get_memory]
+param_attrs = [_get_mongo, _get_motor, _get_memory]
 
 
 @pytest.mark.parametrize(param_string, param_attrs)
@@ -50,6 +56,26 @@ async def test_create_text_answer_ok(actor_fn: ActorFn):
     assert response.deleted_at is None
 
 
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_create_text_answer_link_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    data = proto.CreateTextAnswer(
+        text="test",
+        text_entities={
+            domain.LinkEntity(offset=0, length=4, url="https://t.me"),  # type: ignore
+        },
+        form_field_id=domain.ObjectID(),
+        respondent_id=domain.ObjectID(),
+    )
+
+    document = await actor.create_answer(data)
+    response = await actor.read_answer(proto.ReadAnswer(_id=document.id))
+
+    assert isinstance(response, domain.TextAnswer)
+    assert response.text_entities == data.text_entities
+
+
 @pytest.mark.parametrize(param_string, param_attrs)
 async def test_create_choise_answer_ok(actor_fn: ActorFn):
     actor = await actor_fn()
@@ -524,3 +550,73 @@ async def test_update_choice_answer_field_id_ok(actor_fn: ActorFn):
     assert response.created_at is not None
     assert response.updated_at is not None
     assert response.deleted_at is None
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_read_answers_by_respondents_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    first = domain.ObjectID()
+    second = domain.ObjectID()
+    field_id = domain.ObjectID()
+
+    text = await actor.create_answer(
+        proto.CreateTextAnswer(
+            text="test",
+            form_field_id=field_id,
+            respondent_id=first,
+        )
+    )
+    choice = await actor.create_answer(
+        proto.CreateChoiceAnswer(
+            option_indexes={1},
+            form_field_id=field_id,
+            respondent_id=second,
+        )
+    )
+    await actor.create_answer(
+        proto.CreateTextAnswer(
+            text="test",
+            form_field_id=field_id,
+            respondent_id=domain.ObjectID(),
+        )
+    )
+
+    response = await actor.read_answers_by_respondents([first, second])
+
+    assert {answer.id for answer in response} == {text.id, choice.id}
+    assert {answer.respondent_id for answer in response} == {first, second}
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_read_answers_by_respondents_empty_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    response = await actor.read_answers_by_respondents([domain.ObjectID()])
+
+    assert response == []
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_iter_answers_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    owner = domain.ObjectID()
+    field_id = domain.ObjectID()
+
+    created = [
+        await actor.create_answer(
+            proto.CreateTextAnswer(
+                text="test",
+                form_field_id=field_id,
+                respondent_id=owner,
+            )
+        )
+        for _ in range(3)
+    ]
+
+    response = [answer async for answer in actor.iter_answers(batch_size=2)]
+
+    assert {answer.id for answer in created} <= {answer.id for answer in response}
+    assert all(
+        isinstance(answer, domain.TextAnswer | domain.ChoiceAnswer)
+        for answer in response
+    )
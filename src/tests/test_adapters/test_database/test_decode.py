@@ -0,0 +1,186 @@
+import re
+from datetime import datetime
+from typing import Any
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+
+import src.domain.model as domain
+from src.adapter.internal.database.motordb import codec
+from src.adapter.internal.database.motordb.decode import DecodeMode, Decoder
+
+_timestamp = datetime.now().replace(microsecond=0)
+
+CASES = [
+    (
+        domain.Allocation,
+        domain.AllocationResolver.validate_python,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "name": "test",
+            "state": "open",
+            "creator_id": domain.ObjectID(),
+            "participants_ids": {domain.ObjectID(), domain.ObjectID()},
+            "due": _timestamp,
+        },
+    ),
+    (
+        domain.Participant,
+        domain.ParticipantResolver.validate_python,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "allocation_id": domain.ObjectID(),
+            "user_id": domain.ObjectID(),
+            "state": "allocated",
+            "room_id": domain.ObjectID(),
+            "viewed_ids": {domain.ObjectID() for _ in range(10)},
+        },
+    ),
+    (
+        domain.FormField,
+        domain.FormFieldResolver.validate_python,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "kind": "text",
+            "required": True,
+            "frozen": False,
+            "question": "test",
+            "question_entities": [
+                {"option": "link", "offset": 0, "length": 4, "url": "https://t.me"},
+                {"option": "code", "offset": 0, "length": 4, "language": "python"},
+            ],
+            "creator_id": domain.ObjectID(),
+            "re": re.compile(r"^\d+$"),
+            "ex": "42",
+        },
+    ),
+    (
+        domain.FormField,
+        domain.FormFieldResolver.validate_python,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "kind": "choice",
+            "required": True,
+            "frozen": False,
+            "question": "test",
+            "creator_id": domain.ObjectID(),
+            "options": [{"text": "first"}, {"text": "second", "respondent_count": 1}],
+            "multiple": True,
+        },
+    ),
+    (
+        domain.Answer,
+        domain.AnswerResolver.validate_python,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "form_field_id": domain.ObjectID(),
+            "respondent_id": domain.ObjectID(),
+            "kind": "choice",
+            "option_indexes": [0, 1],
+        },
+    ),
+    (
+        domain.User,
+        domain.User.model_validate,
+        {
+            "_id": domain.ObjectID(),
+            "telegram_id": 1,
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "profile": {
+                "first_name": "test",
+                "language_code": "en",
+                "gender": "male",
+                "birthdate": _timestamp.date(),
+            },
+        },
+    ),
+    (
+        domain.Room,
+        domain.Room.model_validate,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "name": "test",
+            "capacity": 2,
+            "occupied": 1,
+            "gender_restriction": None,
+            "creator_id": domain.ObjectID(),
+        },
+    ),
+    (
+        domain.Preference,
+        domain.Preference.model_validate,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "deleted_at": _timestamp,
+            "kind": "friendship",
+            "status": "pending",
+            "user_id": domain.ObjectID(),
+            "target_id": domain.ObjectID(),
+        },
+    ),
+]
+
+param_string = "annotation, validate, payload"
+param_attrs = [
+    pytest.param(*case, id=f"{case[0].__name__}-{index}")
+    for index, case in enumerate(CASES)
+]
+
+
+def _stored(model: Any) -> RawBSONDocument:
+    data = bson.encode(codec.to_document(model), codec_options=codec.CODEC_OPTIONS)
+    return RawBSONDocument(data, codec.CODEC_OPTIONS)
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_trusted_decode_matches_validation(
+    annotation: Any, validate: Any, payload: dict[str, Any]
+):
+    document = _stored(validate(payload))
+
+    trusted = Decoder(annotation, validate, DecodeMode.TRUSTED)(document)
+    validated = Decoder(annotation, validate, DecodeMode.VALIDATE)(document)
+
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_verify_decode_returns_validated(
+    annotation: Any, validate: Any, payload: dict[str, Any]
+):
+    model = validate(payload)
+
+    assert Decoder(annotation, validate, DecodeMode.VERIFY)(_stored(model)) == model
+
+
+def test_verify_decode_mismatch_fail():
+    document = {
+        "_id": domain.ObjectID(),
+        "created_at": _timestamp,
+        "updated_at": _timestamp,
+        "name": "test",
+        "capacity": "2",
+        "occupied": 0,
+        "gender_restriction": None,
+        "creator_id": domain.ObjectID(),
+    }
+
+    with pytest.raises(ValueError, match="trusted decode mismatch"):
+        Decoder(domain.Room, domain.Room.model_validate, DecodeMode.VERIFY)(document)
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING
+
+from src.adapter.internal.database.mongodb import indexes, models
+
+USERS = models.User.Settings.name
+TELEGRAM_ID_INDEX = "telegram_id_1"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[AsyncIOMotorDatabase]:
+    # a database of its own, other workers keep using the shared one
+    client = AsyncIOMotorClient("mongodb://localhost:27017")
+    name = f"randorm-indexes-{ObjectId()}"
+    yield client[name]
+    await client.drop_database(name)
+
+
+async def test_sync_indexes_rebuild_unique(database: AsyncIOMotorDatabase):
+    await database[USERS].create_index([("telegram_id", ASCENDING)])
+    await database[USERS].insert_many([{"telegram_id": 1}, {"telegram_id": 2}])
+
+    await indexes.sync_indexes(database)
+
+    info = await database[USERS].index_information()
+    assert info[TELEGRAM_ID_INDEX].get("unique") is True
+
+
+async def test_sync_indexes_duplicates_keep_old(database: AsyncIOMotorDatabase):
+    await database[USERS].create_index([("telegram_id", ASCENDING)])
+    await database[USERS].insert_many([{"telegram_id": 1}, {"telegram_id": 1}])
+
+    await indexes.sync_indexes(database)
+
+    info = await database[USERS].index_information()
+    assert TELEGRAM_ID_INDEX in info
+    assert info[TELEGRAM_ID_INDEX].get("unique") is None
+    # the other declared indexes are still built
+    assert len(info) == len(models.User.Settings.indexes) + 1
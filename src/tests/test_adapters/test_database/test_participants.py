@@ -1,4 +1,6 @@
+import random
 from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
 
 import pytest
 from pydantic import BaseModel, ConfigDict
@@ -6,14 +8,22 @@ from pydantic import BaseModel, ConfigDict
 import src.domain.exception.database as exception
 import src.domain.model as domain
 import src.protocol.internal.database.participant as proto
+import src.protocol.internal.database.user as user_proto
 from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
+from src.protocol.internal.database.existence import ExistenceState
 
 
 async def _get_mongo():
     return await MongoDBAdapter.create("mongodb://localhost:27017")
 
 
+async def _get_motor():
+    return await MotorDBAdapter.create("mongodb://localhost:27017", DecodeMode.VERIFY)
+
+
 async def _get_memory():
     return MemoryDBAdapter()
 
@@ -21,7 +31,7 @@ async def _get_memory():
 type ActorFn = Callable[[], Awaitable[proto.ParticipantDatabaseProtocol]]
 
 param_string = "actor_fn"
-param_attrs = [_get_mongo, _get_memory]
+param_attrs = [_get_mongo, _get_motor, _get_memory]
 
 
 @pytest.mark.parametrize(param_string, param_attrs)
@@ -766,6 +776,56 @@ async def test_update_participant_change_room_ok(actor_fn: ActorFn):
     assert response.state == domain.ParticipantState.ALLOCATED
 
 
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_update_allocated_participant_state_keep_room_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    data = proto.CreateAllocatedParticipant(
+        user_id=domain.ObjectID(),
+        allocation_id=domain.ObjectID(),
+        room_id=domain.ObjectID(),
+        state=domain.ParticipantState.ALLOCATED,
+    )
+
+    document = await actor.create_participant(data)
+
+    new_data = proto.UpdateParticipant(
+        _id=document.id,
+        state=domain.ParticipantState.ALLOCATED,
+    )
+
+    response = await actor.update_participant(new_data)
+
+    assert isinstance(response, domain.AllocatedParticipant)
+    assert response.room_id == data.room_id
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_update_creating_participant_allocate_without_room_fail(
+    actor_fn: ActorFn,
+):
+    actor = await actor_fn()
+
+    data = proto.CreateCreatingParticipant(
+        user_id=domain.ObjectID(),
+        allocation_id=domain.ObjectID(),
+        state=domain.ParticipantState.CREATING,
+    )
+
+    document = await actor.create_participant(data)
+
+    new_data = proto.UpdateParticipant(
+        _id=document.id,
+        state=domain.ParticipantState.ALLOCATED,
+    )
+
+    with pytest.raises(exception.ParticipantException):
+        await actor.update_participant(new_data)
+
+    response = await actor.read_participant(proto.ReadParticipant(_id=document.id))
+    assert response.state == domain.ParticipantState.CREATING
+
+
 @pytest.mark.parametrize(param_string, param_attrs)
 async def test_update_creating_participant_room_fail(actor_fn: ActorFn):
     actor = await actor_fn()
@@ -833,3 +893,243 @@ async def test_update_active_participant_room_fail(actor_fn: ActorFn):
 
     with pytest.raises(exception.UpdateParticipantException):
         await actor.update_participant(new_data)
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_find_participant_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    user_id = domain.ObjectID()
+    allocation_id = domain.ObjectID()
+
+    await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=user_id,
+            allocation_id=domain.ObjectID(),
+        )
+    )
+    document = await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=user_id,
+            allocation_id=allocation_id,
+        )
+    )
+
+    response = await actor.find_participant(
+        proto.FindParticipant(user_id=user_id, allocation_id=allocation_id)
+    )
+
+    assert isinstance(response, domain.ActiveParticipant)
+    assert response.id == document.id
+    assert response.user_id == user_id
+    assert response.allocation_id == allocation_id
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_find_participant_not_exist_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    response = await actor.find_participant(
+        proto.FindParticipant(
+            user_id=domain.ObjectID(),
+            allocation_id=domain.ObjectID(),
+        )
+    )
+
+    assert response is None
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_find_participant_deleted_skip(actor_fn: ActorFn):
+    actor = await actor_fn()
+    user_id = domain.ObjectID()
+    allocation_id = domain.ObjectID()
+
+    document = await actor.create_participant(
+        proto.CreateActiveParticipant(user_id=user_id, allocation_id=allocation_id)
+    )
+    await actor.delete_participant(proto.DeleteParticipant(_id=document.id))
+
+    response = await actor.find_participant(
+        proto.FindParticipant(user_id=user_id, allocation_id=allocation_id)
+    )
+
+    assert response is None
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_find_participant_reflect_fail(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    with pytest.raises(exception.ReflectParticipantException):
+        await actor.find_participant(object)  # type: ignore
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_sample_participants_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    allocation_id = domain.ObjectID()
+    user_id = domain.ObjectID()
+
+    await actor.create_participant(
+        proto.CreateActiveParticipant(user_id=user_id, allocation_id=allocation_id)
+    )
+    await actor.create_participant(
+        proto.CreateCreatedParticipant(
+            user_id=domain.ObjectID(), allocation_id=allocation_id
+        )
+    )
+    await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=domain.ObjectID(), allocation_id=domain.ObjectID()
+        )
+    )
+    viewed = await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=domain.ObjectID(), allocation_id=allocation_id
+        )
+    )
+    candidates = [
+        await actor.create_participant(
+            proto.CreateActiveParticipant(
+                user_id=domain.ObjectID(), allocation_id=allocation_id
+            )
+        )
+        for _ in range(3)
+    ]
+
+    response = await actor.sample_participants(
+        proto.SampleParticipants(
+            allocation_id=allocation_id,
+            excluded_user_id=user_id,
+            excluded_ids={viewed.id},
+            size=2,
+        )
+    )
+
+    assert len(response) == 2
+    assert all(isinstance(item, domain.ActiveParticipant) for item in response)
+    assert {item.id for item in response} <= {item.id for item in candidates}
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_sample_participants_reflect_fail(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    with pytest.raises(exception.ReflectParticipantException):
+        await actor.sample_participants(object)  # type: ignore
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_iter_participants_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    allocation_id = domain.ObjectID()
+
+    created = [
+        await actor.create_participant(
+            proto.CreateActiveParticipant(
+                user_id=domain.ObjectID(), allocation_id=allocation_id
+            )
+        )
+        for _ in range(3)
+    ]
+
+    response = [
+        participant async for participant in actor.iter_participants(batch_size=2)
+    ]
+
+    assert {item.id for item in created} <= {item.id for item in response}
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_iter_participants_updated_window_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    document = await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=domain.ObjectID(), allocation_id=domain.ObjectID()
+        )
+    )
+    deleted = await actor.delete_participant(proto.DeleteParticipant(_id=document.id))
+
+    assert deleted.updated_at == deleted.deleted_at
+
+    inside = [
+        participant.id
+        async for participant in actor.iter_participants(
+            updated_since=deleted.updated_at,
+            updated_before=deleted.updated_at + timedelta(seconds=1),
+        )
+    ]
+    outside = [
+        participant.id
+        async for participant in actor.iter_participants(
+            updated_since=deleted.updated_at + timedelta(seconds=1),
+        )
+    ]
+
+    assert document.id in inside
+    assert document.id not in outside
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_iter_participants_with_gender_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    assert isinstance(actor, user_proto.UserDatabaseProtocol)
+
+    user = await actor.create_user(
+        user_proto.CreateUser(
+            telegram_id=random.getrandbits(48),
+            profile=domain.Profile(
+                first_name="test",
+                gender=domain.Gender.FEMALE,
+                language_code=domain.LanguageCode.EN,
+                birthdate=datetime.today().date(),
+            ),
+            views=0,
+        )
+    )
+    with_user = await actor.create_participant(
+        proto.CreateActiveParticipant(user_id=user.id, allocation_id=domain.ObjectID())
+    )
+    without_user = await actor.create_participant(
+        proto.CreateActiveParticipant(
+            user_id=domain.ObjectID(), allocation_id=domain.ObjectID()
+        )
+    )
+
+    response = {
+        participant.id: gender
+        async for participant, gender in actor.iter_participants_with_gender()
+    }
+
+    assert response[with_user.id] == domain.Gender.FEMALE
+    assert response[without_user.id] is None
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_exists_many_participants_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+
+    active = await actor.create_participant(
+        proto.CreateActiveParticipant(
+            allocation_id=domain.ObjectID(),
+            user_id=domain.ObjectID(),
+        )
+    )
+    deleted = await actor.create_participant(
+        proto.CreateAllocatedParticipant(
+            allocation_id=domain.ObjectID(),
+            user_id=domain.ObjectID(),
+            room_id=domain.ObjectID(),
+        )
+    )
+    await actor.delete_participant(proto.DeleteParticipant(_id=deleted.id))
+    missing = domain.ObjectID()
+
+    response = await actor.exists_many_participants([active.id, deleted.id, missing])
+
+    assert response == {
+        active.id: ExistenceState.ACTIVE,
+        deleted.id: ExistenceState.DELETED,
+        missing: ExistenceState.MISSING,
+    }
@@ -9,12 +9,18 @@ import src.domain.model as domain
 import src.protocol.internal.database.preference as proto
 from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
 
 
 async def _get_mongo():
     return await MongoDBAdapter.create("mongodb://localhost:27017")
 
 
+async def _get_motor():
+    return await MotorDBAdapter.create("mongodb://localhost:27017", DecodeMode.VERIFY)
+
+
 async def _get_memory():
     return MemoryDBAdapter()
 
@@ -22,7 +28,7 @@ async def _get_memory():
 type ActorFn = Callable[[], Awaitable[proto.PreferenceDatabaseProtocol]]
 
 param_string = "actor_fn"
-param_attrs = [_get_mongo, _get_memory]
+param_attrs = [_get_mongo, _get_motor, _get_memory]
 
 
 @pytest.mark.parametrize(param_string, param_attrs)
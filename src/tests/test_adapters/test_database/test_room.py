@@ -9,12 +9,19 @@ import src.domain.model as domain
 import src.protocol.internal.database.room as proto
 from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
+from src.protocol.internal.database.existence import ExistenceState
 
 
 async def _get_mongo():
     return await MongoDBAdapter.create("mongodb://localhost:27017")
 
 
+async def _get_motor():
+    return await MotorDBAdapter.create("mongodb://localhost:27017", DecodeMode.VERIFY)
+
+
 async def _get_memory():
     return MemoryDBAdapter()
 
@@ -22,7 +29,7 @@ async def _get_memory():
 type ActorFn = Callable[[], Awaitable[proto.RoomDatabaseProtocol]]
 
 param_string = "actor_fn"
-param_attrs = [_get_mongo, _get_memory]
+param_attrs = [_get_mongo, _get_motor, _get_memory]
 
 
 @pytest.mark.parametrize(param_string, param_attrs)
@@ -263,3 +270,31 @@ async def test_delete_room_immutable_fail(actor_fn: ActorFn):
     data = object
     with pytest.raises(exception.ReflectRoomException):
         await actor.delete_room(data)  # type: ignore
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+async def test_exists_many_rooms_ok(actor_fn: ActorFn):
+    actor = await actor_fn()
+    owner = domain.ObjectID()
+
+    data = proto.CreateRoom(
+        name="test",
+        capacity=5,
+        occupied=2,
+        creator_id=owner,
+        editors_ids={owner},
+        gender_restriction=None,
+    )
+
+    active = await actor.create_room(data)
+    deleted = await actor.create_room(data)
+    await actor.delete_room(proto.DeleteRoom(_id=deleted.id))
+    missing = domain.ObjectID()
+
+    response = await actor.exists_many_rooms([active.id, deleted.id, missing])
+
+    assert response == {
+        active.id: ExistenceState.ACTIVE,
+        deleted.id: ExistenceState.DELETED,
+        missing: ExistenceState.MISSING,
+    }
@@ -1,3 +1,4 @@
+import random
 from collections.abc import Awaitable, Callable
 from datetime import datetime
 
@@ -9,15 +10,18 @@ import src.domain.model as domain
 import src.protocol.internal.database.user as proto
 from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
 from src.adapter.internal.database.mongodb.service import MongoDBAdapter
+from src.adapter.internal.database.motordb.decode import DecodeMode
+from src.adapter.internal.database.motordb.service import MotorDBAdapter
 
 
 async def _get_mongo():
-    adapter = await MongoDBAdapter.create("mongodb://localhost:27017")
-    await adapter._client.drop_database(adapter._client.db_name)
-
     return await MongoDBAdapter.create("mongodb://localhost:27017")
 
 
+async def _get_motor():
+    return await MotorDBAdapter.create("mongodb://localhost:27017", DecodeMode.VERIFY)
+
+
 async def _get_memory():
     return MemoryDBAdapter()
 
@@ -25,7 +29,7 @@ async def _get_memory():
 type ActorFn = Callable[[], Awaitable[proto.UserDatabaseProtocol]]
 
 param_string = "actor_fn"
-param_attrs = [_get_mongo, _get_memory]
+param_attrs = [_get_mongo, _get_motor, _get_memory]
 
 
 @pytest.mark.parametrize(param_string, param_attrs)
@@ -33,7 +37,7 @@ async def test_create_user_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=1,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -79,7 +83,7 @@ async def test_find_users_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=345,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -118,9 +122,9 @@ async def test_find_users_by_username_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=346,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
-            username="test345",
+            username=f"test{random.getrandbits(48)}",
             first_name="test",
             last_name="test",
             gender=domain.Gender.MALE,
@@ -157,7 +161,7 @@ async def test_read_user_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=1,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -205,7 +209,7 @@ async def test_update_user_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=1,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -268,7 +272,7 @@ async def test_delete_user_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=1,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -387,7 +391,7 @@ async def test_update_user_only_views_ok(actor_fn: ActorFn):
     actor = await actor_fn()
 
     data = proto.CreateUser(
-        telegram_id=1,
+        telegram_id=random.getrandbits(48),
         profile=domain.Profile(
             username="test",
             first_name="test",
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import src.domain.model as domain
+from src.adapter.external.graphql.cache import CachedDataLoader
+from src.adapter.internal.cache.memorydb.service import MemoryDBService
+
+
+def _room() -> domain.Room:
+    return domain.Room(
+        _id=domain.ObjectID(),
+        created_at=datetime.now(),
+        updated_at=datetime.now(),
+        name="test",
+        capacity=2,
+        occupied=0,
+        gender_restriction=None,
+        creator_id=domain.ObjectID(),
+    )
+
+
+class Rooms:
+    def __init__(self, *rooms: domain.Room):
+        self.rooms = {room.id: room for room in rooms}
+        self.reads: list[list[domain.ObjectID]] = []
+
+    async def read_many(self, ids: list[domain.ObjectID]) -> list[domain.Room]:
+        self.reads.append(ids)
+        return [self.rooms[id] for id in ids]
+
+
+async def test_cached_loader_miss_put():
+    room = _room()
+    rooms = Rooms(room)
+    cache = MemoryDBService[domain.Room]()
+
+    loader = CachedDataLoader(rooms.read_many, lambda item: item.name, cache)
+
+    assert await loader.load(room.id) == "test"
+    assert await cache.get(room.id) == room  # type: ignore
+    assert rooms.reads == [[room.id]]
+
+
+async def test_cached_loader_hit_skip_fetch():
+    room, other = _room(), _room()
+    rooms = Rooms(room, other)
+    cache = MemoryDBService[domain.Room]()
+    await cache.put(room.id, room)  # type: ignore
+
+    loader = CachedDataLoader(rooms.read_many, lambda item: item.id, cache)
+
+    assert await loader.load_many([room.id, other.id]) == [room.id, other.id]
+    assert rooms.reads == [[other.id]]
+
+    # the next request is served by the shared cache only
+    loader = CachedDataLoader(rooms.read_many, lambda item: item.id, cache)
+    assert await loader.load_many([room.id, other.id]) == [room.id, other.id]
+    assert rooms.reads == [[other.id]]
+
+
+async def test_cached_loader_clear_keep_shared():
+    room = _room()
+    rooms = Rooms(room)
+    cache = MemoryDBService[domain.Room]()
+
+    loader = CachedDataLoader(rooms.read_many, lambda item: item.id, cache)
+    await loader.load(room.id)
+
+    # shared entries are evicted by the services on writes
+    loader.clear(room.id)
+
+    assert await cache.get(room.id) == room  # type: ignore
+    await loader.load(room.id)
+    assert rooms.reads == [[room.id]]
+
+
+async def test_cached_loader_without_cache():
+    room = _room()
+    rooms = Rooms(room)
+
+    loader = CachedDataLoader(rooms.read_many, lambda item: item.id)
+
+    assert await loader.load(room.id) == room.id
+    assert await loader.load(room.id) == room.id
+    assert rooms.reads == [[room.id]]
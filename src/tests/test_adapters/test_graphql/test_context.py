@@ -0,0 +1,109 @@
+import secrets
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from strawberry.dataloader import DataLoader
+
+import src.domain.model as domain
+from src.adapter.external.auth.telegram import TelegramOauthAdapter
+from src.adapter.external.graphql.schema import SCHEMA
+from src.adapter.external.graphql.tool.context import LoaderRegistry
+from src.adapter.external.graphql.view import RandormGraphQLView
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service.allocation import AllocationService
+from src.service.answer import AnswerService
+from src.service.form_field import FormFieldService
+from src.service.identity import EntityKind
+from src.service.participant import ParticipantService
+from src.service.preference import PreferenceService
+from src.service.room import RoomService
+from src.service.user import UserService
+
+
+def create_view(**kwargs) -> RandormGraphQLView:
+    repo = MemoryDBAdapter()
+    user_service = UserService(repo)
+    jwt_secret = secrets.token_hex(32)
+    return RandormGraphQLView(
+        SCHEMA,
+        TelegramOauthAdapter("secret", jwt_secret, user_service),
+        jwt_secret,
+        user_service,
+        AllocationService(repo, repo, repo, repo),
+        FormFieldService(repo, repo, repo),
+        AnswerService(repo, repo),
+        ParticipantService(repo, repo, repo, repo),
+        PreferenceService(repo, repo),
+        RoomService(repo, repo),
+        **kwargs,
+    )
+
+
+def _request() -> SimpleNamespace:
+    return SimpleNamespace(headers={}, cookies={})
+
+
+async def test_context_lazy_loaders():
+    view = create_view()
+    context = await view.get_context(_request(), None)
+
+    assert isinstance(context.user.service, UserService)
+    assert EntityKind.USER not in context.loaders
+
+    loader = context.user.loader
+    assert context.user.loader is loader
+    assert context.loaders[EntityKind.USER] is loader
+    assert EntityKind.ROOM not in context.loaders
+    assert "respondent_answers" not in context.loaders
+
+
+async def test_context_loaders_per_request():
+    view = create_view()
+    first = await view.get_context(_request(), None)
+    second = await view.get_context(_request(), None)
+
+    assert first.room.loader is not second.room.loader
+
+
+async def test_context_answer_write_clear_respondent_answers():
+    view = create_view()
+    context = await view.get_context(_request(), None)
+    respondent_id = domain.ObjectID()
+
+    loader = context.respondent_answers
+    assert await loader.load(respondent_id) == []
+
+    await context.identity_map.write(
+        EntityKind.ANSWER,
+        domain.TextAnswer(
+            _id=domain.ObjectID(),
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            form_field_id=domain.ObjectID(),
+            respondent_id=respondent_id,
+            text="test",
+        ),
+    )
+
+    assert loader.cache_map.get(str(respondent_id)) is None
+
+
+async def test_context_registered_loader():
+    view = create_view()
+
+    async def load(ids: list[str]) -> list[int]:
+        return [len(id) for id in ids]
+
+    view.loaders.register("length", lambda: DataLoader(load_fn=load))
+    context = await view.get_context(_request(), None)
+
+    assert await context.loaders["length"].load("test") == 4
+
+
+def test_registry_duplicate_fail():
+    registry = LoaderRegistry()
+    registry.register("test", DataLoader)
+
+    with pytest.raises(ValueError):
+        registry.register("test", DataLoader)
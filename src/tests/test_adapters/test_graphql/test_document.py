@@ -0,0 +1,117 @@
+from typing import Any
+
+import pytest
+import strawberry as sb
+import strawberry.schema.execute as execute
+
+from src.adapter.external.graphql import document
+from src.adapter.external.graphql.document import DocumentCache
+
+
+@sb.type
+class Query:
+    @sb.field
+    def hello(self, name: str) -> str:
+        return f"hello {name}"
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    calls = {"parse": 0, "validate": 0}
+
+    def counted(name: str, fn: Any) -> Any:
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        execute, "parse_document", counted("parse", execute.parse_document)
+    )
+    monkeypatch.setattr(
+        execute, "validate_document", counted("validate", execute.validate_document)
+    )
+    return calls
+
+
+def _schema(cache: DocumentCache) -> sb.Schema:
+    return sb.Schema(query=Query, extensions=[cache.extension])  # type: ignore
+
+
+async def test_document_cache_hit_skip_parse(calls: dict[str, int]):
+    cache = DocumentCache(10)
+    schema = _schema(cache)
+
+    for _ in range(3):
+        result = await schema.execute('{ hello(name: "test") }')
+        assert result.errors is None
+        assert result.data == {"hello": "hello test"}
+
+    assert calls == {"parse": 1, "validate": 1}
+    assert cache.stats() == (2, 1, 0, 1)
+
+
+async def test_document_cache_variables(calls: dict[str, int]):
+    cache = DocumentCache(10)
+    schema = _schema(cache)
+    query = "query Hello($name: String!) { hello(name: $name) }"
+
+    for name in ["first", "second"]:
+        result = await schema.execute(query, variable_values={"name": name})
+        assert result.data == {"hello": f"hello {name}"}
+
+    assert calls == {"parse": 1, "validate": 1}
+
+
+async def test_document_cache_validation_errors(calls: dict[str, int]):
+    cache = DocumentCache(10)
+    schema = _schema(cache)
+
+    for _ in range(2):
+        result = await schema.execute("{ unknown }")
+        assert result.errors and "unknown" in result.errors[0].message
+
+    assert calls == {"parse": 1, "validate": 1}
+
+
+async def test_document_cache_syntax_error_skip(calls: dict[str, int]):
+    cache = DocumentCache(10)
+    schema = _schema(cache)
+
+    for _ in range(2):
+        result = await schema.execute("{ hello(")
+        assert result.errors
+
+    assert calls["parse"] == 2
+    assert cache.stats().size == 0
+
+
+async def test_document_cache_lru_evict():
+    cache = DocumentCache(2)
+    schema = _schema(cache)
+    first, second, third = [
+        f'{{ hello(name: "{name}") }}' for name in ["first", "second", "third"]
+    ]
+
+    for query in [first, second, first, third]:
+        await schema.execute(query)
+
+    assert cache.stats() == (1, 3, 1, 2)
+    assert cache.get(DocumentCache.key(second)) is None
+    assert cache.get(DocumentCache.key(first)) is not None
+
+
+async def test_document_cache_log_stats(monkeypatch: pytest.MonkeyPatch):
+    messages: list[str] = []
+    monkeypatch.setattr(document.log, "info", messages.append)
+    cache = DocumentCache(10, stats_interval=2)
+    schema = _schema(cache)
+
+    for _ in range(5):
+        await schema.execute('{ hello(name: "test") }')
+
+    assert messages == [
+        "document cache hits 1, misses 1, evictions 0, size 1",
+        "document cache hits 3, misses 1, evictions 0, size 1",
+    ]
@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from src.adapter.external.graphql.persisted import PersistedQueries
+from src.adapter.internal.cache.memorydb.persisted import MemoryPersistedQueryService
+from src.tests.test_adapters.test_graphql.test_context import create_view
+
+QUERY = "query Typename { __typename }"
+HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+DATA = {"data": {"__typename": "Query"}}
+
+
+def _extensions(hash: str = HASH) -> dict[str, Any]:
+    return {"persistedQuery": {"version": 1, "sha256Hash": hash}}
+
+
+async def _client(persisted: PersistedQueries) -> AsyncIterator[TestClient]:
+    app = web.Application()
+    app.router.add_route("*", "/graphql", create_view(persisted_queries=persisted))
+    async with TestClient(TestServer(app)) as client:
+        yield client
+
+
+@pytest.fixture
+def store() -> MemoryPersistedQueryService:
+    return MemoryPersistedQueryService(10)
+
+
+@pytest.fixture
+async def client(store: MemoryPersistedQueryService) -> AsyncIterator[TestClient]:
+    async for client in _client(PersistedQueries(store)):
+        yield client
+
+
+@pytest.fixture
+async def allowlist_client(
+    store: MemoryPersistedQueryService,
+) -> AsyncIterator[TestClient]:
+    async for client in _client(PersistedQueries(store, allowlist=True)):
+        yield client
+
+
+async def _post(client: TestClient, **payload: Any) -> dict[str, Any]:
+    response = await client.post("/graphql", json=payload)
+    assert response.status == 200
+    return await response.json()
+
+
+def _code(response: dict[str, Any]) -> str:
+    return response["errors"][0]["extensions"]["code"]
+
+
+async def test_persisted_query_register(
+    client: TestClient, store: MemoryPersistedQueryService
+):
+    response = await _post(client, extensions=_extensions())
+    assert response["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert _code(response) == "PERSISTED_QUERY_NOT_FOUND"
+
+    response = await _post(client, query=QUERY, extensions=_extensions())
+    assert response == DATA
+    assert await store.get(HASH) == QUERY
+
+    response = await _post(client, extensions=_extensions())
+    assert response == DATA
+
+
+async def test_persisted_query_get(
+    client: TestClient, store: MemoryPersistedQueryService
+):
+    await store.put(HASH, QUERY)
+
+    response = await client.get(
+        "/graphql", params={"extensions": json.dumps(_extensions())}
+    )
+
+    assert response.status == 200
+    assert await response.json() == DATA
+
+
+async def test_persisted_query_hash_mismatch_fail(
+    client: TestClient, store: MemoryPersistedQueryService
+):
+    response = await _post(client, query=QUERY, extensions=_extensions("0" * 64))
+
+    assert _code(response) == "BAD_REQUEST"
+    assert await store.get("0" * 64) is None
+
+
+async def test_persisted_query_unsupported_version_fail(client: TestClient):
+    extensions = {"persistedQuery": {"version": 2, "sha256Hash": HASH}}
+
+    response = await _post(client, extensions=extensions)
+
+    assert _code(response) == "PERSISTED_QUERY_NOT_SUPPORTED"
+
+
+async def test_ad_hoc_query(client: TestClient):
+    assert await _post(client, query=QUERY) == DATA
+
+
+async def test_allowlist_reject_ad_hoc(
+    allowlist_client: TestClient, store: MemoryPersistedQueryService
+):
+    response = await _post(allowlist_client, query=QUERY)
+    assert _code(response) == "PERSISTED_QUERY_NOT_IN_LIST"
+
+    response = await _post(allowlist_client, extensions=_extensions())
+    assert _code(response) == "PERSISTED_QUERY_NOT_IN_LIST"
+
+    response = await _post(allowlist_client, query=QUERY, extensions=_extensions())
+    assert _code(response) == "PERSISTED_QUERY_NOT_IN_LIST"
+    assert await store.get(HASH) is None
+
+
+async def test_allowlist_registered(
+    allowlist_client: TestClient, store: MemoryPersistedQueryService
+):
+    await store.put(HASH, QUERY)
+
+    response = await _post(allowlist_client, extensions=_extensions())
+
+    assert response == DATA
+
+
+async def test_allowlist_reject_client_registered(
+    client: TestClient, store: MemoryPersistedQueryService
+):
+    await _post(client, query=QUERY, extensions=_extensions())
+    assert await store.get(HASH) == QUERY
+
+    # the allowlist is kept apart from the client registrations
+    allowlist = PersistedQueries(MemoryPersistedQueryService(10), allowlist=True)
+    async for allowlist_client in _client(allowlist):
+        response = await _post(allowlist_client, extensions=_extensions())
+        assert _code(response) == "PERSISTED_QUERY_NOT_IN_LIST"
+
+
+async def test_memory_persisted_lru_bound():
+    store = MemoryPersistedQueryService(2)
+
+    await store.put("first", "{ first }")
+    await store.put("second", "{ second }")
+    await store.get("first")
+    await store.put("third", "{ third }")
+
+    assert await store.get("first") == "{ first }"
+    assert await store.get("second") is None
+    assert await store.get("third") == "{ third }"
+
+
+async def test_memory_persisted_ttl_expire():
+    store = MemoryPersistedQueryService(2, ttl=0.05)
+
+    await store.put("first", "{ first }")
+    assert await store.get("first") == "{ first }"
+
+    await asyncio.sleep(0.05)
+    assert await store.get("first") is None
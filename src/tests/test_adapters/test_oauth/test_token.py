@@ -0,0 +1,67 @@
+import secrets
+from datetime import timedelta
+from unittest import mock
+
+import jwt
+import pytest
+
+from src.adapter.external.auth.telegram import (
+    TgOauthContainer,
+    TgOauthDTO,
+    VerifiedTokenCache,
+)
+from src.domain.model.scalar.object_id import ObjectID
+
+JWT_SECRET = secrets.token_hex(32)
+
+
+def _token(ttl: timedelta = timedelta(days=1)) -> str:
+    dto = TgOauthDTO(id=ObjectID(), telegram_id=1)
+    return TgOauthContainer.construct(dto, JWT_SECRET, ttl=ttl).to_string()
+
+
+def test_construct_claims():
+    claims = TgOauthContainer(jwt=_token(timedelta(hours=1))).claims(JWT_SECRET)
+
+    assert claims["exp"] - claims["iat"] == 3600
+    assert TgOauthContainer(jwt=_token()).to_dto(JWT_SECRET).telegram_id == 1
+
+
+def test_verified_token_cache_hit():
+    cache = VerifiedTokenCache(JWT_SECRET, max_size=10, max_age=timedelta(minutes=5))
+    token = _token()
+
+    dto = cache.verify(token)
+    with mock.patch.object(TgOauthContainer, "claims") as claims:
+        assert cache.verify(token) is dto
+        claims.assert_not_called()
+
+
+def test_verified_token_cache_expired_fail():
+    cache = VerifiedTokenCache(JWT_SECRET, max_size=10, max_age=timedelta(minutes=5))
+    token = _token(timedelta(seconds=-1))
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        cache.verify(token)
+
+
+def test_verified_token_cache_invalid_fail():
+    cache = VerifiedTokenCache(JWT_SECRET, max_size=10, max_age=timedelta(minutes=5))
+    token = jwt.encode({"id": str(ObjectID()), "telegram_id": 1}, secrets.token_hex(32))
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        cache.verify(token)
+
+
+def test_verified_token_cache_bound():
+    cache = VerifiedTokenCache(JWT_SECRET, max_size=1, max_age=timedelta(minutes=5))
+    first, second = _token(), _token()
+
+    cache.verify(first)
+    cache.verify(second)
+
+    with mock.patch.object(
+        TgOauthContainer, "claims", wraps=TgOauthContainer(jwt=first).claims
+    ) as claims:
+        cache.verify(first)
+        claims.assert_called_once()
@@ -0,0 +1,199 @@
+from datetime import datetime
+
+import pytest
+
+import src.domain.model as domain
+from src.app.http import columnar
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+NOW = datetime(2024, 7, 1, 12, 30, 15)
+
+
+def create_answers() -> list[domain.Answer]:
+    return [
+        domain.TextAnswer(
+            _id=domain.ObjectID(),
+            created_at=NOW,
+            updated_at=NOW,
+            form_field_id=domain.ObjectID(),
+            respondent_id=domain.ObjectID(),
+            text="test",
+        ),
+        domain.ChoiceAnswer(
+            _id=domain.ObjectID(),
+            created_at=NOW,
+            updated_at=NOW,
+            deleted_at=NOW,
+            form_field_id=domain.ObjectID(),
+            respondent_id=domain.ObjectID(),
+            option_indexes={2, 0},
+        ),
+    ]
+
+
+def create_participants() -> list[tuple[domain.Participant, domain.Gender | None]]:
+    viewed_id = domain.ObjectID()
+    return [
+        (
+            domain.AllocatedParticipant(
+                _id=domain.ObjectID(),
+                created_at=NOW,
+                updated_at=NOW,
+                allocation_id=domain.ObjectID(),
+                user_id=domain.ObjectID(),
+                room_id=domain.ObjectID(),
+                viewed_ids={viewed_id},
+            ),
+            domain.Gender.FEMALE,
+        ),
+        (
+            domain.CreatingParticipant(
+                _id=domain.ObjectID(),
+                created_at=NOW,
+                updated_at=NOW,
+                allocation_id=domain.ObjectID(),
+                user_id=domain.ObjectID(),
+            ),
+            None,
+        ),
+    ]
+
+
+def _write(schema, batches, parquet: bool) -> bytes:
+    sink = columnar.ChunkSink()
+    writer = columnar.new_writer(sink, schema, parquet)
+
+    data = bytearray()
+    for batch in batches:
+        writer.write_batch(batch)
+        data += sink.drain()
+
+    writer.close()
+    return bytes(data + sink.drain())
+
+
+def _read(data: bytes, parquet: bool):
+    if parquet:
+        return pq.read_table(pa.BufferReader(data))
+
+    return pa.ipc.open_stream(data).read_all()
+
+
+def test_chunk_sink():
+    sink = columnar.ChunkSink()
+
+    assert sink.write(b"abc") == 3
+    assert sink.drain() == b"abc"
+    assert sink.drain() == b""
+
+    sink.write(b"de")
+    assert sink.tell() == 5
+    assert sink.drain() == b"de"
+
+    sink.close()
+    assert sink.closed
+
+
+@pytest.mark.parametrize("parquet", [False, True])
+def test_answers_round_trip(parquet: bool):
+    answers = create_answers()
+    schema = columnar.answer_schema()
+
+    batches = [columnar.answers_to_batch(schema, [answer]) for answer in answers]
+    table = _read(_write(schema, batches, parquet), parquet)
+
+    assert table.schema.names == schema.names
+    assert table.to_pylist() == [
+        {
+            "id": answers[0].id.binary,
+            "created_at": NOW,
+            "updated_at": NOW,
+            "deleted_at": None,
+            "form_field_id": answers[0].form_field_id.binary,
+            "respondent_id": answers[0].respondent_id.binary,
+            "kind": "text",
+            "text": "test",
+            "option_indexes": None,
+        },
+        {
+            "id": answers[1].id.binary,
+            "created_at": NOW,
+            "updated_at": NOW,
+            "deleted_at": NOW,
+            "form_field_id": answers[1].form_field_id.binary,
+            "respondent_id": answers[1].respondent_id.binary,
+            "kind": "choice",
+            "text": None,
+            "option_indexes": [0, 2],
+        },
+    ]
+
+
+@pytest.mark.parametrize("parquet", [False, True])
+def test_participants_round_trip(parquet: bool):
+    participants = create_participants()
+    schema = columnar.participant_schema()
+
+    batch = columnar.participants_to_batch(schema, participants)
+    table = _read(_write(schema, [batch], parquet), parquet)
+
+    (allocated, _), (creating, _) = participants
+    assert table.to_pylist() == [
+        {
+            "id": allocated.id.binary,
+            "created_at": NOW,
+            "updated_at": NOW,
+            "deleted_at": None,
+            "allocation_id": allocated.allocation_id.binary,
+            "user_id": allocated.user_id.binary,
+            "state": "allocated",
+            "room_id": allocated.room_id.binary,  # type: ignore
+            "viewed_ids": [id.binary for id in allocated.viewed_ids],
+            "subscription_ids": [],
+            "subscribers_ids": [],
+            "gender": "female",
+        },
+        {
+            "id": creating.id.binary,
+            "created_at": NOW,
+            "updated_at": NOW,
+            "deleted_at": None,
+            "allocation_id": creating.allocation_id.binary,
+            "user_id": creating.user_id.binary,
+            "state": "creating",
+            "room_id": None,
+            "viewed_ids": [],
+            "subscription_ids": [],
+            "subscribers_ids": [],
+            "gender": None,
+        },
+    ]
+
+
+@pytest.mark.parametrize("parquet", [False, True])
+def test_participants_tombstone_round_trip(parquet: bool):
+    (participant, gender), _ = create_participants()
+    participant.deleted_at = NOW
+    schema = columnar.participant_schema()
+
+    batch = columnar.participants_to_batch(
+        schema, [(participant, gender)], tombstones=True
+    )
+    (row,) = _read(_write(schema, [batch], parquet), parquet).to_pylist()
+
+    assert row == {
+        "id": participant.id.binary,
+        "created_at": NOW,
+        "updated_at": NOW,
+        "deleted_at": NOW,
+        "allocation_id": None,
+        "user_id": None,
+        "state": None,
+        "room_id": None,
+        "viewed_ids": None,
+        "subscription_ids": None,
+        "subscribers_ids": None,
+        "gender": None,
+    }
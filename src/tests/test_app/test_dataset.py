@@ -0,0 +1,210 @@
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.app.http.routes.dataset import NEXT_SINCE_HEADER, DatasetRouter
+from src.service.answer import AnswerService
+from src.service.participant import ParticipantService
+
+SECRET_KEY = "secret"
+HEADERS = {"X-Secret-Key": SECRET_KEY}
+COMMIT_LAG = timedelta(seconds=10)
+
+
+async def create_client(repo: MemoryDBAdapter) -> AsyncIterator[TestClient]:
+    app = web.Application()
+    DatasetRouter(
+        SECRET_KEY,
+        AnswerService(repo, repo),
+        ParticipantService(repo, repo, repo, repo),
+        commit_lag=COMMIT_LAG,
+    ).regiter_routers(app)
+
+    async with TestClient(TestServer(app)) as client:
+        yield client
+
+
+@pytest.fixture
+def repo() -> MemoryDBAdapter:
+    return MemoryDBAdapter()
+
+
+@pytest.fixture
+async def client(repo: MemoryDBAdapter) -> AsyncIterator[TestClient]:
+    async for client in create_client(repo):
+        yield client
+
+
+def _ago(seconds: float) -> datetime:
+    return datetime.now().replace(microsecond=0) - timedelta(seconds=seconds)
+
+
+async def create_answer(repo: MemoryDBAdapter, updated_at: datetime) -> domain.Answer:
+    answer = await repo.create_answer(
+        proto.CreateTextAnswer(
+            text="test",
+            form_field_id=domain.ObjectID(),
+            respondent_id=domain.ObjectID(),
+        )
+    )
+    repo._answer_collection[answer.id].updated_at = updated_at
+    return answer
+
+
+async def _export(
+    client: TestClient, path: str = "answers", **params: Any
+) -> tuple[list[dict[str, Any]], datetime]:
+    response = await client.get(
+        f"/private/dataset/{path}", params=params, headers=HEADERS
+    )
+    assert response.status == 200
+
+    records = json.loads(await response.read())
+    return records, datetime.fromisoformat(response.headers[NEXT_SINCE_HEADER])
+
+
+async def test_export_full_newest(client: TestClient, repo: MemoryDBAdapter):
+    old = await create_answer(repo, _ago(60))
+    new = await create_answer(repo, _ago(1))
+
+    records, next_since = await _export(client)
+
+    assert [record["id"] for record in records] == [str(old.id), str(new.id)]
+    assert next_since <= _ago(COMMIT_LAG.total_seconds())
+
+
+async def test_export_incremental_lag_newest(client: TestClient, repo: MemoryDBAdapter):
+    old = await create_answer(repo, _ago(60))
+    await create_answer(repo, _ago(1))
+
+    records, next_since = await _export(client, since=_ago(120).isoformat())
+
+    assert [record["id"] for record in records] == [str(old.id)]
+    assert next_since <= _ago(COMMIT_LAG.total_seconds())
+
+
+async def test_export_incremental(client: TestClient, repo: MemoryDBAdapter):
+    await create_answer(repo, _ago(120))
+    _, since = await _export(client, since=_ago(180).isoformat())
+
+    updated = await create_answer(repo, since + timedelta(seconds=1))
+    records, _ = await _export(client, since=since.isoformat())
+    assert records == []
+
+    # the write is out of the lag at the next poll
+    repo._answer_collection[updated.id].updated_at = _ago(60)
+    records, _ = await _export(client, since=(_ago(61)).isoformat())
+    assert [record["id"] for record in records] == [str(updated.id)]
+
+
+async def test_export_incremental_timestamp(client: TestClient, repo: MemoryDBAdapter):
+    await create_answer(repo, _ago(120))
+    answer = await create_answer(repo, _ago(30))
+
+    records, _ = await _export(client, since=str(_ago(60).timestamp()))
+
+    assert [record["id"] for record in records] == [str(answer.id)]
+
+
+async def test_export_tombstone(client: TestClient, repo: MemoryDBAdapter):
+    answer = await create_answer(repo, _ago(120))
+    await repo.delete_answer(proto.DeleteAnswer(_id=answer.id))
+    deleted = repo._answer_collection[answer.id]
+    deleted.deleted_at = deleted.updated_at = _ago(30)
+
+    records, _ = await _export(client, since=_ago(60).isoformat())
+    assert records == [
+        {"id": str(answer.id), "deleted_at": deleted.deleted_at.isoformat()}
+    ]
+
+    # a full export carries the deleted documents as they are
+    records, _ = await _export(client)
+    assert records[0]["id"] == str(answer.id)
+    assert records[0]["deleted_at"] is not None
+
+
+async def test_export_participant_tombstone(client: TestClient, repo: MemoryDBAdapter):
+    participant = await repo.create_participant(
+        proto.CreateCreatingParticipant(
+            allocation_id=domain.ObjectID(), user_id=domain.ObjectID()
+        )
+    )
+    await repo.delete_participant(proto.DeleteParticipant(_id=participant.id))
+    deleted = repo._participant_collection[participant.id]
+    deleted.deleted_at = deleted.updated_at = _ago(30)
+
+    records, _ = await _export(client, "participants", since=_ago(60).isoformat())
+
+    assert records == [
+        {"id": str(participant.id), "deleted_at": deleted.deleted_at.isoformat()}
+    ]
+
+
+@pytest.mark.parametrize("export_format", ["arrow", "parquet"])
+async def test_export_columnar_tombstone(
+    client: TestClient, repo: MemoryDBAdapter, export_format: str
+):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    live = await create_answer(repo, _ago(30))
+    answer = await create_answer(repo, _ago(120))
+    await repo.delete_answer(proto.DeleteAnswer(_id=answer.id))
+    deleted = repo._answer_collection[answer.id]
+    deleted.deleted_at = deleted.updated_at = _ago(30)
+
+    response = await client.get(
+        "/private/dataset/answers",
+        params={"since": _ago(60).isoformat(), "format": export_format},
+        headers=HEADERS,
+    )
+    assert response.status == 200
+
+    data = await response.read()
+    if export_format == "parquet":
+        table = pq.read_table(pa.BufferReader(data))
+    else:
+        table = pa.ipc.open_stream(data).read_all()
+
+    rows = {row["id"]: row for row in table.to_pylist()}
+    assert rows[live.id.binary]["text"] == "test"
+    assert rows[answer.id.binary]["deleted_at"] == deleted.deleted_at
+    assert rows[answer.id.binary]["text"] is None
+    assert rows[answer.id.binary]["kind"] is None
+    assert rows[answer.id.binary]["form_field_id"] is None
+
+
+async def test_export_ndjson(client: TestClient, repo: MemoryDBAdapter):
+    answer = await create_answer(repo, _ago(60))
+
+    response = await client.get(
+        "/private/dataset/answers",
+        headers=HEADERS | {"Accept": "application/x-ndjson"},
+    )
+
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    lines = (await response.read()).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [str(answer.id)]
+
+
+@pytest.mark.parametrize("since", ["inf", "nan", "1e300", "-1e300", "yesterday"])
+async def test_export_invalid_since_fail(client: TestClient, since: str):
+    response = await client.get(
+        "/private/dataset/answers", params={"since": since}, headers=HEADERS
+    )
+
+    assert response.status == 400
+
+
+async def test_export_secret_key_fail(client: TestClient):
+    response = await client.get("/private/dataset/answers")
+
+    assert response.status == 403
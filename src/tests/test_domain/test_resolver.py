@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Any, get_args
+
+import pydantic
+import pytest
+
+import src.domain.model as domain
+
+_timestamp = datetime.now().replace(microsecond=0)
+
+# payloads tagged as the last member of each union
+CASES = [
+    (
+        domain.Allocation,
+        domain.AllocationResolver,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "name": "test",
+            "state": "failed",
+            "creator_id": domain.ObjectID(),
+        },
+    ),
+    (
+        domain.Participant,
+        domain.ParticipantResolver,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "allocation_id": domain.ObjectID(),
+            "user_id": domain.ObjectID(),
+            "state": "allocated",
+            "room_id": domain.ObjectID(),
+        },
+    ),
+    (
+        domain.FormField,
+        domain.FormFieldResolver,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "kind": "choice",
+            "required": True,
+            "frozen": False,
+            "question": "test",
+            "creator_id": domain.ObjectID(),
+            "options": [{"text": "test"}],
+            "multiple": False,
+        },
+    ),
+    (
+        domain.Answer,
+        domain.AnswerResolver,
+        {
+            "_id": domain.ObjectID(),
+            "created_at": _timestamp,
+            "updated_at": _timestamp,
+            "form_field_id": domain.ObjectID(),
+            "respondent_id": domain.ObjectID(),
+            "kind": "choice",
+            "option_indexes": [0],
+        },
+    ),
+    (
+        domain.FormatEntity,
+        domain.FormatEntityResolver,
+        {"option": "code", "offset": 0, "length": 4, "language": "python"},
+    ),
+]
+
+param_string = "alias, resolver, payload"
+param_attrs = [pytest.param(*case, id=case[0].__name__) for case in CASES]
+
+
+def _plain_resolver(alias: Any) -> pydantic.TypeAdapter:
+    union, _ = get_args(alias.__value__)
+    return pydantic.TypeAdapter(
+        union,
+        config=pydantic.ConfigDict(extra="ignore", from_attributes=True),
+    )
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_tagged_resolver_matches_plain_union(
+    alias: Any, resolver: pydantic.TypeAdapter, payload: dict[str, Any]
+):
+    tagged = resolver.validate_python(payload)
+    plain = _plain_resolver(alias).validate_python(payload)
+
+    assert type(tagged) is type(plain)
+    assert tagged == plain
+
+
+@pytest.mark.parametrize(param_string, param_attrs)
+def test_tagged_resolver_invalid_tag_fail(
+    alias: Any, resolver: pydantic.TypeAdapter, payload: dict[str, Any]
+):
+    tag = next(key for key in ("state", "kind", "option") if key in payload)
+
+    with pytest.raises(pydantic.ValidationError) as error:
+        resolver.validate_python({**payload, tag: "unknown"})
+
+    assert [e["type"] for e in error.value.errors()] == ["union_tag_invalid"]
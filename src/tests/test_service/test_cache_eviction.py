@@ -0,0 +1,96 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.cache.memorydb.service import MemoryDBService
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service import identity
+from src.service.cache import CacheEviction, allocation_tag
+from src.service.room import RoomService
+from src.service.user import UserService
+
+
+class TaggedMemoryDBService(MemoryDBService[domain.Participant]):
+    def __init__(self):
+        super().__init__()
+        self.tags: list[str] = []
+
+    async def delete_tags(self, tags: list[str]) -> list[domain.ObjectID]:
+        self.tags.extend(tags)
+        return []
+
+
+class FailingMemoryDBService(MemoryDBService[domain.Room]):
+    async def delete(self, key: domain.ObjectID) -> None:
+        raise RuntimeError("cache is unavailable")
+
+
+@pytest.fixture(autouse=True)
+def write_hooks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(identity, "WRITE_HOOKS", [])
+
+
+async def _create_room(repo: MemoryDBAdapter) -> domain.Room:
+    user = await UserService(repo).create(
+        proto.CreateUser(
+            telegram_id=1,
+            profile=domain.Profile(
+                username="test",
+                first_name="test",
+                last_name="test",
+                gender=domain.Gender.MALE,
+                language_code=domain.LanguageCode.EN,
+                birthdate=datetime.today().date(),
+            ),
+            views=0,
+        )
+    )
+    return await RoomService(repo, repo).create(
+        proto.CreateRoom(
+            name="test",
+            capacity=2,
+            occupied=0,
+            creator_id=user.id,
+            gender_restriction=None,
+        )
+    )
+
+
+async def test_cache_eviction_service_write():
+    repo = MemoryDBAdapter()
+    room = await _create_room(repo)
+    cache = MemoryDBService[domain.Room]()
+    await cache.put(room.id, room)
+    identity.on_write(CacheEviction({identity.EntityKind.ROOM: cache}))
+
+    # outside of a request, as the http routes and scripts write
+    await RoomService(repo, repo).update(proto.UpdateRoom(_id=room.id, name="new"))
+
+    assert await cache.get(room.id) is None
+
+
+async def test_cache_eviction_allocation_participant_tags():
+    participants = TaggedMemoryDBService()
+    eviction = CacheEviction({identity.EntityKind.PARTICIPANT: participants})
+    allocation = SimpleNamespace(id=domain.ObjectID())
+
+    await eviction(identity.EntityKind.ALLOCATION, allocation)
+
+    assert participants.tags == [allocation_tag(allocation.id)]
+
+
+async def test_cache_eviction_failure_keep_write():
+    repo = MemoryDBAdapter()
+    room = await _create_room(repo)
+    identity.on_write(
+        CacheEviction({identity.EntityKind.ROOM: FailingMemoryDBService()})
+    )
+
+    updated = await RoomService(repo, repo).update(
+        proto.UpdateRoom(_id=room.id, name="new")
+    )
+
+    assert updated.name == "new"
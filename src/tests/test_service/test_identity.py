@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime
+
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service import identity
+from src.service.room import RoomService
+from src.service.user import UserService
+
+
+class CountingMemoryDBAdapter(MemoryDBAdapter):
+    def __init__(self):
+        super().__init__()
+        self.reads: list[list[domain.ObjectID]] = []
+
+    async def read_room(self, room: proto.ReadRoom) -> domain.Room:
+        self.reads.append([room.id])
+        return await super().read_room(room)
+
+    async def read_many_rooms(self, rooms: list[proto.ReadRoom]):
+        self.reads.append([room.id for room in rooms])
+        return await super().read_many_rooms(rooms)
+
+
+async def _create_room(
+    service: RoomService, repo: MemoryDBAdapter, telegram_id: int = 1
+) -> domain.Room:
+    user = await UserService(repo).create(
+        proto.CreateUser(
+            telegram_id=telegram_id,
+            profile=domain.Profile(
+                username="test",
+                first_name="test",
+                last_name="test",
+                gender=domain.Gender.MALE,
+                language_code=domain.LanguageCode.EN,
+                birthdate=datetime.today().date(),
+            ),
+            views=0,
+        )
+    )
+    return await service.create(
+        proto.CreateRoom(
+            name="test",
+            capacity=2,
+            occupied=0,
+            creator_id=user.id,
+            gender_restriction=None,
+        )
+    )
+
+
+async def _in_request(coroutine):
+    # every request runs in its own task, as aiohttp does
+    return await asyncio.create_task(coroutine)
+
+
+async def test_identity_map_read_once():
+    repo = CountingMemoryDBAdapter()
+    service = RoomService(repo, repo)
+    room = await _create_room(service, repo)
+
+    async def request():
+        identity.begin()
+        first = await service.read(proto.ReadRoom(_id=room.id))
+        second = await service.read(proto.ReadRoom(_id=room.id))
+        many = await service.read_many([proto.ReadRoom(_id=room.id)])
+        return first, second, many
+
+    first, second, many = await _in_request(request())
+
+    assert first is second
+    assert many == [first]
+    assert repo.reads == [[room.id]]
+
+
+async def test_identity_map_read_many_missing_only():
+    repo = CountingMemoryDBAdapter()
+    service = RoomService(repo, repo)
+    room = await _create_room(service, repo)
+    other = await _create_room(service, repo, 2)
+
+    async def request():
+        identity.begin()
+        await service.read(proto.ReadRoom(_id=room.id))
+        return await service.read_many(
+            [proto.ReadRoom(_id=room.id), proto.ReadRoom(_id=other.id)]
+        )
+
+    rooms = await _in_request(request())
+
+    assert [item.id for item in rooms] == [room.id, other.id]
+    assert repo.reads == [[room.id], [other.id]]
+
+
+async def test_identity_map_write_replace():
+    repo = CountingMemoryDBAdapter()
+    service = RoomService(repo, repo)
+    room = await _create_room(service, repo)
+    written: list[tuple[identity.EntityKind, domain.ObjectID]] = []
+
+    async def request():
+        identity.begin().subscribe(
+            lambda kind, entity: written.append((kind, entity.id))
+        )
+        await service.read(proto.ReadRoom(_id=room.id))
+        updated = await service.update(proto.UpdateRoom(_id=room.id, name="updated"))
+        return updated, await service.read(proto.ReadRoom(_id=room.id))
+
+    updated, current = await _in_request(request())
+
+    assert current is updated
+    assert current.name == "updated"
+    assert written == [(identity.EntityKind.ROOM, room.id)]
+    assert repo.reads == [[room.id]]
+
+
+async def test_identity_map_request_scoped():
+    repo = CountingMemoryDBAdapter()
+    service = RoomService(repo, repo)
+    room = await _create_room(service, repo)
+
+    async def request():
+        identity.begin()
+        return await service.read(proto.ReadRoom(_id=room.id))
+
+    await _in_request(request())
+    await _in_request(request())
+    await service.read(proto.ReadRoom(_id=room.id))
+
+    assert repo.reads == [[room.id], [room.id], [room.id]]
@@ -0,0 +1,166 @@
+import asyncio
+import time
+from datetime import datetime
+
+import src.domain.model as domain
+import src.protocol.internal.database as proto
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service import common
+
+LOOKUP_DELAY = 0.05
+
+
+class SlowMemoryDBAdapter(MemoryDBAdapter):
+    def __init__(self):
+        super().__init__()
+        self.lookups: list[str] = []
+
+    async def exists_many_users(self, ids: list[domain.ObjectID]):
+        self.lookups.append("users")
+        await asyncio.sleep(LOOKUP_DELAY)
+        return await super().exists_many_users(ids)
+
+    async def exists_many_rooms(self, ids: list[domain.ObjectID]):
+        self.lookups.append("rooms")
+        await asyncio.sleep(LOOKUP_DELAY)
+        return await super().exists_many_rooms(ids)
+
+    async def exists_many_allocations(self, ids: list[domain.ObjectID]):
+        self.lookups.append("allocations")
+        await asyncio.sleep(LOOKUP_DELAY)
+        raise RuntimeError("allocations are unavailable")
+
+
+async def _create_user(repo: MemoryDBAdapter, telegram_id: int) -> domain.User:
+    return await repo.create_user(
+        proto.CreateUser(
+            telegram_id=telegram_id,
+            profile=domain.Profile(
+                username="test",
+                first_name="test",
+                last_name="test",
+                gender=domain.Gender.MALE,
+                language_code=domain.LanguageCode.EN,
+                birthdate=datetime.today().date(),
+            ),
+            views=0,
+        )
+    )
+
+
+async def _create_room(repo: MemoryDBAdapter, creator_id: domain.ObjectID):
+    return await repo.create_room(
+        proto.CreateRoom(
+            name="test",
+            capacity=2,
+            occupied=0,
+            creator_id=creator_id,
+            gender_restriction=None,
+        )
+    )
+
+
+async def test_check_references_ok():
+    repo = SlowMemoryDBAdapter()
+    creator = await _create_user(repo, 1)
+    editor = await _create_user(repo, 2)
+    room = await _create_room(repo, creator.id)
+    checker = common.ReferenceChecker(user_repo=repo, room_repo=repo)
+
+    report = await checker.check(
+        common.Reference("creator", common.ReferenceKind.USER, {creator.id}),
+        common.Reference("editors", common.ReferenceKind.USER, {creator.id, editor.id}),
+        common.Reference("room", common.ReferenceKind.ROOM, {room.id}),
+    )
+
+    assert report.valid
+    assert report.exist("creator")
+    assert report.exist("editors")
+    assert report.exist("room")
+    assert sorted(repo.lookups) == ["rooms", "users"]
+
+
+async def test_check_references_missing_and_deleted():
+    repo = SlowMemoryDBAdapter()
+    creator = await _create_user(repo, 1)
+    editor = await _create_user(repo, 2)
+    await repo.delete_user(proto.DeleteUser(_id=editor.id))
+    unknown = domain.ObjectID()
+    checker = common.ReferenceChecker(user_repo=repo)
+
+    report = await checker.check(
+        common.Reference("creator", common.ReferenceKind.USER, {creator.id}),
+        common.Reference("editors", common.ReferenceKind.USER, {editor.id, unknown}),
+        common.Reference(
+            "subscribers", common.ReferenceKind.USER, {editor.id}, allow_deleted=True
+        ),
+    )
+
+    assert not report.valid
+    assert report.exist("creator")
+    assert report.exist("subscribers")
+    assert report.missing == {"editors": {unknown}}
+    assert report.deleted == {"editors": {editor.id}}
+    assert repo.lookups == ["users"]
+
+
+async def test_check_references_failed_lookup_missing():
+    repo = SlowMemoryDBAdapter()
+    creator = await _create_user(repo, 1)
+    allocation_id = domain.ObjectID()
+    checker = common.ReferenceChecker(user_repo=repo, allocation_repo=repo)
+
+    report = await checker.check(
+        common.Reference("creator", common.ReferenceKind.USER, {creator.id}),
+        common.Reference(
+            "allocation", common.ReferenceKind.ALLOCATION, {allocation_id}
+        ),
+    )
+
+    assert report.exist("creator")
+    assert report.missing == {"allocation": {allocation_id}}
+
+
+async def test_check_references_without_repository_missing():
+    checker = common.ReferenceChecker()
+    room_id = domain.ObjectID()
+
+    report = await checker.check(
+        common.Reference("room", common.ReferenceKind.ROOM, {room_id}),
+    )
+
+    assert report.missing == {"room": {room_id}}
+
+
+async def test_check_references_concurrent():
+    repo = SlowMemoryDBAdapter()
+    creator = await _create_user(repo, 1)
+    room = await _create_room(repo, creator.id)
+    checker = common.ReferenceChecker(
+        user_repo=repo, allocation_repo=repo, room_repo=repo
+    )
+
+    start = time.perf_counter()
+    await checker.check(
+        common.Reference("creator", common.ReferenceKind.USER, {creator.id}),
+        common.Reference("room", common.ReferenceKind.ROOM, {room.id}),
+        common.Reference(
+            "allocation", common.ReferenceKind.ALLOCATION, {domain.ObjectID()}
+        ),
+    )
+    elapsed = time.perf_counter() - start
+
+    assert len(repo.lookups) == 3
+    assert elapsed < 2 * LOOKUP_DELAY
+
+
+async def test_check_references_empty_skip():
+    repo = SlowMemoryDBAdapter()
+    checker = common.ReferenceChecker(user_repo=repo)
+
+    report = await checker.check(
+        common.Reference("editors", common.ReferenceKind.USER, set()),
+    )
+
+    assert report.valid
+    assert repo.lookups == []
@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import hmac
+import secrets
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+import pytest
+
+import src.domain.exception.auth as auth_exception
+import src.domain.exception.service as service_exception
+import src.domain.model as domain
+import src.protocol.internal.cache as cache_proto
+import src.protocol.internal.database as proto
+from src.adapter.external.auth.telegram import TelegramOauthAdapter
+from src.adapter.internal.cache.layered.lookup import LayeredLookupService
+from src.adapter.internal.cache.memorydb.lookup import MemoryLookupService
+from src.adapter.internal.database.memorydb.service import MemoryDBAdapter
+from src.service.user import UserService
+
+SECRET_TOKEN = "secret"
+JWT_SECRET = secrets.token_hex(32)
+
+
+class CountingMemoryDBAdapter(MemoryDBAdapter):
+    def __init__(self):
+        super().__init__()
+        self.finds = 0
+
+    async def find_users(self, user: proto.FindUsers) -> list[domain.User]:
+        self.finds += 1
+        return await super().find_users(user)
+
+
+class MemoryLookupInvalidation(cache_proto.InvalidationProtocol[int]):
+    def __init__(self, subscribers: list["MemoryLookupInvalidation"]):
+        self._subscribers = subscribers
+        self._queue: asyncio.Queue[list[int]] = asyncio.Queue()
+        subscribers.append(self)
+
+    async def publish(self, keys: list[int]) -> None:
+        for subscriber in self._subscribers:
+            if subscriber is not self:
+                subscriber._queue.put_nowait(keys)
+
+    async def listen(self, callback: Callable[[list[int]], Awaitable[None]]) -> None:
+        while True:
+            await callback(await self._queue.get())
+
+
+def _create_user(telegram_id: int) -> proto.CreateUser:
+    return proto.CreateUser(
+        telegram_id=telegram_id,
+        profile=domain.Profile(
+            username="test",
+            first_name="test",
+            last_name="test",
+            gender=domain.Gender.MALE,
+            language_code=domain.LanguageCode.EN,
+            birthdate=datetime.today().date(),
+        ),
+        views=0,
+    )
+
+
+def _signed(telegram_id: int) -> dict[str, str]:
+    data = {
+        "id": str(telegram_id),
+        "auth_date": str(int(datetime.now().timestamp())),
+        "first_name": "test",
+        "last_name": "test",
+        "username": "test",
+        "photo_url": "https://t.me/i/userpic/test.jpg",
+    }
+    check = "\n".join(f"{k}={v}" for k, v in sorted(data.items()))
+    key = hashlib.sha256(SECRET_TOKEN.encode()).digest()
+    data["hash"] = hmac.new(key, check.encode(), hashlib.sha256).hexdigest()
+    return data
+
+
+async def test_find_id_by_telegram_id_cached():
+    repo = CountingMemoryDBAdapter()
+    service = UserService(repo, MemoryLookupService(10, ttl=60, negative_ttl=60))
+    user = await service.create(_create_user(1))
+    finds = repo.finds
+
+    assert await service.find_id_by_telegram_id(1) == user.id
+    assert await service.find_id_by_telegram_id(1) == user.id
+    assert repo.finds == finds
+
+
+async def test_find_id_by_telegram_id_negative_cached():
+    repo = CountingMemoryDBAdapter()
+    service = UserService(repo, MemoryLookupService(10, ttl=60, negative_ttl=60))
+
+    for _ in range(3):
+        with pytest.raises(service_exception.ReadUserException):
+            await service.find_id_by_telegram_id(1)
+    assert repo.finds == 1
+
+    # registration replaces the negative entry
+    user = await service.create(_create_user(1))
+    assert await service.find_id_by_telegram_id(1) == user.id
+
+
+async def test_find_id_by_telegram_id_invalidated_by_other_worker():
+    repo = CountingMemoryDBAdapter()
+    remote = MemoryLookupService(10, ttl=60, negative_ttl=60)
+    subscribers: list[MemoryLookupInvalidation] = []
+    first, second = (
+        UserService(
+            repo,
+            LayeredLookupService(
+                MemoryLookupService(10, ttl=60, negative_ttl=60),
+                remote,
+                MemoryLookupInvalidation(subscribers),
+            ),
+        )
+        for _ in range(2)
+    )
+
+    with pytest.raises(service_exception.ReadUserException):
+        await second.find_id_by_telegram_id(1)
+
+    user = await first.create(_create_user(1))
+    await asyncio.sleep(0)
+    assert await second.find_id_by_telegram_id(1) == user.id
+
+    # the deleted user is read again instead of the cached id
+    await first.delete(proto.DeleteUser(_id=user.id))
+    await asyncio.sleep(0)
+    finds = repo.finds
+    await second.find_id_by_telegram_id(1)
+    assert repo.finds == finds + 1
+
+
+async def test_find_id_by_telegram_id_without_cache():
+    repo = CountingMemoryDBAdapter()
+    service = UserService(repo)
+    user = await service.create(_create_user(1))
+
+    assert await service.find_id_by_telegram_id(1) == user.id
+    assert await service.find_id_by_telegram_id(1) == user.id
+    assert repo.finds == 3
+
+
+async def test_login_fast_path():
+    repo = CountingMemoryDBAdapter()
+    service = UserService(repo, MemoryLookupService(10, ttl=60, negative_ttl=60))
+    user = await service.create(_create_user(1))
+    oauth = TelegramOauthAdapter(SECRET_TOKEN, JWT_SECRET, service)
+
+    container = await oauth.login(_signed(1))
+
+    dto = container.to_dto(JWT_SECRET)
+    assert dto.id == user.id
+    assert dto.telegram_id == 1
+
+
+async def test_login_invalid_hash_fail():
+    service = UserService(MemoryDBAdapter())
+    oauth = TelegramOauthAdapter(SECRET_TOKEN, JWT_SECRET, service)
+    data = _signed(1) | {"first_name": "other"}
+
+    with pytest.raises(auth_exception.InvalidCredentialsException):
+        await oauth.login(data)